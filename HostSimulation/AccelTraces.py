@@ -0,0 +1,325 @@
+# Host Simulation - MPU6050 traces
+#   synthetic (or recorded) accelerometer & gyro samples of the cube resting on
+#   its faces, being flipped & being shaken, in raw MPU6050 counts
+#
+# Recorded traces come from MPU6050_Testing/main_mpu6050_Sparkfun_record.py
+# (same csv columns, minus the ground truth). Synthetic traces stand in until
+# there are enough recordings; they model the default sensor settings:
+#   accel +-2 g (16384 counts/g), gyro +-500 deg/s (65.5 counts per deg/s)
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import math, random
+
+SAMPLE_RATE = 40 # Hz, the transmitter's CYCLE_40_HZ
+COUNTS_PER_G = 16384
+COUNTS_PER_DPS = 65.5
+CSV_HEADER = "t_ms,ax,ay,az,gx,gy,gz,face"
+
+# Accelerometer reading (unit vector) while resting on each face, matching
+# getPlatonicCubeFaceIdx() in the transmitter
+FACE_VECTORS = {
+    1: (1.0, 0.0, 0.0),  # theta 0, phi 90
+    2: (-1.0, 0.0, 0.0), # theta 180, phi 90
+    3: (0.0, -1.0, 0.0), # theta -90, phi 90
+    4: (0.0, 1.0, 0.0),  # theta 90, phi 90
+    5: (0.0, 0.0, 1.0),  # phi 0
+    6: (0.0, 0.0, -1.0), # phi 180
+}
+
+
+### Vector helpers
+def cross(a, b):
+    return (a[1]*b[2] - a[2]*b[1], a[2]*b[0] - a[0]*b[2], a[0]*b[1] - a[1]*b[0])
+
+def dot(a, b):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+def scale(a, k):
+    return (a[0]*k, a[1]*k, a[2]*k)
+
+def add(a, b):
+    return (a[0]+b[0], a[1]+b[1], a[2]+b[2])
+
+def normalize(a):
+    n = math.sqrt(dot(a, a))
+    return scale(a, 1/n) if n else a
+
+def rotate(v, axis, angle):
+    """
+    Rodrigues rotation of `v` about the unit vector `axis`
+    """
+    c, s = math.cos(angle), math.sin(angle)
+    return add(add(scale(v, c), scale(cross(axis, v), s)), scale(axis, dot(axis, v) * (1 - c)))
+
+def randomUnit(rng):
+    return normalize((rng.gauss(0, 1), rng.gauss(0, 1), rng.gauss(0, 1)))
+
+
+class AccelTrace:
+    """
+    Samples are (ax, ay, az, gx, gy, gz) raw counts at `rate` Hz. `truth` holds
+    the face the cube rests on per sample (0 while it's moving, None for a
+    recording) & `events` (sampleIdx, name, info) marks flips, shakes, etc.
+    """
+    def __init__(self, rate=SAMPLE_RATE):
+        self.rate = rate
+        self.samples = []
+        self.truth = []
+        self.events = []
+
+    def __len__(self):
+        return len(self.samples)
+
+    def duration(self):
+        return len(self.samples) / self.rate
+
+    def flipEnds(self):
+        """
+        Returns (sampleIdx, face) for every flip, at the sample it settled
+        """
+        return [(idx, info[0]) for idx, name, info in self.events if name == "settled"]
+
+    def saveCsv(self, path):
+        with open(path, "w") as f:
+            f.write(CSV_HEADER + "\n")
+            for i, sample in enumerate(self.samples):
+                face = self.truth[i] if self.truth[i] is not None else -1
+                f.write("{},{},{},{},{},{},{},{}\n".format(i * 1000 // self.rate, *sample, face))
+
+    @classmethod
+    def loadCsv(cls, path, rate=SAMPLE_RATE):
+        trace = cls(rate)
+        with open(path) as f:
+            for line in f:
+                fields = line.strip().split(",")
+                if not fields[0].isdigit():
+                    continue # header or serial noise
+                trace.samples.append(tuple(int(v) for v in fields[1:7]))
+                face = int(fields[7]) if len(fields) > 7 else -1
+                trace.truth.append(face if face >= 0 else None)
+        return trace
+
+
+class TraceGenerator:
+    """
+    Builds synthetic traces sample by sample. `accelBias` (g) & `accelGain`
+    (1 = perfect) are per axis, like a real uncalibrated sensor, &
+    `accelMisalign` (row-major 3x3) mixes the axes before the gains
+    """
+    def __init__(self, seed=1, rate=SAMPLE_RATE, accelNoise=0.005, gyroNoise=0.05,
+                 accelBias=(0.0, 0.0, 0.0), accelGain=(1.0, 1.0, 1.0), gyroBias=(0.0, 0.0, 0.0),
+                 accelMisalign=(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)):
+        self.rng = random.Random(seed)
+        self.trace = AccelTrace(rate)
+        self.accelNoise = accelNoise # g rms
+        self.gyroNoise = gyroNoise # deg/s rms
+        self.accelBias = accelBias
+        self.accelGain = accelGain
+        self.gyroBias = gyroBias
+        self.accelMisalign = accelMisalign
+        self.face = 5
+        self.gravity = FACE_VECTORS[self.face] # reading direction in the sensor frame
+
+    def _emit(self, gravity, linear=(0.0, 0.0, 0.0), omega=(0.0, 0.0, 0.0), truth=0):
+        """
+        One sample: `gravity` unit vector, extra `linear` acceleration (g) &
+        angular rate `omega` (deg/s), all in the sensor frame
+        """
+        rng = self.rng
+        raw = []
+        a = add(gravity, linear)
+        m = self.accelMisalign
+        for axis in range(3):
+            g = (m[axis*3]*a[0] + m[axis*3 + 1]*a[1] + m[axis*3 + 2]*a[2]) * self.accelGain[axis] + self.accelBias[axis]
+            g += rng.gauss(0, self.accelNoise)
+            raw.append(max(-32768, min(32767, int(round(g * COUNTS_PER_G)))))
+        for axis in range(3):
+            w = omega[axis] + self.gyroBias[axis] + rng.gauss(0, self.gyroNoise)
+            raw.append(max(-32768, min(32767, int(round(w * COUNTS_PER_DPS)))))
+        self.trace.samples.append(tuple(raw))
+        self.trace.truth.append(truth)
+
+    def _mark(self, name, info=None):
+        self.trace.events.append((len(self.trace.samples), name, info))
+
+    def rest(self, seconds, maxTilt=4.0):
+        """
+        Lying still on the current face, on a surface tilted up to `maxTilt` deg
+        """
+        tiltAxis = normalize(cross(self.gravity, randomUnit(self.rng)))
+        self.gravity = rotate(FACE_VECTORS[self.face], tiltAxis, math.radians(self.rng.uniform(0, maxTilt)))
+        for _ in range(int(seconds * self.trace.rate)):
+            self._emit(self.gravity, truth=self.face)
+
+    def flip(self, face, seconds=None):
+        """
+        Rolls the cube onto `face` (via a neighbour if it's the opposite one),
+        with a smooth speed profile & some hand jitter
+        """
+        rng = self.rng
+        rate = self.trace.rate
+        seconds = seconds if seconds is not None else rng.uniform(0.3, 0.7)
+        start = FACE_VECTORS[self.face]
+        target = FACE_VECTORS[face]
+        if dot(start, target) < -0.5:
+            via = rng.choice([f for f, v in FACE_VECTORS.items() if abs(dot(v, start)) < 0.5])
+            legs = ((start, FACE_VECTORS[via]), (FACE_VECTORS[via], target))
+        else:
+            legs = ((start, target),)
+        self._mark("flip", (self.face, face))
+        # The path: one rotation per leg, starting from where it actually is (tilted)
+        path = []
+        gravity = self.gravity
+        for legStart, legEnd in legs:
+            axis = cross(gravity, legEnd)
+            axis = normalize(axis if dot(axis, axis) > 1e-9 else cross(legStart, legEnd))
+            angle = math.acos(max(-1.0, min(1.0, dot(gravity, legEnd))))
+            path.append((gravity, axis, angle))
+            gravity = legEnd
+        total = sum(angle for _, _, angle in path)
+
+        # One smooth speed profile over the whole path (no stop at a neighbour)
+        numSamples = max(2, int(seconds * rate))
+        for i in range(1, numSamples + 1):
+            s = i / numSamples
+            done = total * (3*s*s - 2*s*s*s) # smoothstep
+            speed = total * (6*s - 6*s*s) * rate / numSamples # rad/s
+            for base, axis, angle in path:
+                if done <= angle or base is path[-1][0]:
+                    break
+                done -= angle
+            gravity = rotate(base, axis, min(done, angle))
+            omega = scale(axis, -math.degrees(speed)) # sensor rotates the other way
+            linear = scale(randomUnit(rng), rng.uniform(0, 0.3) * (6*s - 6*s*s) / 1.5)
+            self._emit(gravity, linear, omega)
+        self.face = face
+        self.gravity = target
+        self._mark("settled", (face,))
+
+    def shake(self, seconds=0.8, amplitude=0.8, frequency=6.0, wobble=10.0):
+        """
+        Shaken in the hand while (roughly) staying on the current face: linear
+        acceleration of `amplitude` g plus a +-`wobble` deg rocking motion
+        """
+        rng = self.rng
+        rate = self.trace.rate
+        direction = randomUnit(rng)
+        rockAxis = normalize(cross(self.gravity, randomUnit(rng)))
+        phase = rng.uniform(0, 2 * math.pi)
+        base = self.gravity
+        self._mark("shake", (self.face,))
+        for i in range(int(seconds * rate)):
+            t = i / rate
+            w = 2 * math.pi * frequency
+            rock = math.radians(wobble) * math.sin(w * t + phase)
+            rockRate = math.degrees(math.radians(wobble) * w * math.cos(w * t + phase))
+            gravity = rotate(base, rockAxis, rock)
+            linear = scale(direction, amplitude * math.sin(w * t))
+            self._emit(gravity, linear, scale(rockAxis, -rockRate), truth=self.face)
+        self.gravity = base
+
+    def wander(self, seconds=1.5, speed=(30.0, 150.0)):
+        """
+        Picked up & turned around in the hand without settling on any face
+        (follow with a flip() to put it down again)
+        """
+        rng = self.rng
+        rate = self.trace.rate
+        axis = randomUnit(rng)
+        dps = rng.uniform(*speed)
+        gravity = self.gravity
+        self._mark("wander", (self.face,))
+        for _ in range(int(seconds * rate)):
+            axis = normalize(add(axis, scale(randomUnit(rng), 0.3))) # slowly changing direction
+            dps = max(speed[0], min(speed[1], dps + rng.gauss(0, 10)))
+            gravity = normalize(rotate(gravity, axis, math.radians(dps) / rate))
+            linear = scale(randomUnit(rng), rng.uniform(0, 0.2))
+            self._emit(gravity, linear, scale(axis, -dps))
+        self.gravity = gravity
+
+    def tap(self, strength=1.5):
+        """
+        A knock on the table: a 1-2 sample spike
+        """
+        self._mark("tap", (self.face,))
+        direction = normalize(add(self.gravity, scale(randomUnit(self.rng), 0.3)))
+        for k in (1.0, 0.4):
+            self._emit(self.gravity, scale(direction, strength * k), truth=self.face)
+
+    def doubleFlip(self, face, pause=(0.2, 0.5)):
+        """
+        Flipped onto `face` & straight back again
+        """
+        start = self.face
+        self._mark("doubleflip", (start, face))
+        self.flip(face, self.rng.uniform(0.3, 0.5))
+        self.rest(self.rng.uniform(*pause))
+        self.flip(start, self.rng.uniform(0.3, 0.5))
+
+
+def makeFlipTrace(seed=1, numFlips=40, numShakes=10, rest=(1.0, 4.0), shakeAmplitude=(0.3, 1.2),
+                  shakeWobble=10.0, numWanders=0, wanderSpeed=(30.0, 150.0), maxTilt=4.0, **generatorKwargs):
+    """
+    Rests (on surfaces tilted up to `maxTilt` deg), flips to random faces &
+    the odd shake (`shakeAmplitude` g range, rocking +-`shakeWobble` deg).
+    `numWanders` of the flips start with the cube being turned around in the
+    hand first. Returns the AccelTrace
+    """
+    gen = TraceGenerator(seed=seed, **generatorKwargs)
+    rng = gen.rng
+    shakeAt = set(rng.sample(range(numFlips), min(numShakes, numFlips)))
+    wanderAt = set(rng.sample(range(numFlips), min(numWanders, numFlips))) if numWanders else set()
+    gen.rest(rng.uniform(*rest), maxTilt)
+    for i in range(numFlips):
+        if i in wanderAt:
+            gen.wander(rng.uniform(1.0, 3.0), wanderSpeed)
+        gen.flip(rng.choice([f for f in FACE_VECTORS if f != gen.face]))
+        gen.rest(rng.uniform(*rest), maxTilt)
+        if i in shakeAt:
+            gen.shake(seconds=rng.uniform(0.4, 1.2), amplitude=rng.uniform(*shakeAmplitude), wobble=shakeWobble)
+            gen.rest(rng.uniform(*rest), maxTilt)
+    return gen.trace
+
+
+def makeGestureTrace(seed=1, numGestures=40, rest=(1.5, 4.0), maxTilt=4.0, **generatorKwargs):
+    """
+    Rests & flips like makeFlipTrace with a gesture after most of them: a
+    shake, a tap or a double flip (events "shake", "tap" & "doubleflip")
+    """
+    gen = TraceGenerator(seed=seed, **generatorKwargs)
+    rng = gen.rng
+    gen.rest(rng.uniform(*rest), maxTilt)
+    for _ in range(numGestures):
+        gesture = rng.choice(("flip", "shake", "tap", "doubleflip"))
+        if gesture == "flip":
+            gen.flip(rng.choice([f for f in FACE_VECTORS if f != gen.face]))
+        elif gesture == "shake":
+            gen.shake(seconds=rng.uniform(0.6, 1.2), amplitude=rng.uniform(0.5, 1.2), frequency=rng.uniform(3.0, 7.0))
+        elif gesture == "tap":
+            gen.tap(rng.uniform(1.0, 2.0))
+        else:
+            gen.doubleFlip(rng.choice([f for f in FACE_VECTORS if f != gen.face]))
+        gen.rest(rng.uniform(*rest), maxTilt)
+    return gen.trace
+
+
+def makeSensorError(seed, bias=0.04, gain=0.03, gyroBias=2.0, misalign=0.0):
+    """
+    Random per-device accelerometer bias (g) & gain errors plus gyro bias
+    (deg/s), as generator kwargs. `misalign` (deg) tilts each accelerometer
+    axis by up to that much (cross-axis sensitivity)
+    """
+    rng = random.Random(seed)
+    error = {
+        "accelBias": tuple(rng.uniform(-bias, bias) for _ in range(3)),
+        "accelGain": tuple(1 + rng.uniform(-gain, gain) for _ in range(3)),
+        "gyroBias": tuple(rng.uniform(-gyroBias, gyroBias) for _ in range(3)),
+    }
+    if misalign:
+        k = math.sin(math.radians(misalign))
+        error["accelMisalign"] = tuple(1.0 if row == col else rng.uniform(-k, k)
+                                       for row in range(3) for col in range(3))
+    return error
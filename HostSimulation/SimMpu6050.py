@@ -0,0 +1,106 @@
+# Host Simulation - MPU6050 on a fake I2C bus
+#   a register file the adafruit_mpu6050 driver can configure, with the data
+#   registers playing back an AccelTrace; counts the bus transactions & the
+#   time they'd take on the wire
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+MPU6050_ADDRESS = 0x68
+WHO_AM_I = 0x75
+PWR_MGMT_1 = 0x6B
+ACCEL_XOUT_H = 0x3B
+BITS_PER_BYTE = 9 # 8 data bits + ack
+START_STOP_BITS = 2
+
+
+class FakeMpuBus:
+    """
+    Implements the busio.I2C calls I2CDevice uses. `frequency` is the bus
+    clock the wire time is estimated for (400 kHz busio, ~100 kHz bitbangio)
+    """
+    def __init__(self, trace=None, address=MPU6050_ADDRESS, frequency=400000):
+        self.address = address
+        self.frequency = frequency
+        self.regs = bytearray(128)
+        self.regs[WHO_AM_I] = MPU6050_ADDRESS
+        self.regs[PWR_MGMT_1] = 0x40 # asleep after power up
+        self.pointer = 0
+        self.trace = trace
+        self.sampleIdx = 0
+        self.resetStats()
+        if trace is not None:
+            self.setSample(trace.samples[0])
+
+    def resetStats(self):
+        self.numTransactions = 0
+        self.wireTime_us = 0.0
+
+    def _wire(self, numBytes):
+        """
+        Accounts for one transfer of `numBytes` plus the address byte
+        """
+        self.wireTime_us += ((numBytes + 1) * BITS_PER_BYTE + START_STOP_BITS) * 1e6 / self.frequency
+
+    def setSample(self, sample, temperature=0):
+        """
+        Loads (ax, ay, az, gx, gy, gz) raw counts into the data registers
+        """
+        ax, ay, az, gx, gy, gz = sample
+        for i, value in enumerate((ax, ay, az, temperature, gx, gy, gz)):
+            value &= 0xFFFF
+            self.regs[ACCEL_XOUT_H + 2*i] = value >> 8
+            self.regs[ACCEL_XOUT_H + 2*i + 1] = value & 0xFF
+
+    def nextSample(self):
+        """
+        Moves the trace playback on by one sample (wraps around)
+        """
+        self.sampleIdx = (self.sampleIdx + 1) % len(self.trace.samples)
+        self.setSample(self.trace.samples[self.sampleIdx])
+
+    ### busio.I2C
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        if address != self.address:
+            raise OSError(19) # no ACK, like a missing device
+        data = bytes(buffer[start:end])
+        self.numTransactions += 1
+        self._wire(len(data))
+        if not data:
+            return # probe
+        self.pointer = data[0]
+        for value in data[1:]:
+            if self.pointer == PWR_MGMT_1:
+                value &= 0x7F # reset completes immediately
+            self.regs[self.pointer] = value
+            self.pointer = (self.pointer + 1) & 0x7F
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        if address != self.address:
+            raise OSError(19)
+        end = len(buffer) if end is None else end
+        self.numTransactions += 1
+        self._wire(end - start)
+        for i in range(start, end):
+            buffer[i] = self.regs[self.pointer]
+            self.pointer = (self.pointer + 1) & 0x7F
+
+    def writeto_then_readfrom(self, address, buffer_out, buffer_in, *, out_start=0, out_end=None,
+                              in_start=0, in_end=None):
+        if address != self.address:
+            raise OSError(19)
+        self.pointer = buffer_out[out_start]
+        in_end = len(buffer_in) if in_end is None else in_end
+        self.numTransactions += 1
+        self._wire(1) # register address
+        self._wire(in_end - in_start) # repeated start, then the data
+        for i in range(in_start, in_end):
+            buffer_in[i] = self.regs[self.pointer]
+            self.pointer = (self.pointer + 1) & 0x7F
@@ -0,0 +1,516 @@
+# Host Simulation - nRF24L01 link stand-in
+#   runs on a normal (linux) python install, no hardware required
+#
+# Models enough of `circuitpython_nrf24l01.rf24.RF24` for the remote control
+# and testing scripts to talk to each other in virtual time: pipes/addresses,
+# the 3 level TX/RX FIFOs, auto-ack with auto-retransmit (ard/arc), ACK
+# payloads, independent or bursty packet loss & extra per-packet latency.
+# See SimScripts.py to run the device scripts themselves against it.
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import random
+
+### Timing constants (nRF24L01+ datasheet)
+TURNAROUND_US = 130 # TX <-> RX settling time
+PREAMBLE_BYTES = 1
+CRC_BYTES = 2
+PCF_BITS = 9 # packet control field w/ dynamic payloads
+
+
+class VirtualClock:
+    """
+    Stand-in for the `time` module, only advances when told to
+    """
+    def __init__(self):
+        self.now_ns = 0
+        self.scheduler = None # set by SimScripts.SimScheduler
+
+    def advance(self, ns):
+        if self.scheduler is not None:
+            self.scheduler.advance(int(ns)) # lets the other nodes run meanwhile
+        else:
+            self.now_ns += int(ns)
+
+    def advance_us(self, us):
+        self.advance(us * 1000)
+
+    def monotonic_ns(self):
+        return self.now_ns
+
+    def monotonic(self):
+        return self.now_ns / 1e9
+
+    def sleep(self, seconds):
+        self.advance(seconds * 1e9)
+
+
+### Loss models
+class BernoulliLoss:
+    """
+    Every packet is lost independently with the same probability
+    """
+    def __init__(self, rate):
+        self.rate = rate
+
+    def isLost(self, rng, src, dst):
+        return self.rate > 0 and rng.random() < self.rate
+
+
+class GilbertElliottLoss:
+    """
+    Bursty loss: each direction between two radios flips between a 'good' and
+    a 'bad' state, with a different loss rate in each
+    """
+    def __init__(self, pGoodToBad=0.01, pBadToGood=0.2, lossGood=0.0, lossBad=0.8):
+        self.pGoodToBad = pGoodToBad
+        self.pBadToGood = pBadToGood
+        self.lossGood = lossGood
+        self.lossBad = lossBad
+        self.isBad = {} # (src, dst) -> state
+
+    def meanLoss(self):
+        shareBad = self.pGoodToBad / (self.pGoodToBad + self.pBadToGood)
+        return shareBad * self.lossBad + (1 - shareBad) * self.lossGood
+
+    def isLost(self, rng, src, dst):
+        key = (id(src), id(dst))
+        bad = self.isBad.get(key, False)
+        bad = (rng.random() >= self.pBadToGood) if bad else (rng.random() < self.pGoodToBad)
+        self.isBad[key] = bad
+        return rng.random() < (self.lossBad if bad else self.lossGood)
+
+
+class SimLink:
+    """
+    Shared 'air' between simulated radios, tracks delivery & air time stats
+    """
+    def __init__(self, clock=None, lossRate=0.0, seed=0, ackCollisionRate=0.5, lossModel=None, latency_us=0):
+        self.clock = clock if clock is not None else VirtualClock()
+        # chance of any single packet (or ACK) being lost, or a custom model
+        self.lossModel = lossModel if lossModel is not None else BernoulliLoss(lossRate)
+        self.latency_us = latency_us # extra delay per packet (e.g. slow SPI on the other end)
+        self.ackCollisionRate = ackCollisionRate # chance each extra simultaneous ACK garbles the rest
+        self.spectrum = [0.0] * 126 # per channel share of time taken by other transmitters
+        self.paLoss = {} # pa_level -> extra loss chance (e.g. a long range link at low power)
+        self.rng = random.Random(seed)
+        self.radios = []
+        self.resetStats()
+
+    def resetStats(self):
+        self.numPackets = 0 # packets put on air (including retransmits)
+        self.numAcks = 0
+        self.numLost = 0
+        self.numCollisions = 0
+        self.airTime_us = 0
+
+    def attach(self, radio):
+        self.radios.append(radio)
+        radio.link = self
+
+    def airTimeUs(self, radio, payloadLen):
+        bits = 8 * (PREAMBLE_BYTES + radio.address_length + payloadLen + CRC_BYTES) + PCF_BITS
+        return bits / radio.data_rate if radio.data_rate != 250 else bits * 4
+
+    def isLost(self, src, dst):
+        if self.spectrum[src.channel] > 0 and self.rng.random() < self.spectrum[src.channel]:
+            return True # collided with someone else on this channel
+        paLoss = self.paLoss.get(src.pa_level, 0)
+        if paLoss > 0 and self.rng.random() < paLoss:
+            return True # too weak to make it
+        return self.lossModel.isLost(self.rng, src, dst)
+
+    def isBusy(self, channel):
+        """
+        True if something else is transmitting on `channel` right now
+        """
+        return self.spectrum[channel] > 0 and self.rng.random() < self.spectrum[channel]
+
+    def transmit(self, src, address, payload, askNoAck):
+        """
+        Puts one packet on air, returns the list of radios that accepted it
+        """
+        airTime = self.airTimeUs(src, len(payload))
+        self.numPackets += 1
+        self.airTime_us += airTime
+        self.clock.advance_us(airTime + self.latency_us)
+        accepted = []
+        for dst in self.radios:
+            if dst is src or not dst.isListening() or dst.channel != src.channel:
+                continue
+            pipe = dst.pipeFor(address)
+            if pipe is None:
+                continue
+            if self.isLost(src, dst):
+                self.numLost += 1
+                continue
+            if dst.accept(pipe, payload, src.pid, id(src)):
+                accepted.append((dst, pipe))
+        return accepted
+
+    def acknowledge(self, src, accepted):
+        """
+        Every radio in `accepted` ACKs at once, returns the ACK payload, True or
+        None if the ACK was lost (or garbled by the other ACKs)
+        """
+        ackPayload = None
+        for dst, pipe in accepted:
+            payload = dst.popAck(pipe)
+            if ackPayload is None:
+                ackPayload = payload
+        dst = accepted[0][0]
+        airTime = TURNAROUND_US + self.airTimeUs(dst, len(ackPayload) if ackPayload else 0)
+        self.numAcks += len(accepted)
+        self.airTime_us += airTime - TURNAROUND_US
+        self.clock.advance_us(airTime)
+        if self.isLost(dst, src):
+            self.numLost += 1
+            return None
+        for _ in range(len(accepted) - 1):
+            if self.rng.random() < self.ackCollisionRate:
+                self.numCollisions += 1
+                return None
+        return ackPayload if ackPayload else True
+
+    def statsString(self):
+        return "air: packets={} acks={} lost={} ack_collisions={} air_time={:.1f} ms".format(
+            self.numPackets, self.numAcks, self.numLost, self.numCollisions, self.airTime_us / 1000)
+
+
+class SimRF24:
+    """
+    Subset of the `RF24` api used by this repo's scripts
+    """
+    def __init__(self, link, name=""):
+        self.name = name
+        self.link = None
+        link.attach(self)
+        self.ack = False
+        self.dynamic_payloads = True
+        self.arc = 3 # library defaults
+        self.ard = 1500 # us
+        self.pa_level = 0
+        self.last_tx_arc = 0 # retries used by the last payload
+        self.channel = 76
+        self.data_rate = 1 # Mbps
+        self.address_length = 5
+        self._power = False
+        self._listen = False
+        self.txAddress = None
+        self.rxAddresses = [None] * 6
+        self.allow_ask_no_ack = True
+        self.rxFifo = [] # list of (pipe, payload)
+        self.ackFifo = [] # list of (pipe, payload)
+        self.txFifo = [] # list of (payload, askNoAck, pid)
+        self.fifoDepth = 3
+        self.lastRx = [None] * 6 # (sender, pid) for duplicate detection
+        self.pid = 0
+        self.irq_dr = False
+        self.irq_ds = False
+        self.irq_df = False
+        self.ce_pin = None # SimScripts binds the script's CE pin here
+        self.spiCost_us = 0 # virtual time per register access
+        self.service = None # optional callable run after a packet is received
+        self.resetStats()
+
+    def resetStats(self):
+        self.numSends = 0
+        self.numFailedSends = 0
+        self.numRetries = 0
+        self.numReceived = 0
+        self.numRxOverflows = 0 # packets not ACKed because the RX FIFO was full
+        self.sendLatency_us = [] # first attempt -> ACK, successful sends only
+        self.numPowerUps = 0
+        self.powered_ns = 0 # powered up (standby, TX or RX), up to the last power change
+        self.poweredSince = self.link.clock.now_ns
+
+    def _spi(self):
+        if self.spiCost_us:
+            self.link.clock.advance_us(self.spiCost_us)
+
+    ### Configuration
+    @property
+    def power(self):
+        return self._power
+
+    @power.setter
+    def power(self, isOn):
+        isOn = bool(isOn)
+        if isOn == self._power:
+            return
+        now = self.link.clock.now_ns
+        if isOn:
+            self.numPowerUps += 1
+        else:
+            self.powered_ns += now - self.poweredSince
+        self.poweredSince = now
+        self._power = isOn
+
+    def poweredTimeNs(self):
+        """
+        Time spent powered up since resetStats(), including right now
+        """
+        now = self.link.clock.now_ns
+        return self.powered_ns + (now - self.poweredSince if self._power else 0)
+
+    @property
+    def listen(self):
+        return self._listen
+
+    @listen.setter
+    def listen(self, isRx):
+        if isRx:
+            self.power = True
+        self._listen = bool(isRx)
+
+    def open_tx_pipe(self, address):
+        self.txAddress = bytes(address)
+        self.rxAddresses[0] = bytes(address) # pipe 0 receives the ACKs
+
+    def open_rx_pipe(self, pipe, address):
+        self.rxAddresses[pipe] = bytes(address)
+
+    def close_rx_pipe(self, pipe):
+        self.rxAddresses[pipe] = None
+
+    @property
+    def rpd(self):
+        return self.isListening() and self.link.isBusy(self.channel)
+
+    def isListening(self):
+        return self.power and self._listen
+
+    def pipeFor(self, address):
+        for pipe in range(1, 6):
+            if self.rxAddresses[pipe] == address:
+                return pipe
+        if self.rxAddresses[0] == address and self._listen:
+            return 0
+        return None
+
+    ### Receiving side
+    def accept(self, pipe, payload, pid, sender):
+        if len(self.rxFifo) >= self.fifoDepth:
+            self.numRxOverflows += 1
+            return False # no room, no ACK
+        if self.lastRx[pipe] == (sender, pid):
+            return True # retransmit of a packet whose ACK was lost, ACK only
+        self.lastRx[pipe] = (sender, pid)
+        self.rxFifo.append((pipe, bytes(payload)))
+        self.numReceived += 1
+        self.irq_dr = True
+        return True
+
+    def popAck(self, pipe):
+        if not self.ack:
+            return None
+        for i, (ackPipe, payload) in enumerate(self.ackFifo):
+            if ackPipe == pipe:
+                del self.ackFifo[i]
+                return payload
+        return None
+
+    def available(self):
+        self._spi()
+        return bool(self.rxFifo)
+
+    def any(self):
+        self._spi()
+        return len(self.rxFifo[0][1]) if self.rxFifo else 0
+
+    @property
+    def pipe(self):
+        return self.rxFifo[0][0] if self.rxFifo else None
+
+    def read(self, length=None):
+        self._spi()
+        if not self.rxFifo:
+            return None
+        payload = self.rxFifo.pop(0)[1]
+        if not self.rxFifo:
+            self.irq_dr = False
+        return bytearray(payload if length is None else payload[:length])
+
+    def load_ack(self, buf, pipe):
+        self._spi()
+        if len(self.ackFifo) >= self.fifoDepth:
+            return False
+        self.ack = True
+        self.ackFifo.append((pipe, bytes(buf)))
+        return True
+
+    def flush_rx(self):
+        self.rxFifo = []
+
+    def flush_tx(self):
+        self.ackFifo = []
+        self.txFifo = []
+
+    def fifo(self, about_tx=False, check_empty=None):
+        """
+        Same semantics as the library: check_empty=None returns both bits
+        """
+        self._spi()
+        if about_tx:
+            used = len(self.txFifo) if not self._listen else len(self.ackFifo)
+        else:
+            used = len(self.rxFifo)
+        full, empty = used >= self.fifoDepth, used == 0
+        if check_empty is None:
+            return (full << 1) | empty
+        return empty if check_empty else full
+
+    def clear_status_flags(self, data_recv=True, data_sent=True, data_fail=True):
+        self._spi()
+        self.irq_dr = self.irq_dr and not data_recv
+        self.irq_ds = self.irq_ds and not data_sent
+        self.irq_df = self.irq_df and not data_fail
+
+    ### Transmitting side
+    def send(self, buf, ask_no_ack=False, force_retry=0, send_only=False):
+        if isinstance(buf, (list, tuple)):
+            return [self.send(b, ask_no_ack, force_retry, send_only) for b in buf]
+        self._spi() # flush_tx & write
+        self.txFifo = []
+        result = self._transmit(buf, ask_no_ack)
+        while not result and force_retry > 0:
+            force_retry -= 1 # same as resend(): same PID, so no duplicates
+            result = self._transmit(buf, ask_no_ack, self.pid)
+        return result
+
+    def write(self, buf, ask_no_ack=False, write_only=False):
+        """
+        Queues a payload in the TX FIFO, returns False if it's full. Unless
+        `write_only`, CE goes high & the FIFO starts emptying right away
+        """
+        self._spi()
+        if len(self.txFifo) >= self.fifoDepth:
+            return False
+        self.power = True
+        self._listen = False
+        self.pid = (self.pid + 1) & 3
+        self.txFifo.append((bytes(buf), ask_no_ack, self.pid))
+        if not write_only:
+            self.processTxFifo()
+        return True
+
+    def resend(self, send_only=False):
+        """
+        Retransmits the payload at the top of the TX FIFO
+        """
+        if not self.txFifo:
+            return False
+        self.irq_df = False
+        buf, askNoAck, pid = self.txFifo[0]
+        result = self._transmit(buf, askNoAck, pid)
+        if result:
+            self.txFifo.pop(0)
+        return result
+
+    def processTxFifo(self):
+        """
+        What the radio does while CE is high in TX mode: send the FIFO until
+        it's empty or a payload hits its retry limit (which stalls the FIFO)
+        """
+        while self.txFifo and not self.irq_df and not self._listen:
+            buf, askNoAck, pid = self.txFifo[0]
+            if self._transmit(buf, askNoAck, pid):
+                self.txFifo.pop(0)
+                self.irq_ds = True
+            else:
+                self.irq_df = True
+
+    def _transmit(self, buf, askNoAck, pid=None):
+        """
+        One payload incl. auto-retransmits, `pid` is only given for retries
+        of a payload that already went out (the receiver drops duplicates)
+        """
+        link = self.link
+        self.power = True
+        self._listen = False
+        if pid is None:
+            self.pid = (self.pid + 1) & 3
+        else:
+            self.pid = pid
+        self.numSends += 1
+        start = link.clock.now_ns
+        for attempt in range(self.arc + 1):
+            self.last_tx_arc = attempt
+            if attempt:
+                self.numRetries += 1
+                link.clock.advance_us(self.ard)
+            accepted = link.transmit(self, self.txAddress, buf, askNoAck)
+            for dst, _ in accepted:
+                if dst.service is not None:
+                    dst.service()
+            if askNoAck:
+                return True
+            if not accepted:
+                link.clock.advance_us(TURNAROUND_US) # waited for an ACK that never came
+                continue
+            result = link.acknowledge(self, accepted)
+            if result is not None:
+                self.sendLatency_us.append((link.clock.now_ns - start) / 1000)
+                return result if self.ack else True
+        self.numFailedSends += 1
+        return False
+
+    def statsString(self):
+        latency = sorted(self.sendLatency_us)
+        pct = lambda p: latency[min(len(latency) - 1, int(p * len(latency)))] if latency else float("nan")
+        return "{}: sends={} failed={} retries={} received={} rx_overflows={} latency us p50={:.0f} p95={:.0f} max={:.0f}".format(
+            self.name, self.numSends, self.numFailedSends, self.numRetries, self.numReceived,
+            self.numRxOverflows, pct(0.5), pct(0.95), latency[-1] if latency else float("nan"))
+
+
+### Stand-ins for `EasyStreamNrf24` (not bundled with this repo)
+CHUNK_SIZE = 31 # 1 header byte per packet: number of packets still to come
+
+
+def sendChunked(nrf, payload):
+    """
+    Sends a payload over as many packets as needed, returns True if all got through
+    """
+    if isinstance(payload, str):
+        payload = payload.encode()
+    numChunks = max(1, -(-len(payload) // CHUNK_SIZE))
+    packet = bytearray(CHUNK_SIZE + 1)
+    for idx in range(numChunks):
+        chunk = payload[idx * CHUNK_SIZE : (idx + 1) * CHUNK_SIZE]
+        packet[0] = numChunks - 1 - idx
+        packet[1 : 1 + len(chunk)] = chunk
+        if not nrf.send(packet[: 1 + len(chunk)]):
+            return False
+    return True
+
+
+class ChunkReceiver:
+    """
+    Reassembles `sendChunked` payloads, hook `poll` onto a radio's `service`
+
+    Packets that don't start with a chunk counter (e.g. probes) are passed on as-is
+    """
+    def __init__(self, nrf, onPayload=None):
+        self.nrf = nrf
+        self.onPayload = onPayload
+        self.parts = []
+        self.numPayloads = 0
+        self.numPackets = 0
+
+    def poll(self):
+        while self.nrf.available():
+            packet = self.nrf.read()
+            self.numPackets += 1
+            if packet[0] > CHUNK_SIZE:
+                if self.onPayload is not None:
+                    self.onPayload(bytes(packet))
+                continue
+            self.parts.append(bytes(packet[1:]))
+            if packet[0] == 0:
+                payload = b"".join(self.parts)
+                self.parts = []
+                self.numPayloads += 1
+                if self.onPayload is not None:
+                    self.onPayload(payload)
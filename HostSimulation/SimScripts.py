@@ -0,0 +1,295 @@
+# Host Simulation - run device scripts against the simulated link
+#   each script instance ('node') runs in its own thread, but only one runs at
+#   a time: whichever is furthest behind in virtual time. Scripts see fake
+#   `board`, `digitalio`, `busio`, `bitbangio` & `circuitpython_nrf24l01`
+#   modules, and a `time` module backed by the virtual clock. That covers the
+#   nRF24_Testing scripts; the remote control scripts also import `neopixel`,
+#   `microcontroller`, `supervisor` & `adafruit_mpu6050`, which aren't faked
+#
+# Usage:
+#   sim = SimNetwork(lossModel=GilbertElliottLoss())
+#   sim.addScript("tx", "nRF24_Testing/main_nrf24_Sparkfun_streamtest.py", inputs=["0"], call="master")
+#   sim.addScript("rx", "nRF24_Testing/main_nrf24_Sparkfun_streamtest.py", inputs=["1"], call="slave")
+#   sim.run(until=30)
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import builtins, os, sys, threading, types
+from SimRF24 import VirtualClock, SimLink, SimRF24
+
+
+class SimulationEnd(BaseException):
+    """
+    Raised inside a node when the simulation is over (not caught by `except Exception`)
+    """
+
+
+class SimNode:
+    def __init__(self, name, target):
+        self.name = name
+        self.target = target
+        self.wakeAt = 0
+        self.done = False
+        self.error = None
+        self.output = []
+        self.thread = None
+
+
+class SimScheduler:
+    """
+    Runs nodes one at a time, always the one with the earliest wake-up time
+    """
+    def __init__(self, clock):
+        self.clock = clock
+        clock.scheduler = self
+        self.nodes = []
+        self.cond = threading.Condition()
+        self.running = None
+        self.until_ns = None
+        self.local = threading.local()
+
+    def currentNode(self):
+        return getattr(self.local, "node", None)
+
+    def advance(self, ns):
+        """
+        Called through the clock: the current node spends `ns` (e.g. sleeping
+        or on air) and lets any node that's further behind catch up first
+        """
+        node = self.currentNode()
+        if node is None:
+            self.clock.now_ns += ns # not from a node (setup code)
+            return
+        with self.cond:
+            node.wakeAt = self.clock.now_ns + ns
+            self._pickNext()
+            self._waitTurn(node)
+
+    def _pickNext(self):
+        alive = [n for n in self.nodes if not n.done]
+        if not alive:
+            self.running = None
+        else:
+            self.running = min(alive, key=lambda n: n.wakeAt)
+            self.clock.now_ns = max(self.clock.now_ns, self.running.wakeAt)
+        self.cond.notify_all()
+
+    def _waitTurn(self, node):
+        while self.running is not node:
+            self.cond.wait()
+        if self.until_ns is not None and self.clock.now_ns >= self.until_ns:
+            raise SimulationEnd()
+
+    def _runNode(self, node):
+        self.local.node = node
+        try:
+            with self.cond:
+                self._waitTurn(node)
+            node.target()
+        except SimulationEnd:
+            pass
+        except Exception as e:
+            node.error = e
+        finally:
+            with self.cond:
+                node.done = True
+                self._pickNext()
+
+    def run(self, until=None):
+        self.until_ns = None if until is None else int(until * 1e9)
+        for node in self.nodes:
+            node.thread = threading.Thread(target=self._runNode, args=(node,), daemon=True)
+            node.thread.start()
+        with self.cond:
+            self._pickNext()
+            while self.running is not None:
+                self.cond.wait()
+
+
+### Fake CircuitPython modules
+class FakePin:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return "board.{}".format(self.name)
+
+
+class FakeDigitalInOut:
+    def __init__(self, pin):
+        self.pin = pin
+        self._value = False
+        self.onChange = None # the radio watches its CE pin through this
+
+    def switch_to_input(self, pull=None):
+        pass
+
+    def switch_to_output(self, value=False, drive_mode=None):
+        self.value = value
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = bool(value)
+        if self.onChange is not None:
+            self.onChange(self._value)
+
+    def deinit(self):
+        pass
+
+
+class FakeBus:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+
+def makeBoardModule():
+    board = types.ModuleType("board")
+    board.__getattr__ = lambda name: FakePin(name) # any pin name works
+    board.SPI = FakeBus
+    board.I2C = FakeBus
+    return board
+
+
+class NodeTime:
+    """
+    Per-node `time` module: every call costs `callCost_us` of virtual time,
+    which is what moves a busy polling loop forward
+    """
+    def __init__(self, clock, callCost_us=20):
+        self.clock = clock
+        self.callCost_ns = int(callCost_us * 1000)
+
+    def monotonic_ns(self):
+        self.clock.advance(self.callCost_ns)
+        return self.clock.now_ns
+
+    def monotonic(self):
+        return self.monotonic_ns() / 1e9
+
+    def time(self):
+        return self.monotonic()
+
+    def sleep(self, seconds):
+        self.clock.advance(int(seconds * 1e9))
+
+
+class SimNetwork:
+    """
+    A link plus any number of script instances talking over it
+    """
+    def __init__(self, spiCost_us=10, callCost_us=20, **linkKwargs):
+        self.clock = VirtualClock()
+        self.link = SimLink(self.clock, **linkKwargs)
+        self.scheduler = SimScheduler(self.clock)
+        self.spiCost_us = spiCost_us
+        self.callCost_us = callCost_us
+        self.radios = {}
+        self.namespaces = {}
+
+    def makeModules(self, name, extraModules):
+        network = self
+
+        def RF24(spi, csn, ce, *args, **kwargs):
+            radio = SimRF24(network.link, name)
+            radio.spiCost_us = network.spiCost_us
+            radio.ce_pin = ce
+            ce.onChange = lambda high: radio.processTxFifo() if high else None
+            network.radios[name] = radio
+            return radio
+
+        rf24 = types.ModuleType("circuitpython_nrf24l01.rf24")
+        rf24.RF24 = RF24
+        package = types.ModuleType("circuitpython_nrf24l01")
+        package.rf24 = rf24
+        digitalio = types.ModuleType("digitalio")
+        digitalio.DigitalInOut = FakeDigitalInOut
+        busio = types.ModuleType("busio")
+        busio.SPI = busio.I2C = FakeBus
+        bitbangio = types.ModuleType("bitbangio")
+        bitbangio.SPI = bitbangio.I2C = FakeBus
+        modules = {
+            "board": makeBoardModule(),
+            "digitalio": digitalio,
+            "busio": busio,
+            "bitbangio": bitbangio,
+            "time": NodeTime(self.clock, self.callCost_us),
+            "circuitpython_nrf24l01": package,
+            "circuitpython_nrf24l01.rf24": rf24,
+        }
+        modules.update(extraModules)
+        return modules
+
+    def addScript(self, name, path, inputs=(), call=None, args=(), extraModules=None, echo=True):
+        """
+        Runs the script at `path` as node `name`, then optionally calls one of
+        its functions (by name with `args`, or a callable given the script's
+        namespace). `inputs` answer its input() prompts in order
+        """
+        modules = self.makeModules(name, extraModules or {})
+        inputs = list(inputs)
+        realImport = builtins.__import__
+
+        def nodeImport(modName, globals=None, locals=None, fromlist=(), level=0):
+            if modName in modules:
+                if not fromlist and "." in modName:
+                    return modules[modName.split(".")[0]]
+                return modules[modName]
+            return realImport(modName, globals, locals, fromlist, level)
+
+        def nodeInput(prompt=""):
+            answer = inputs.pop(0) if inputs else ""
+            nodePrint(prompt + answer)
+            return answer
+
+        def nodePrint(*values, sep=" ", end="\n", **kwargs):
+            text = sep.join(str(v) for v in values)
+            node.output.append(text)
+            if echo:
+                print("[{:9.4f} {}] {}".format(self.clock.now_ns / 1e9, name, text))
+
+        nodeBuiltins = dict(vars(builtins), __import__=nodeImport, input=nodeInput, print=nodePrint)
+        namespace = {"__name__": "sim_" + name, "__file__": path, "__builtins__": nodeBuiltins}
+        self.namespaces[name] = namespace
+        scriptDir = os.path.dirname(os.path.abspath(path))
+        if scriptDir not in sys.path:
+            sys.path.insert(0, scriptDir) # for the scripts' `lib.` imports
+
+        def target():
+            with open(path) as f:
+                code = compile(f.read(), path, "exec")
+            exec(code, namespace)
+            if callable(call):
+                call(namespace)
+            elif call is not None:
+                namespace[call](*args)
+
+        node = SimNode(name, target)
+        self.scheduler.nodes.append(node)
+        return node
+
+    def run(self, until=None):
+        self.scheduler.run(until)
+        for node in self.scheduler.nodes:
+            if node.error is not None:
+                print("{} stopped with {}: {}".format(node.name, type(node.error).__name__, node.error))
+
+    def statsString(self):
+        lines = [self.link.statsString()]
+        for radio in self.radios.values():
+            lines.append(radio.statsString())
+        return "\n".join(lines)
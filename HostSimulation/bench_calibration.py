@@ -0,0 +1,114 @@
+# Host Simulation - accelerometer calibration benchmark
+#   calibrates simulated sensors (bias, gain & axis misalignment) from six
+#   resting faces like main_calibrateAccel_SparkfunPlus.py does, then compares
+#   how far the resting faces read from their axes & the face detection
+#   latency with & without the correction
+#
+# Usage: python HostSimulation/bench_calibration.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import math, os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.AccelCalibration import AccelCalibration, FaceCalibrator
+from AccelTraces import AccelTrace, TraceGenerator, FACE_VECTORS, makeFlipTrace, makeSensorError
+from bench_faceLatency import runTraceSet
+
+NUM_DEVICES = 10
+MAX_TILT = 18.0 # deg, surfaces the cube rests on in the flip traces
+SENSOR_ERRORS = (
+    ("Typical sensor (+-0.04 g, +-3 % gain, 2 deg misaligned)", dict(misalign=2.0)),
+    ("Poor sensor (+-0.1 g, +-6 % gain, 5 deg misaligned)", dict(bias=0.1, gain=0.06, misalign=5.0)),
+)
+
+
+def restOnAllFaces(seed, error, seconds=3.0, maxTilt=0.5):
+    """
+    The calibration procedure: the cube set down on each face of a (nearly)
+    level table
+    """
+    gen = TraceGenerator(seed=seed, **error)
+    for face in (5, 1, 3, 2, 4, 6):
+        if face != gen.face:
+            gen.flip(face)
+        gen.rest(seconds, maxTilt)
+    return gen.trace
+
+
+def calibrate(trace):
+    calibrator = FaceCalibrator()
+    for s in trace.samples:
+        calibrator.add(s[0], s[1], s[2])
+    assert calibrator.done(), calibrator.missingFaces()
+    calibration = calibrator.solve()
+
+    # What the transmitter will load back
+    nvm = bytearray(256)
+    calibration.save(nvm)
+    loaded = AccelCalibration.load(nvm)
+    assert loaded is not None and loaded.matrix == calibration.matrix and loaded.offset == calibration.offset
+    return loaded
+
+
+def calibrated(trace, calibration):
+    out = AccelTrace(trace.rate)
+    out.truth = trace.truth
+    out.events = trace.events
+    counts = [0, 0, 0]
+    for s in trace.samples:
+        counts[0], counts[1], counts[2] = s[0], s[1], s[2]
+        calibration.apply(counts)
+        out.samples.append((counts[0], counts[1], counts[2]) + s[3:])
+    return out
+
+
+def faceErrors(trace):
+    """
+    Degrees between each resting face's mean reading & its axis
+    """
+    sums = dict((face, [0, 0, 0]) for face in FACE_VECTORS)
+    for s, face in zip(trace.samples, trace.truth):
+        if face:
+            for axis in range(3):
+                sums[face][axis] += s[axis]
+    errors = []
+    for face, total in sums.items():
+        norm = math.sqrt(sum(v*v for v in total))
+        cosine = sum(v*a for v, a in zip(total, FACE_VECTORS[face])) / norm
+        errors.append(math.degrees(math.acos(max(-1.0, min(1.0, cosine)))))
+    return errors
+
+
+def main():
+    print("Synthetic sensors calibrated from 3 s on each face (AccelTraces.py)")
+    for title, errorKwargs in SENSOR_ERRORS:
+        errors = [makeSensorError(seed, **errorKwargs) for seed in range(1, NUM_DEVICES + 1)]
+        calibrations = [calibrate(restOnAllFaces(100 + seed, error)) for seed, error in enumerate(errors)]
+
+        # Resting faces, exactly level (the 20 deg cones are around the axes)
+        checks = [restOnAllFaces(200 + seed, error, maxTilt=0.0) for seed, error in enumerate(errors)]
+        before = [e for trace in checks for e in faceErrors(trace)]
+        after = [e for trace, cal in zip(checks, calibrations) for e in faceErrors(calibrated(trace, cal))]
+        print("{}: resting faces off their axis by mean {:.2f} / max {:.2f} deg raw, {:.2f} / {:.2f} deg calibrated".format(
+            title, sum(before) / len(before), max(before), sum(after) / len(after), max(after)))
+
+        # Flips onto uneven surfaces, where the sensor error adds to the tilt near the 20 deg edge
+        traces = [makeFlipTrace(seed=seed, maxTilt=MAX_TILT, **error) for seed, error in enumerate(errors, 1)]
+        runTraceSet("  raw counts", traces)
+        runTraceSet("  calibrated counts", [calibrated(trace, cal) for trace, cal in zip(traces, calibrations)])
+
+    # Cost per sample
+    calibration = calibrations[0]
+    counts = [1200, -300, 16000]
+    numSamples = 100000
+    start = time.perf_counter()
+    for _ in range(numSamples):
+        counts[0], counts[1], counts[2] = 1200, -300, 16000
+        calibration.apply(counts)
+    print("apply(): {:.2f} us/sample (host CPython)".format((time.perf_counter() - start) / numSamples * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Host Simulation - change propagation latency
+#   how long a committed face takes to reach the radio in the transmitter's
+#   main loop: the smoothed face polled on its own 10 ms timer (anyChanges(),
+#   before) vs the debouncer posting a change that the send check picks up
+#   in the same pass (postChange()), in virtual time with the loop's timers,
+#   per pass costs & the face pipeline of the SparkfunPlus transmitter
+#
+# Usage: python HostSimulation/bench_changeLatency.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, random, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.FaceDetect import HysteresisFaceFilter, MarginDebouncer
+from AccelTraces import makeFlipTrace, makeSensorError
+
+NUM_TRACES = 10
+UPDATE_TIME_FACE = 1.1/40 # s, updateTime_faceIdx
+UPDATE_TIME_CHANGES = 0.01 # s, the old updateTime_changes
+LOOP_US = (300, 1500) # one pass without a sensor read: console poll, timers, energy monitor
+FACE_READ_US = 1500 # burst read, filter & debouncer
+
+
+def runLoop(trace, eventDriven, seed):
+    """
+    Returns ([(commit time, face)], [(send time, face)], number of change checks)
+    """
+    rng = random.Random(seed) # same pass costs for both, so the same commits
+    faceFilter = HysteresisFaceFilter(3)
+    debouncer = MarginDebouncer(2, 7)
+    faceFilter.fill(*trace.samples[0][:3])
+    duration = trace.duration()
+    now = 0.0
+    timeCheck_faceIdx = 0.0
+    timeCheck_changes = 0.0
+    debounced = 0 # what getSmoothedFaceIdx() returns
+    committed = 0 # the debouncer's last new face
+    lastFace = 0 # anyChanges()'s
+    pending = False
+    numChecks = 0
+    commits = []
+    sends = []
+    while now < duration:
+        now += rng.randint(*LOOP_US) / 1e6
+        if now - timeCheck_faceIdx > UPDATE_TIME_FACE:
+            timeCheck_faceIdx = now
+            sample = trace.samples[min(len(trace) - 1, int(now * trace.rate))]
+            debounced = debouncer.add(faceFilter.add(sample[0], sample[1], sample[2]), faceFilter.margin)
+            now += FACE_READ_US / 1e6
+            if debounced != 0 and debounced != committed:
+                committed = debounced
+                commits.append((now, debounced))
+                pending = True # postChange()
+            numChecks += eventDriven
+        if eventDriven:
+            detected, pending = pending, False
+        elif now - timeCheck_changes > UPDATE_TIME_CHANGES:
+            timeCheck_changes = now
+            numChecks += 1
+            detected = debounced != 0 and debounced != lastFace
+            if detected:
+                lastFace = debounced
+        else:
+            detected = False
+        if detected:
+            sends.append((now, committed))
+    return commits, sends, numChecks
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))] if values else float("nan")
+
+
+def main():
+    traces = [makeFlipTrace(seed=seed, **makeSensorError(seed)) for seed in range(1, NUM_TRACES + 1)]
+    print("{} traces, {} flips; face updates every {:.1f} ms, passes {}-{} us + {} us per face read".format(
+        len(traces), sum(len(trace.flipEnds()) for trace in traces), UPDATE_TIME_FACE * 1000,
+        LOOP_US[0], LOOP_US[1], FACE_READ_US))
+    print("{:<34} {:>9} {:>9} {:>9} {:>9} {:>10}".format(
+        "change propagation", "mean ms", "p95 ms", "max ms", "flip->tx", "checks/s"))
+    results = []
+    for name, eventDriven in (("anyChanges() on a 10 ms timer", False), ("posted by the debouncer", True)):
+        delays = []
+        flipDelays = []
+        numChecks = 0
+        duration = 0
+        for seed, trace in enumerate(traces):
+            commits, sends, checks = runLoop(trace, eventDriven, seed)
+            assert len(commits) == len(sends)
+            delays += [(send[0] - commit[0]) * 1000 for commit, send in zip(commits, sends)]
+            numChecks += checks
+            duration += trace.duration()
+            flips = [(idx / trace.rate, info[1]) for idx, name, info in trace.events if name == "flip"]
+            for k, (start, target) in enumerate(flips):
+                end = flips[k + 1][0] if k + 1 < len(flips) else trace.duration()
+                sent = [when for when, face in sends if start <= when < end and face == target]
+                if sent:
+                    flipDelays.append((sent[0] - start) * 1000)
+        results.append(delays)
+        print("{:<34} {:>9.2f} {:>9.2f} {:>9.2f} {:>9.1f} {:>10.0f}".format(
+            name, sum(delays) / len(delays), percentile(delays, 0.95), max(delays),
+            sum(flipDelays) / len(flipDelays), numChecks / duration))
+    print("Commit to transmit: {:.2f} ms less on average".format(
+        sum(results[0]) / len(results[0]) - sum(results[1]) / len(results[1])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Host Simulation - config load benchmark
+#   boot-time cost of loading the remote control settings: the binary record
+#   in nvm (lib/RemoteConfig.py, one struct.unpack_from) vs parsing the same
+#   settings from a text file, line by line or as json
+#
+# Usage: python HostSimulation/bench_configLoad.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import json, os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.RemoteConfig import RemoteConfig, FIELDS, NVM_SIZE
+
+NUM_LOADS = 20000
+
+
+def textValue(value):
+    if isinstance(value, bytes):
+        return value.rstrip(b"\0").decode()
+    if isinstance(value, tuple):
+        return ",".join(str(v) for v in value)
+    return repr(value)
+
+
+def toText(config):
+    return "".join("{} = {} # setting\n".format(name, textValue(getattr(config, name))) for name, _, _ in FIELDS)
+
+
+def parseText(text):
+    """
+    What a settings file would take: split the lines, drop comments, convert
+    each value by its field type
+    """
+    config = RemoteConfig()
+    for line in text.split("\n"):
+        line = line.split("#", 1)[0].strip()
+        if line:
+            name, value = line.split("=", 1)
+            if not config.set(name.strip(), value.strip()):
+                raise ValueError(line)
+    return config
+
+
+def toJson(config):
+    return json.dumps(dict((name, textValue(getattr(config, name))) for name, _, _ in FIELDS))
+
+
+def parseJson(text):
+    config = RemoteConfig()
+    for name, value in json.loads(text).items():
+        config.set(name, value)
+    return config
+
+
+def timeLoads(load):
+    start = time.perf_counter()
+    for _ in range(NUM_LOADS):
+        config = load()
+    return (time.perf_counter() - start) / NUM_LOADS * 1e6, config
+
+
+def main():
+    nvm = bytearray(256)
+    RemoteConfig(paLevel=-12, brightness=0.25, faceMethods=(8, 1, 2, 3, 4, 9) + (0, 1, 2, 3, 4, 5)).save(nvm)
+    stored = RemoteConfig.load(nvm) # floats as stored (32 bit)
+    text = toText(stored)
+    jsonText = toJson(stored)
+
+    cases = (
+        ("binary record in nvm (struct)", NVM_SIZE, lambda: RemoteConfig.load(nvm)),
+        ("text file, name = value lines", len(text), lambda: parseText(text)),
+        ("text file, json", len(jsonText), lambda: parseJson(jsonText)),
+    )
+    print("{:<32} {:>7} {:>10}".format("config", "bytes", "us/load"))
+    results = []
+    for name, size, load in cases:
+        elapsed, config = timeLoads(load)
+        assert str(config) == str(stored), (name, str(config))
+        results.append(elapsed)
+        print("{:<32} {:>7} {:>10.2f}".format(name, size, elapsed))
+    print("binary load is {:.1f}x faster than the text lines, {:.1f}x faster than json (host CPython)".format(
+        results[1] / results[0], results[2] / results[0]))
+
+
+if __name__ == "__main__":
+    main()
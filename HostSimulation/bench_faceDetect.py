@@ -0,0 +1,80 @@
+# Host Simulation - face detection benchmark
+#   runs the float & integer face pipelines over the same MPU6050 traces,
+#   checks they agree sample by sample & times both
+#
+# Usage: python HostSimulation/bench_faceDetect.py [trace.csv ...]
+#   without arguments it uses synthetic traces (AccelTraces.py)
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.FaceDetect import FloatFaceFilter, IntFaceFilter, FaceDebouncer, tiltAngles
+from AccelTraces import AccelTrace, makeFlipTrace, makeSensorError
+
+
+def runFilter(trace, faceFilter, repeats=1):
+    """
+    Returns the per-sample faces & the host time per sample (us)
+    """
+    samples = trace.samples
+    best = None
+    for _ in range(repeats):
+        faceFilter.fill(*samples[0][:3])
+        faces = []
+        start = time.perf_counter()
+        for sample in samples:
+            faces.append(faceFilter.add(sample[0], sample[1], sample[2]))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return faces, best / len(samples) * 1e6
+
+
+def debounce(faces, numSamples=7):
+    debouncer = FaceDebouncer(numSamples)
+    return [debouncer.add(face) for face in faces]
+
+
+def loadTraces(paths):
+    if paths:
+        return [(os.path.basename(path), AccelTrace.loadCsv(path)) for path in paths]
+    traces = []
+    for seed in range(1, 6):
+        traces.append(("synthetic seed {}".format(seed), makeFlipTrace(seed=seed)))
+        traces.append(("synthetic seed {} + sensor error".format(seed),
+                       makeFlipTrace(seed=seed, **makeSensorError(seed))))
+    return traces
+
+
+def main():
+    traces = loadTraces(sys.argv[1:])
+    totals = {"samples": 0, "mismatches": 0, "debouncedMismatches": 0, "float": 0.0, "int": 0.0}
+    print("{:<34} {:>8} {:>10} {:>10} {:>10} {:>10}".format(
+        "trace", "samples", "mismatch", "debounced", "float us", "int us"))
+    for name, trace in traces:
+        floatFaces, floatTime = runFilter(trace, FloatFaceFilter(), repeats=5)
+        intFaces, intTime = runFilter(trace, IntFaceFilter(), repeats=5)
+        mismatches = [i for i in range(len(trace)) if floatFaces[i] != intFaces[i]]
+        debouncedMismatches = sum(1 for a, b in zip(debounce(floatFaces), debounce(intFaces)) if a != b)
+        print("{:<34} {:>8} {:>10} {:>10} {:>10.2f} {:>10.2f}".format(
+            name, len(trace), len(mismatches), debouncedMismatches, floatTime, intTime))
+        for i in mismatches[:3]: # should only ever be right on a 20 deg boundary
+            window = trace.samples[max(0, i - 6) : i + 1]
+            avg = [sum(s[axis] for s in window) / len(window) for axis in range(3)]
+            print("    sample {}: float {} int {}, theta/phi {:.3f}/{:.3f}".format(
+                i, floatFaces[i], intFaces[i], *tiltAngles(*avg)))
+        totals["samples"] += len(trace)
+        totals["mismatches"] += len(mismatches)
+        totals["debouncedMismatches"] += debouncedMismatches
+        totals["float"] += floatTime * len(trace)
+        totals["int"] += intTime * len(trace)
+    print("Total: {} samples, {} differ ({} after debouncing)".format(
+        totals["samples"], totals["mismatches"], totals["debouncedMismatches"]))
+    print("Per sample: float {:.2f} us, int {:.2f} us -> {:.1f}x faster (host CPython, hardware floats)".format(
+        totals["float"] / totals["samples"], totals["int"] / totals["samples"], totals["float"] / totals["int"]))
+
+
+if __name__ == "__main__":
+    main()
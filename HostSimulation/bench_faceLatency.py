@@ -0,0 +1,155 @@
+# Host Simulation - face change latency benchmark
+#   replays MPU6050 traces through the face detection pipelines & measures how
+#   long after a flip settles the change is detected (what anyChanges() in the
+#   transmitter would report) & how many detected changes were wrong
+#
+# Usage: python HostSimulation/bench_faceLatency.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.FaceDetect import IntFaceFilter, FaceDebouncer, HysteresisFaceFilter, MarginDebouncer, \
+    GyroFaceFilter, StillFaceDebouncer
+from AccelTraces import makeFlipTrace, makeSensorError
+
+NUM_TRACES = 10
+
+
+### Pipelines: trace -> the debounced face per sample (0 = none yet)
+def runAverage(trace):
+    """
+    The transmitter today: 7 sample moving average, then 7 identical faces
+    """
+    faceFilter = IntFaceFilter(7)
+    debouncer = FaceDebouncer(7)
+    faceFilter.fill(*trace.samples[0][:3])
+    return [debouncer.add(faceFilter.add(s[0], s[1], s[2])) for s in trace.samples]
+
+
+def runHysteresis(trace):
+    """
+    3 sample average with enter/exit angles, commits after 2 to 7 identical
+    faces depending on the margin
+    """
+    faceFilter = HysteresisFaceFilter(3)
+    debouncer = MarginDebouncer(2, 7)
+    faceFilter.fill(*trace.samples[0][:3])
+    faces = []
+    for s in trace.samples:
+        face = faceFilter.add(s[0], s[1], s[2])
+        faces.append(debouncer.add(face, faceFilter.margin))
+    return faces
+
+
+def runGyro(trace):
+    """
+    Complementary filter, 3 identical faces while (nearly) not rotating
+    """
+    faceFilter = GyroFaceFilter(trace.rate)
+    debouncer = StillFaceDebouncer(3)
+    faceFilter.fill(*trace.samples[0])
+    return [debouncer.add(faceFilter.add(*s), faceFilter.still) for s in trace.samples]
+
+
+PIPELINES = (
+    ("7-sample average + 7 identical (current)", runAverage),
+    ("hysteresis + margin early commit", runHysteresis),
+    ("gyro complementary filter + still check", runGyro),
+)
+
+
+### Scoring
+def evaluate(trace, faces):
+    """
+    Turns the debounced faces into changes like anyChanges() does & scores
+    them against the flips in the trace. Returns (latencies after settling in
+    ms, latencies from the start of the flip in ms, number of missed flips,
+    number of wrong changes, wrong changes during shakes)
+    """
+    flips = [(idx, info) for idx, name, info in trace.events if name == "flip"]
+    settled = dict((idx, info[0]) for idx, name, info in trace.events if name == "settled")
+    settleIdx = sorted(settled)
+    shakes = [idx for idx, name, info in trace.events if name == "shake"]
+
+    changes = []
+    lastFace = 0
+    for idx, face in enumerate(faces):
+        if face != 0 and face != lastFace:
+            lastFace = face
+            changes.append((idx, face))
+
+    latencies = []
+    flipLatencies = []
+    missed = 0
+    wrong = 0
+    wrongShaking = 0
+    for k, (start, (_, target)) in enumerate(flips):
+        end = flips[k + 1][0] if k + 1 < len(flips) else len(faces)
+        settle = next(i for i in settleIdx if i >= start)
+        detected = [idx for idx, face in changes if start <= idx < end and face == target]
+        if detected:
+            latencies.append((detected[0] - settle) * 1000 / trace.rate)
+            flipLatencies.append((detected[0] - start) * 1000 / trace.rate)
+        else:
+            missed += 1
+    for idx, face in changes:
+        expected = 5 # the generator starts on face 5
+        for start, (_, target) in flips:
+            if start <= idx:
+                expected = target
+        if face != expected:
+            wrong += 1
+            if any(s <= idx < s + 2 * trace.rate for s in shakes):
+                wrongShaking += 1
+    return latencies, flipLatencies, missed, wrong, wrongShaking
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))] if values else float("nan")
+
+
+def runTraceSet(title, traces):
+    numFlips = sum(len(trace.flipEnds()) for trace in traces)
+    numShakes = sum(1 for trace in traces for _, name, _ in trace.events if name == "shake")
+    print("{}: {} traces, {} flips, {} shakes".format(title, len(traces), numFlips, numShakes))
+    print("  {:<42} {:>9} {:>8} {:>8} {:>7} {:>7} {:>9} {:>9}".format(
+        "pipeline", "from flip", "settled", "p95", "missed", "wrong", "(shakes)", "us/sample"))
+    for name, run in PIPELINES:
+        latencies = []
+        flipLatencies = []
+        missed = wrong = wrongShaking = 0
+        hostTime = 0.0
+        numSamples = 0
+        for trace in traces:
+            start = time.perf_counter()
+            faces = run(trace)
+            hostTime += time.perf_counter() - start
+            numSamples += len(trace)
+            result = evaluate(trace, faces)
+            latencies += result[0]
+            flipLatencies += result[1]
+            missed += result[2]
+            wrong += result[3]
+            wrongShaking += result[4]
+        print("  {:<42} {:>6.0f} ms {:>5.0f} ms {:>5.0f} ms {:>7} {:>7} {:>9} {:>9.2f}".format(
+            name, sum(flipLatencies) / max(1, len(flipLatencies)), sum(latencies) / max(1, len(latencies)),
+            percentile(latencies, 0.95), missed, wrong, wrongShaking, hostTime / numSamples * 1e6))
+
+
+def main():
+    print("Detection latency: mean from the start of the flip, mean & p95 after it settled")
+    print("Synthetic traces with per-device sensor errors (AccelTraces.py)")
+    runTraceSet("Gentle handling", [makeFlipTrace(seed=seed, **makeSensorError(seed))
+                                    for seed in range(1, NUM_TRACES + 1)])
+    runTraceSet("Rough handling (shakes, turned around in the hand)",
+                [makeFlipTrace(seed=seed, numShakes=20, shakeAmplitude=(0.8, 1.8), shakeWobble=25.0,
+                               numWanders=20, wanderSpeed=(20.0, 120.0), **makeSensorError(seed))
+                 for seed in range(1, NUM_TRACES + 1)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Host Simulation - gesture detection benchmark
+#   replays MPU6050 traces through the gesture detector (& the transmitter's
+#   face detection, for the double flips): how many gestures are recognized,
+#   how long after they start & how many events fire that nobody gestured
+#
+# Usage: python HostSimulation/bench_gestures.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.FaceDetect import HysteresisFaceFilter, MarginDebouncer
+from lib.GestureDetect import GestureDetector, GESTURE_NONE, GESTURE_SHAKE, GESTURE_TAP, GESTURE_DOUBLE_FLIP, GESTURE_NAMES
+from AccelTraces import makeGestureTrace, makeFlipTrace, makeSensorError
+
+NUM_TRACES = 10
+MATCH_TIME = 2.5 # seconds after a gesture starts its event has to fire
+EVENT_GESTURES = {GESTURE_SHAKE: "shake", GESTURE_TAP: "tap", GESTURE_DOUBLE_FLIP: "doubleflip"}
+
+
+def runDetector(trace):
+    """
+    The transmitter's pipeline: early-commit faces, then the gesture detector
+    on the same samples. Returns [(sampleIdx, event)] & the host time per sample
+    """
+    faceFilter = HysteresisFaceFilter(3)
+    debouncer = MarginDebouncer(2, 7)
+    detector = GestureDetector(trace.rate)
+    faceFilter.fill(*trace.samples[0][:3])
+    events = []
+    face = 0
+    start = time.perf_counter()
+    for idx, s in enumerate(trace.samples):
+        committed = debouncer.add(faceFilter.add(s[0], s[1], s[2]), faceFilter.margin)
+        if committed != 0:
+            face = committed # what anyChanges() would have picked up
+        event = detector.add(s[0], s[1], s[2], face)
+        if event != GESTURE_NONE:
+            events.append((idx, event))
+    return events, (time.perf_counter() - start) / len(trace) * 1e6
+
+
+def score(trace, events, stats):
+    window = int(MATCH_TIME * trace.rate)
+    used = set()
+    for start, name, _ in trace.events:
+        if name not in stats:
+            continue
+        match = [(idx, event) for idx, event in events
+                 if start <= idx < start + window and EVENT_GESTURES.get(event) == name and idx not in used]
+        stats[name][0] += 1
+        if match:
+            used.add(match[0][0])
+            stats[name][1] += 1
+            stats[name][2].append((match[0][0] - start) * 1000 / trace.rate)
+    falseEvents = [GESTURE_NAMES[event] for idx, event in events if idx not in used]
+    return falseEvents
+
+
+def runTraceSet(title, traces, withGestures=True):
+    stats = dict((name, [0, 0, []]) for name in ("shake", "tap", "doubleflip")) if withGestures else {}
+    falseEvents = []
+    hostTime = 0.0
+    hours = sum(trace.duration() for trace in traces) / 3600
+    for trace in traces:
+        events, perSample = runDetector(trace)
+        hostTime += perSample / len(traces)
+        falseEvents += score(trace, events, stats)
+    print("{}: {} traces, {:.1f} minutes".format(title, len(traces), hours * 60))
+    for name, (total, found, latencies) in stats.items():
+        latencies.sort()
+        print("  {:<11} {:>4}/{:<4} recognized, latency mean {:>4.0f} ms, p95 {:>4.0f} ms".format(
+            name, found, total, sum(latencies) / max(1, len(latencies)),
+            latencies[int(0.95 * len(latencies))] if latencies else float("nan")))
+    counts = dict((name, falseEvents.count(name)) for name in GESTURE_NAMES[1:])
+    print("  false events: {} ({:.1f} per hour), {}".format(
+        len(falseEvents), len(falseEvents) / hours, ", ".join("{} {}".format(n, c) for n, c in counts.items())))
+    print("  host time: {:.2f} us/sample (faces + gestures)".format(hostTime))
+
+
+def main():
+    print("Synthetic traces with per-device sensor errors (AccelTraces.py), latency from the gesture's start")
+    runTraceSet("Gestures between flips", [makeGestureTrace(seed=seed, **makeSensorError(seed))
+                                           for seed in range(1, NUM_TRACES + 1)])
+    runTraceSet("No gestures, gentle flips", [makeFlipTrace(seed=seed, numShakes=0, **makeSensorError(seed))
+                                              for seed in range(1, NUM_TRACES + 1)], withGestures=False)
+    runTraceSet("No gestures, turned around in the hand", [
+        makeFlipTrace(seed=seed, numShakes=0, numWanders=20, wanderSpeed=(20.0, 120.0), **makeSensorError(seed))
+        for seed in range(1, NUM_TRACES + 1)], withGestures=False)
+
+
+if __name__ == "__main__":
+    main()
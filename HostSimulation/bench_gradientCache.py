@@ -0,0 +1,115 @@
+# Host Simulation - gradient cache benchmark
+#   time to show a gradient on strips of different lengths, expanded every
+#   time vs looked up in lib/GradientCache.py, & the hit rate/bytes used for
+#   different budgets over flips between a handful of gradients (most flips
+#   go back to one of the last few faces, like rotating a cube in hand)
+#
+# Usage: python HostSimulation/bench_gradientCache.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import colorsys, os, random, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.GradientCache import GradientCache, expandGradient
+
+NUM_FLIPS = 5000
+STRIP_LENGTHS = (30, 60, 144, 300)
+BUDGETS = (0, 1024, 2048, 4096, 8192)
+BRIGHTNESS = 0.1
+
+
+def hueStops(hues):
+    """
+    (r, g, b) stops of full saturation & value, as ColorSolid(hue=h) has
+    """
+    stops = []
+    for hue in hues:
+        r, g, b = colorsys.hsv_to_rgb((hue % 360) / 360, 1.0, 1.0)
+        stops.append((int(r * 255), int(g * 255), int(b * 255)))
+    return stops
+
+
+# The transmitter's two rainbows & a few other gradients faces could map to
+GRADIENTS = (
+    ("rainbowShort", hueStops((0, 60, 120, 180, 240, 300, 360))),
+    ("rainbowMedium", hueStops((0, 60, 120, 180, 240, 300, 360, 0))),
+    ("sunset", hueStops((0, 20, 40, 300))),
+    ("ocean", hueStops((160, 200, 240))),
+    ("forest", hueStops((80, 120, 160, 120))),
+    ("fire", hueStops((0, 15, 30, 45, 60))),
+)
+
+
+def scaledStops(stops):
+    """
+    What the receiver's gradientTable() expands: the stops at the brightness
+    """
+    return [[int(x * BRIGHTNESS) for x in stop] for stop in stops]
+
+
+def flipSequence(seed=1):
+    """
+    Gradient indexes, 80% of the time one of the last three shown
+    """
+    rng = random.Random(seed)
+    recent = [0]
+    flips = []
+    for _ in range(NUM_FLIPS):
+        if rng.random() < 0.8 and len(recent) > 1:
+            idx = rng.choice(recent[-3:])
+        else:
+            idx = rng.randrange(len(GRADIENTS))
+        if idx in recent:
+            recent.remove(idx)
+        recent.append(idx)
+        flips.append(idx)
+    return flips
+
+
+def showTime(flips, length, cache):
+    """
+    Mean microseconds per flip to get the table (expanding on a miss)
+    """
+    start = time.perf_counter()
+    for idx in flips:
+        name, stops = GRADIENTS[idx]
+        if cache is None:
+            expandGradient(scaledStops(stops), length)
+        else:
+            cache.get((name, length, BRIGHTNESS), lambda: expandGradient(scaledStops(stops), length))
+    return (time.perf_counter() - start) * 1e6 / len(flips)
+
+
+def main():
+    flips = flipSequence()
+    print("{} flips between {} gradients, 80% back to one of the last three".format(NUM_FLIPS, len(GRADIENTS)))
+    print()
+    print("Per flip, expanding every time vs a 4096 byte cache:")
+    print("{:>7} {:>8} {:>12} {:>10} {:>9} {:>8}".format("pixels", "bytes", "expand us", "cached us", "speedup", "hits"))
+    for length in STRIP_LENGTHS:
+        expand = showTime(flips, length, None)
+        cache = GradientCache(4096)
+        cached = showTime(flips, length, cache)
+        print("{:>7} {:>8} {:>12.1f} {:>10.1f} {:>8.1f}x {:>7.0f}%".format(
+            length, 3 * length, expand, cached, expand / cached, 100 * cache.hitRate()))
+    print()
+    length = 144
+    print("Budgets at {} pixels ({} bytes per table):".format(length, 3 * length))
+    for budget in BUDGETS:
+        cache = GradientCache(budget)
+        cached = showTime(flips, length, cache)
+        print("  {:>5} bytes: {:>6.1f} us per flip | {}".format(budget, cached, cache.report()))
+
+    # The cached tables are the ones expandGradient() makes
+    cache = GradientCache(4096)
+    for idx in flips[:100]:
+        name, stops = GRADIENTS[idx]
+        table = cache.get((name, length, BRIGHTNESS), lambda: expandGradient(scaledStops(stops), length))
+        assert table == expandGradient(scaledStops(stops), length)
+    print("Cached tables match fresh expansions")
+
+
+if __name__ == "__main__":
+    main()
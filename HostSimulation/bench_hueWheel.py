@@ -0,0 +1,82 @@
+# Host Simulation - hue wheel benchmark
+#   HSV -> RGB conversions per second in floating point (the hsv_to_rgb a
+#   ColorSolid does, colorsys here) vs lib/HueWheel.py's table lookups, same
+#   for the receiver's brightness scaling, & how far the tables' colors are
+#   from the floating point ones over the whole hue/sat/val range
+#
+# Usage: python HostSimulation/bench_hueWheel.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import colorsys, os, random, sys, time
+from math import floor
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.HueWheel import HueWheel, HUE_STEPS
+
+NUM_CONVERSIONS = 200000
+
+
+def floatRgb(hue, sat, val):
+    r, g, b = colorsys.hsv_to_rgb((hue % 360) / 360, sat, val)
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+
+def adjColor(_color, _brightness=1.0):
+    # The receiver's, without the wheel
+    return [floor(x * _brightness) for x in _color]
+
+
+def rate(fn, args):
+    start = time.perf_counter()
+    for a in args:
+        fn(*a)
+    return len(args) / (time.perf_counter() - start)
+
+
+def maxError(wheel, hues, sats, vals):
+    worst = 0
+    for hue in hues:
+        for sat in sats:
+            for val in vals:
+                a = floatRgb(hue, sat, val)
+                b = wheel.rgb(hue, sat, val)
+                worst = max(worst, max(abs(x - y) for x, y in zip(a, b)))
+    return worst
+
+
+def main():
+    wheel = HueWheel()
+    rng = random.Random(1)
+
+    # Conversions per second: the fallback's face hues at the receiver's
+    # brightness levels (few scale tables) & arbitrary colors (many)
+    faces = [((rng.randrange(6)) * 60.0, 1.0, rng.choice((0.05, 0.1, 0.3, 1.0))) for _ in range(NUM_CONVERSIONS)]
+    arbitrary = [(rng.uniform(0, 360), 1.0, 1.0) for _ in range(NUM_CONVERSIONS)]
+    print("{:<32} {:>12} {:>12} {:>8}".format("conversions/s", "float", "wheel", "speedup"))
+    for name, args in (("face hues, 4 brightness levels", faces), ("any hue, full sat & val", arbitrary)):
+        floatRate = rate(floatRgb, args)
+        wheelRate = rate(wheel.rgb, args)
+        print("{:<32} {:>12.0f} {:>12.0f} {:>7.1f}x".format(name, floatRate, wheelRate, wheelRate / floatRate))
+    colors = [((rng.randrange(256), rng.randrange(256), rng.randrange(256)), 0.1) for _ in range(NUM_CONVERSIONS)]
+    floatRate = rate(adjColor, colors)
+    wheelRate = rate(wheel.scale, colors)
+    print("{:<32} {:>12.0f} {:>12.0f} {:>7.1f}x".format("brightness scaling", floatRate, wheelRate, wheelRate / floatRate))
+    print("(scale tables built: {})".format(wheel.numTableBuilds))
+    print()
+
+    # Equivalence
+    faceError = maxError(wheel, [(face - 1) * 60.0 for face in range(1, 7)], (1.0,), (0.05, 0.1, 0.3, 0.6, 1.0))
+    stepError = maxError(wheel, [step * 360 / HUE_STEPS for step in range(HUE_STEPS)], (1.0, 0.5), (1.0, 0.1))
+    anyError = maxError(wheel, [rng.uniform(-360, 720) for _ in range(2000)], (0.0, 0.25, 0.5, 1.0), (0.1, 0.5, 1.0))
+    scaleOk = all(list(wheel.scale(c, b)) == adjColor(c, b) for c, b in colors[:20000])
+    print("Max channel difference vs floating point:")
+    print("  face hues:       {}".format(faceError))
+    print("  wheel steps:     {}".format(stepError))
+    print("  arbitrary HSV:   {} (hue rounded to the nearest of {} steps)".format(anyError, HUE_STEPS))
+    print("Brightness scaling identical to adjColor(): {}".format(scaleOk))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Host Simulation - MPU6050 read benchmark
+#   the adafruit_mpu6050 properties vs the burst reader, on a fake I2C bus
+#   playing back a trace: host time per read (the Python layers), bus
+#   transactions per read & the time they'd spend on the wire
+#
+# Usage: python HostSimulation/bench_mpuReader.py
+#   needs adafruit-circuitpython-mpu6050 (pip) for the driver being compared
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+import adafruit_mpu6050
+from lib.MpuReader import MpuBurstReader
+from AccelTraces import makeFlipTrace
+from SimMpu6050 import FakeMpuBus
+
+NUM_READS = 20000
+
+
+def timeReads(bus, read):
+    bus.resetStats()
+    start = time.perf_counter()
+    for _ in range(NUM_READS):
+        read()
+        bus.nextSample()
+    elapsed = time.perf_counter() - start
+    return elapsed / NUM_READS * 1e6, bus.numTransactions / NUM_READS, bus.wireTime_us / NUM_READS
+
+
+def main():
+    trace = makeFlipTrace(seed=1, numFlips=10)
+    bus = FakeMpuBus(trace)
+    sensor = adafruit_mpu6050.MPU6050(bus)
+    reader = MpuBurstReader.fromSensor(sensor)
+    gyroReader = MpuBurstReader.fromSensor(sensor, withGyro=True)
+    counts = [0, 0, 0]
+    counts6 = [0] * 6
+
+    # Both paths have to read the same values
+    for _ in range(len(trace)):
+        expected = sensor.acceleration
+        actual = reader.acceleration()
+        assert all(abs(a - b) < 1e-9 for a, b in zip(expected, actual)), (expected, actual)
+        bus.nextSample()
+
+    cases = (
+        ("sensor.acceleration", lambda: sensor.acceleration),
+        ("sensor.acceleration + sensor.gyro", lambda: (sensor.acceleration, sensor.gyro)),
+        ("reader.acceleration()", reader.acceleration),
+        ("reader.counts()", reader.counts),
+        ("reader.readInto(counts)", lambda: reader.readInto(counts)),
+        ("gyro reader, acceleration + lastGyro", lambda: (gyroReader.acceleration(), gyroReader.lastGyro())),
+        ("gyro reader, readInto(6 counts)", lambda: gyroReader.readInto(counts6)),
+    )
+    print("{:<38} {:>10} {:>13} {:>15} {:>15}".format(
+        "read", "host us", "transactions", "wire us 400k", "wire us 100k"))
+    results = {}
+    for name, read in cases:
+        bus.frequency = 400000
+        hostTime, transactions, wire400 = timeReads(bus, read)
+        bus.frequency = 100000 # bitbangio
+        _, _, wire100 = timeReads(bus, read)
+        results[name] = (hostTime, wire400, wire100)
+        print("{:<38} {:>10.2f} {:>13.1f} {:>15.1f} {:>15.1f}".format(name, hostTime, transactions, wire400, wire100))
+
+    base = results["sensor.acceleration"]
+    burst = results["reader.readInto(counts)"]
+    print("readInto vs sensor.acceleration: {:.1f}x less host time, {:.1f}x less wire time".format(
+        base[0] / burst[0], base[1] / burst[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# Host Simulation - payload dispatch benchmark
+#   the receiver's old payload handling (every tag decoder in turn, then
+#   ColorMethod.parse() & float() inside nested try/except) vs routing by
+#   tag/prefix with lib/PayloadDispatch.py, per payload for good payloads
+#   (methods, face indexes, tagged) & bad ones (truncated, garbage, chunks of
+#   interrupted sends). Exceptions cost relatively more on CircuitPython than
+#   on the host, so the bad payload ratio here is a lower bound
+#
+# Usage: python HostSimulation/bench_payloadDispatch.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, random, sys, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.ChannelSelect import decodeHopSequence, encodeHopSequence
+from lib.DeltaState import decodeDelta
+from lib.PayloadDispatch import PayloadDispatcher, KIND_HOP, KIND_CONFIG, KIND_TELEMETRY, KIND_DELTA, \
+    KIND_METHOD, KIND_FACE, TELEMETRY_TAG
+from lib.RemoteConfig import decodeConfigPatch, encodeConfigPatch
+from lib.RemoteLink import PROBE_PAYLOAD
+
+NUM_ROUNDS = 200
+NUM_REPEATS = 7 # best of, alternating between the paths
+
+
+def decodeTelemetry(payload):
+    # lib/EnergyMonitor.py's, which needs supervisor
+    return payload[len(TELEMETRY_TAG):] if payload.startswith(TELEMETRY_TAG) else None
+
+
+### Stand-in for ColorMethod.parse (lib/ColorDescriptors): raises on anything it can't read
+def parseMethod(text):
+    if not text.startswith("ColorMethod(") or not text.endswith(")"):
+        raise ValueError("not a ColorMethod")
+    mode, _, color = text[len("ColorMethod("):-1].partition(",")
+    if not color.startswith("ColorSolid("):
+        raise ValueError("unknown color")
+    return mode, tuple(float(v) for v in color[len("ColorSolid("):-1].split(","))
+
+
+def solid(hue):
+    return "ColorMethod(Stationary,ColorSolid({:.1f},1.0,1.0))".format(hue)
+
+
+def oldPath(payload):
+    """
+    The receiver before: returns what it ended up as
+    """
+    if decodeHopSequence(payload) is not None:
+        return "hop"
+    if decodeConfigPatch(payload) is not None:
+        return "config"
+    if decodeTelemetry(payload) is not None:
+        return "telemetry"
+    if decodeDelta(payload) is not None:
+        return "delta"
+    try:
+        parseMethod(payload)
+        return "method"
+    except:
+        try:
+            float(payload)
+            return "face"
+        except:
+            pass
+    return None
+
+
+dispatcher = None # set in main()
+
+def newPath(payload):
+    kind = dispatcher.classify(payload)
+    if kind == KIND_HOP:
+        return "hop" if decodeHopSequence(payload) is not None else None
+    elif kind == KIND_CONFIG:
+        return "config" if decodeConfigPatch(payload) is not None else None
+    elif kind == KIND_TELEMETRY:
+        return "telemetry"
+    elif kind == KIND_DELTA:
+        return "delta" if decodeDelta(payload) is not None else None
+    elif kind == KIND_METHOD:
+        try:
+            parseMethod(payload)
+            return "method"
+        except Exception:
+            dispatcher.reject(kind)
+            return None
+    elif kind == KIND_FACE:
+        float(payload)
+        return "face"
+    return None
+
+
+def payloadSets(seed=1):
+    rng = random.Random(seed)
+    methods = [solid(h) for h in range(0, 360, 60)]
+    good = methods + ["1", "4", "6.0", encodeHopSequence([2, 40, 76, 110]).decode(), encodeConfigPatch("brightness", "0.3"),
+                      "#TL3.7V 84% 412uAh", "#DT1a2b3c4dcolor.2=0.5", PROBE_PAYLOAD.decode()]
+    bad = []
+    for method in methods:
+        bad.append(method[: rng.randrange(5, len(method) - 1)]) # truncated
+        bad.append(method[rng.randrange(1, len(method) - 5):]) # tail chunk of a multi-packet send
+    for _ in range(len(methods)):
+        bad.append("".join(chr(rng.randrange(32, 127)) for _ in range(rng.randrange(1, 32)))) # garbage
+    return good, bad
+
+
+def timePerPayload(fn, payloads):
+    start = time.perf_counter()
+    for _ in range(NUM_ROUNDS):
+        for payload in payloads:
+            fn(payload)
+    return (time.perf_counter() - start) * 1e6 / (NUM_ROUNDS * len(payloads))
+
+
+def bestTimes(payloads):
+    """
+    Best time per payload of each path over NUM_REPEATS alternating runs
+    """
+    old = new = float("inf")
+    for _ in range(NUM_REPEATS):
+        old = min(old, timePerPayload(oldPath, payloads))
+        new = min(new, timePerPayload(newPath, payloads))
+    return old, new
+
+
+def main():
+    global dispatcher
+    good, bad = payloadSets()
+    dispatcher = PayloadDispatcher(solid(0))
+
+    # Both paths accept & refuse the same payloads (the probe: neither acts on it)
+    for payload in good + bad:
+        assert oldPath(payload) == newPath(payload), payload
+    print("Same result for all {} good & {} bad payloads".format(len(good), len(bad)))
+
+    print("{:<14} {:>10} {:>10} {:>8}".format("us/payload", "try/except", "dispatch", "speedup"))
+    rows = (("good", good), ("good w/o probe", good[:-1]), ("methods only", good[:6]), ("bad", bad),
+            ("90% good", good * 9 + bad))
+    for name, payloads in rows:
+        old, new = bestTimes(payloads)
+        print("{:<14} {:>10.2f} {:>10.2f} {:>7.1f}x".format(name, old, new, old / new))
+    print("Dispatcher: {}".format(dispatcher.report()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# Host Simulation - ACK-payload state echo
+#   compares plain autosends against probing the receiver's echoed state
+#
+# Usage: python HostSimulation/sim_ackEcho.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys, random
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.RemoteLink import AckEcho, EchoTracker, SendCapture, sendWith, PROBE_PAYLOAD
+from SimRF24 import SimLink, SimRF24, sendChunked, ChunkReceiver
+
+# Stand-ins for the six `ColorMethod.toString()` payloads of the transmitter
+FACE_PAYLOADS = [
+    "ColorMethod(Stationary,ColorSolid(hue={:.1f},sat=1.0,val=1.0,rgb={}))".format(hue, rgb)
+    for hue, rgb in ((0, "255,0,0"), (60, "255,255,0"), (120, "0,255,0"),
+                     (180, "0,255,255"), (240, "0,0,255"), (300, "255,0,255"))
+]
+
+# Same timers as main_remoteTransmit_SparkfunPlus.py
+updateTime_changes = 0.01
+updateTime_autosend = 1.0
+updateTime_confirm = 0.05
+maxConfirmRetries = 3
+
+
+def runScenario(useAckEcho, lossRate, duration=3600, meanFlipTime=20.0, seed=1):
+    """
+    Runs the transmit/receive pair for `duration` virtual seconds
+    """
+    link = SimLink(lossRate=lossRate, seed=seed)
+    clock = link.clock
+    tx = SimRF24(link, "tx")
+    rx = SimRF24(link, "rx")
+    tx.open_tx_pipe(b"1Node")
+    tx.open_rx_pipe(1, b"2Node")
+    rx.open_tx_pipe(b"2Node")
+    rx.open_rx_pipe(1, b"1Node")
+    rx.listen = True
+
+    # Receiver: apply full payloads, echo them back when enabled
+    state = {"applied": None, "parses": 0}
+    echo = AckEcho(rx, 1) if useAckEcho else None
+    def onPayload(payload):
+        if payload == PROBE_PAYLOAD:
+            return
+        state["parses"] += 1
+        state["applied"] = payload.decode()
+        if useAckEcho: echo.update(payload)
+    receiver = ChunkReceiver(rx, onPayload)
+    def service():
+        receiver.poll()
+        if useAckEcho: echo.refill()
+    rx.service = service
+
+    # Transmitter: same send decisions as the main loop
+    tracker = EchoTracker(tx, send=sendChunked) if useAckEcho else None
+    if not useAckEcho: tx.ack = False
+    rng = random.Random(seed)
+    faceIdx = 0
+    nextFlip = 0
+    timeCheck_autosend = 0
+    confirmRetries = 0
+    staleTime = 0
+    flipTime = None
+    latencies = []
+    while clock.monotonic() < duration:
+        now = clock.monotonic()
+        detectedChanges = False
+        if now >= nextFlip:
+            faceIdx = rng.choice([f for f in range(6) if f != faceIdx])
+            nextFlip = now + rng.expovariate(1 / meanFlipTime)
+            detectedChanges = True
+            flipTime = now
+        curPayload = FACE_PAYLOADS[faceIdx]
+
+        updateTime_send = updateTime_confirm if confirmRetries else updateTime_autosend
+        if detectedChanges or now - timeCheck_autosend > updateTime_send:
+            timeCheck_autosend = now
+            needsSend = True
+            if useAckEcho and not detectedChanges:
+                tracker.expect(curPayload)
+                needsSend = not tracker.probe()
+                confirmRetries = confirmRetries - 1 if needsSend and confirmRetries else 0
+            elif useAckEcho:
+                confirmRetries = maxConfirmRetries
+            if needsSend:
+                sendChunked(tx, curPayload)
+
+        if state["applied"] == curPayload and flipTime is not None:
+            latencies.append(clock.monotonic() - flipTime)
+            flipTime = None
+        if state["applied"] != curPayload:
+            staleTime += updateTime_changes
+        clock.sleep(updateTime_changes)
+
+    latencies.sort()
+    return {
+        "packets": link.numPackets,
+        "airTime": link.airTime_us / 1e6,
+        "parses": state["parses"],
+        "stale": staleTime,
+        "median": latencies[len(latencies) // 2] if latencies else float("nan"),
+        "worst": latencies[-1] if latencies else float("nan"),
+    }
+
+
+def checkSendCapture():
+    """
+    A framing library's send function gets a SendCapture instead of the
+    radio: what it sets on it has to reach the radio, & the ACK payload of
+    its send() has to come back. Returns the failed checks
+    """
+    link = SimLink(seed=1)
+    tx = SimRF24(link, "tx")
+    rx = SimRF24(link, "rx")
+    tx.open_tx_pipe(b"1Node")
+    rx.open_rx_pipe(1, b"1Node")
+    rx.channel = 90
+    rx.listen = True
+    echo = AckEcho(rx, 1)
+    echo.update(FACE_PAYLOADS[0])
+    echo.refill()
+    rx.service = rx.flush_rx
+    def librarySend(radio, payload):
+        radio.listen = False # what a library does around its sends
+        radio.power = True
+        radio.channel = 90
+        radio.ack = True
+        sendChunked(radio, payload)
+    tx.listen = True
+    capture = SendCapture(tx)
+    result = sendWith(librarySend, capture, PROBE_PAYLOAD)
+    failed = []
+    if tx.listen or not tx.power or tx.channel != 90 or not tx.ack:
+        failed.append("writes don't reach the radio")
+    tx.channel = 76
+    if capture.channel != 76:
+        failed.append("reads are stale")
+    tracker = EchoTracker(tx)
+    tracker.expect(FACE_PAYLOADS[0])
+    if not tracker.matches(result):
+        failed.append("no ACK payload")
+    return failed
+
+
+def main():
+    failed = checkSendCapture()
+    print("SendCapture: {}".format("ok" if not failed else "failed: " + ", ".join(failed)))
+    print("Virtual hour, one flip every ~20 s on average")
+    print("{:>6} {:>5} {:>9} {:>10} {:>8} {:>9} {:>11} {:>10}".format(
+        "loss", "echo", "packets", "air (s)", "parses", "stale (s)", "median (ms)", "worst (ms)"))
+    for lossRate in (0.0, 0.05, 0.2):
+        for useAckEcho in (False, True):
+            r = runScenario(useAckEcho, lossRate)
+            print("{:>5.0f}% {:>5} {:>9} {:>10.3f} {:>8} {:>9.2f} {:>11.1f} {:>10.1f}".format(
+                lossRate * 100, "on" if useAckEcho else "off", r["packets"], r["airTime"],
+                r["parses"], r["stale"], r["median"] * 1e3, r["worst"] * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Host Simulation - multi-transmitter arbitration
+#   six controllers hammer one receiver at once, one per rx pipe
+#
+# Usage: python HostSimulation/sim_arbitration.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys, random, time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.RemoteLink import (FrameSender, PipeArbiter, controllerAddress,
+    MAX_CONTROLLERS, POLICY_PRIORITY, POLICY_LAST_WRITER)
+from SimRF24 import SimLink, SimRF24
+
+
+class TimedArbiter(PipeArbiter):
+    """
+    Records how long every decision took, in host & virtual time
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frameStart = {} # (controller, seq) -> virtual ns of its first packet
+        self.virtualLatency = []
+
+    def decide(self, idx, seq, now):
+        start = self.frameStart.pop((idx, seq), None)
+        if start is not None:
+            self.virtualLatency.append(now - start)
+        return super().decide(idx, seq, now)
+
+
+def runScenario(policy, numFrames=500, lossRate=0.02, seed=1):
+    link = SimLink(lossRate=lossRate, seed=seed)
+    clock = link.clock
+    rng = random.Random(seed)
+
+    rx = SimRF24(link, "rx")
+    arbiter = TimedArbiter(rx, MAX_CONTROLLERS, policy, holdTime=0.05, clock=clock)
+    rx.listen = True
+    hostTime = [0, 0] # total seconds in poll(), number of polls that decided
+    applied = []
+    def service():
+        start = time.perf_counter()
+        payload = arbiter.poll()
+        hostTime[0] += time.perf_counter() - start
+        if payload is not None:
+            hostTime[1] += 1
+            applied.append(payload)
+    rx.service = service
+
+    senders = []
+    for idx in range(MAX_CONTROLLERS):
+        tx = SimRF24(link, "ctrl{}".format(idx))
+        tx.open_tx_pipe(controllerAddress(idx))
+        senders.append(FrameSender(tx))
+
+    # Every controller streams frames, interleaved packet by packet
+    streams = [None] * MAX_CONTROLLERS
+    sentFrames = 0
+    while sentFrames < numFrames * MAX_CONTROLLERS:
+        for idx, sender in enumerate(senders):
+            if streams[idx] is None:
+                payload = "ctrl{}:".format(idx) + "x" * rng.randint(4, 80)
+                streams[idx] = sender.packets(payload)
+                arbiter.frameStart[(idx, (sender.seq + 1) & 0xFF)] = clock.monotonic_ns()
+            packet = next(streams[idx], None)
+            if packet is None:
+                streams[idx] = None
+                sentFrames += 1
+                continue
+            sender.numPackets += 1
+            sender.nrf.send(packet)
+        # random gaps, the controllers aren't running in lockstep
+        clock.advance_us(rng.randint(0, 200))
+
+    numPackets = sum(a.numPackets for a in arbiter.assemblers)
+    latency = sorted(arbiter.virtualLatency)
+    return {
+        "arbiter": arbiter,
+        "packets": numPackets,
+        "decisions": len(latency),
+        "applied": len(applied),
+        "rate": numPackets / hostTime[0] if hostTime[0] else float("inf"),
+        "hostPerDecision": hostTime[0] / max(1, len(latency)) * 1e6,
+        "medianLatency": latency[len(latency) // 2] / 1e6 if latency else float("nan"),
+        "worstLatency": latency[-1] / 1e6 if latency else float("nan"),
+        "virtualTime": clock.monotonic(),
+    }
+
+
+def main():
+    for policy, name in ((POLICY_PRIORITY, "priority"), (POLICY_LAST_WRITER, "last-writer-wins")):
+        r = runScenario(policy)
+        print("Policy: {}".format(name))
+        print("  {} packets in {:.2f} virtual s, {} decisions, {} applied".format(
+            r["packets"], r["virtualTime"], r["decisions"], r["applied"]))
+        print("  receiver processing rate: {:.0f} packets/s (host), {:.1f} us per decision".format(
+            r["rate"], r["hostPerDecision"]))
+        print("  decision latency (first packet -> decision): median {:.2f} ms, worst {:.2f} ms".format(
+            r["medianLatency"], r["worstLatency"]))
+        print("  " + r["arbiter"].toString().replace("\n", "\n  "))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# Host Simulation - beacon-aligned listening
+#   the receiver listening continuously (polling every 10 ms) vs only in
+#   short windows around the transmitter's beacon grid (lib/RadioPower.py):
+#   listen duty cycle, radio charge & how much later flips get displayed,
+#   with drifting crystals, loop jitter, packet loss & a transmitter restart
+#
+# Usage: python HostSimulation/sim_beaconListen.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, random, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.RadioPower import BeaconClock, BeaconListener, SETTLE_TIME, STARTUP_MA, POWER_DOWN_MA, RX_MA
+from SimRF24 import SimLink, SimRF24
+
+SIM_TIME = 3600 # s
+FLIP_INTERVAL = 20.0 # s, mean time between flips
+DRIFT_PPM = 60 # transmitter's clock vs the receiver's (both crystals off by a few tens of ppm)
+TX_LOOP_US = (500, 6000) # transmitter's main loop iteration, min/max (face updates, sensor reads)
+RX_LOOP_US = 1000 # receiver's loop iteration while listening in windows
+RX_POLL_US = 10000 # updateTime_receive, continuous listening
+RESTART = (1800.0, 1810.0) # transmitter off (battery swap), back with a new beacon phase
+AUTOSEND = 1.0 # s, updateTime_autosend
+
+
+class DriftClock:
+    """
+    The transmitter's view of the (receiver's) virtual time
+    """
+    def __init__(self, clock, ppm):
+        self.clock = clock
+        self.scale = 1 + ppm * 1e-6
+
+    def monotonic_ns(self):
+        return int(self.clock.now_ns * self.scale)
+
+
+def flipTimes(seed):
+    rng = random.Random(seed)
+    times = []
+    now = rng.expovariate(1 / FLIP_INTERVAL)
+    while now < SIM_TIME:
+        if not RESTART[0] <= now < RESTART[1]:
+            times.append(now)
+        now += rng.expovariate(1 / FLIP_INTERVAL)
+    return times
+
+
+def runScenario(useBeacons, period=AUTOSEND, lossRate=0.05, seed=1):
+    link = SimLink(lossRate=lossRate, seed=seed)
+    clock = link.clock
+    tx = SimRF24(link, "tx")
+    rx = SimRF24(link, "rx")
+    tx.open_tx_pipe(b"1Node")
+    rx.open_rx_pipe(1, b"1Node")
+    rng = random.Random(seed)
+    txClock = DriftClock(clock, DRIFT_PPM)
+    flips = flipTimes(seed)
+
+    # Transmitter: the current state is the number of flips so far, sent on
+    # every change (continuous) or at the next beacon (beacons)
+    beacons = BeaconClock(period, clock=txClock) if useBeacons else None
+    txState = 0
+    lastSend = 0
+    pending = False
+    nextTx = 0
+    txOff = False
+
+    # Receiver
+    listener = BeaconListener(rx, period, clock=clock) if useBeacons else None
+    if not useBeacons:
+        rx.listen = True
+    rxState = 0
+    latencies = []
+    merged = 0
+    nextRx = 0
+    listening = True
+
+    while clock.now_ns < SIM_TIME * 1e9:
+        if nextTx <= nextRx:
+            if clock.now_ns < nextTx:
+                clock.advance(nextTx - clock.now_ns)
+            now = clock.now_ns / 1e9
+            nextTx = clock.now_ns + 1000 * rng.randint(*TX_LOOP_US)
+            if RESTART[0] <= now < RESTART[1]:
+                txOff = True
+                continue
+            if txOff: # powered back up, new beacon phase
+                txOff = False
+                beacons = BeaconClock(period, clock=txClock) if useBeacons else None
+                pending = True
+            while txState < len(flips) and flips[txState] <= now:
+                txState += 1
+                pending = True
+            if useBeacons:
+                send = beacons.due()
+            else:
+                send = pending or clock.now_ns - lastSend > period * 1e9
+            if send:
+                lastSend = clock.now_ns
+                if tx.send(str(txState).encode()):
+                    pending = False
+        else:
+            if clock.now_ns < nextRx:
+                clock.advance(nextRx - clock.now_ns)
+            if useBeacons:
+                listening = listener.update()
+                nextRx = clock.now_ns + 1000 * RX_LOOP_US
+            else:
+                nextRx = clock.now_ns + 1000 * RX_POLL_US
+            while listening and rx.available():
+                state = int(rx.read().decode())
+                if useBeacons:
+                    listener.heard()
+                if state > rxState:
+                    latencies.append(clock.now_ns / 1e9 - flips[state - 1])
+                    merged += state - rxState - 1 # flips that never got displayed, a later one came first
+                    rxState = state
+
+    hours = clock.now_ns / 3.6e12
+    if useBeacons:
+        duty = listener.dutyCycle()
+        startups = listener.numWindows + listener.numResyncs
+    else:
+        duty = 1.0
+        startups = 1
+    # uAh/h: listening, powered down the rest, crystal start-ups
+    charge = (duty * RX_MA + (1 - duty) * POWER_DOWN_MA) * 1000 + startups / hours * SETTLE_TIME * STARTUP_MA * 1000 / 3600
+    latencies.sort()
+    return {
+        "duty": duty,
+        "charge": charge,
+        "delivered": len(latencies),
+        "merged": merged,
+        "flips": len(flips),
+        "mean": 1000 * sum(latencies) / max(1, len(latencies)),
+        "p95": 1000 * latencies[int(0.95 * len(latencies))] if latencies else float("nan"),
+        "report": listener.report() if useBeacons else "",
+        "resyncs": listener.numResyncs if useBeacons else 0,
+    }
+
+
+def main():
+    print("An hour of flips every {:.0f} s on average, {}% packet loss, transmitter clock {:+d} ppm, "
+          "transmitter off from {:.0f} to {:.0f} s".format(FLIP_INTERVAL, 5, DRIFT_PPM, *RESTART))
+    print("{:<23} {:>9} {:>9} {:>10} {:>7} {:>11} {:>7}".format(
+        "receiver", "listening", "uAh/h", "displayed", "merged", "latency ms", "p95 ms"))
+    baseline = runScenario(False)
+    rows = [("continuous (10 ms poll)", baseline)]
+    for period in (1.0, 0.5, 0.25):
+        rows.append(("beacons every {:.2f} s".format(period), runScenario(True, period)))
+    for name, result in rows:
+        print("{:<23} {:>8.2f}% {:>9.1f} {:>5}/{:<4} {:>7} {:>11.0f} {:>7.0f}".format(
+            name, 100 * result["duty"], result["charge"], result["delivered"], result["flips"],
+            result["merged"], result["mean"], result["p95"]))
+        if result["report"]:
+            print("  {} | added latency {:+.0f} ms mean, {:.0f}x less radio charge".format(
+                result["report"], result["mean"] - baseline["mean"], baseline["charge"] / result["charge"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Host Simulation - one-to-many broadcast
+#   delivery rate & air time as more receivers share the transmitter's address,
+#   & config patches reaching receivers in broadcast mode
+#
+# Usage: python HostSimulation/sim_broadcast.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.RemoteConfig import RemoteConfig, encodeConfigPatch, decodeConfigPatch
+from lib.RemoteLink import BroadcastSender, BroadcastReceiver, GROUP_ALL
+from SimRF24 import SimLink, SimRF24, sendChunked, ChunkReceiver
+
+PAYLOADS = [
+    "ColorMethod(Stationary,ColorSolid(hue={:.1f},sat=1.0,val=1.0))".format(hue)
+    for hue in (0, 60, 120, 180, 240, 300)
+]
+
+
+def runScenario(numReceivers, redundancy, lossRate=0.05, numPayloads=200, seed=1):
+    """
+    Sends `numPayloads` payloads, redundancy=0 means unicast w/ auto-ack
+    """
+    link = SimLink(lossRate=lossRate, seed=seed)
+    tx = SimRF24(link, "tx")
+    received = [0] * numReceivers
+    expected = [None]
+    for idx in range(numReceivers):
+        rx = SimRF24(link, "rx{}".format(idx))
+        rx.open_rx_pipe(1, b"1Node")
+        rx.listen = True
+        def onPayload(payload, idx=idx):
+            if payload in (expected[0], expected[0].encode()):
+                received[idx] += 1
+        if redundancy:
+            bcast = BroadcastReceiver(rx, (GROUP_ALL,))
+            def service(bcast=bcast, onPayload=onPayload):
+                payload = bcast.poll()
+                if payload is not None: onPayload(payload)
+            rx.service = service
+        else:
+            rx.service = ChunkReceiver(rx, onPayload).poll
+
+    if redundancy:
+        sender = BroadcastSender(tx, GROUP_ALL, redundancy)
+    else:
+        tx.open_tx_pipe(b"1Node")
+    for num in range(numPayloads):
+        expected[0] = PAYLOADS[num % len(PAYLOADS)]
+        if redundancy:
+            sender.send(expected[0])
+        else:
+            sendChunked(tx, expected[0])
+        link.clock.sleep(0.01)
+    return {
+        "delivery": sum(received) / (numReceivers * numPayloads),
+        "airTime": link.airTime_us / numPayloads / 1000,
+        "packets": link.numPackets / numPayloads,
+        "failedSends": tx.numFailedSends,
+    }
+
+
+def runConfigPatch(numReceivers, framed, lossRate=0.05, seed=1):
+    """
+    Sends a brightness patch to the group, framed by the BroadcastSender
+    (sendExtra() now) or as plain chunks (sendPayload, before). Returns the
+    number of receivers that applied it
+    """
+    link = SimLink(lossRate=lossRate, seed=seed)
+    tx = SimRF24(link, "tx")
+    configs = []
+    for idx in range(numReceivers):
+        rx = SimRF24(link, "rx{}".format(idx))
+        rx.open_rx_pipe(1, b"1Node")
+        rx.listen = True
+        config = RemoteConfig()
+        configs.append(config)
+        bcast = BroadcastReceiver(rx, (GROUP_ALL,))
+        def service(bcast=bcast, config=config):
+            payload = bcast.poll()
+            patch = decodeConfigPatch(payload) if payload is not None else None
+            if patch is not None:
+                config.set(*patch)
+        rx.service = service
+
+    sender = BroadcastSender(tx, GROUP_ALL, 3)
+    patch = encodeConfigPatch("brightness", "0.3")
+    if framed:
+        sender.send(patch)
+    else:
+        sendChunked(tx, patch)
+    link.clock.sleep(0.01)
+    return sum(1 for config in configs if config.brightness == 0.3)
+
+
+def main():
+    print("200 payloads, 5% independent loss per receiver")
+    print("{:>9} {:>10} {:>9} {:>15} {:>13}".format(
+        "receivers", "mode", "delivery", "air/payload(ms)", "packets/payload"))
+    for numReceivers in (1, 2, 5, 10, 20):
+        for redundancy in (0, 1, 2, 3):
+            r = runScenario(numReceivers, redundancy)
+            mode = "unicast" if not redundancy else "bcast x{}".format(redundancy)
+            print("{:>9} {:>10} {:>8.1f}% {:>15.2f} {:>15.1f}".format(
+                numReceivers, mode, r["delivery"] * 100, r["airTime"], r["packets"]))
+    print()
+    print("Brightness patch to 10 receivers in broadcast mode (bcast x3):")
+    for name, framed in (("sendPayload", False), ("BroadcastSender", True)):
+        print("  {:<16} applied by {} of 10".format(name, runConfigPatch(10, framed)))
+
+
+if __name__ == "__main__":
+    main()
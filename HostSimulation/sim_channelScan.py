@@ -0,0 +1,118 @@
+# Host Simulation - channel scan & automatic channel selection
+#   scans a simulated (busy) spectrum, agrees on a hop sequence & follows it
+#   when interference shows up on the channel in use
+#
+# Usage: python HostSimulation/sim_channelScan.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.ChannelSelect import (scanChannels, quietestChannels, printHistogram,
+    decodeHopSequence, announceHopSequence, ChannelHopper, DEFAULT_CHANNEL)
+from lib.RemoteLink import PROBE_PAYLOAD
+from SimRF24 import SimLink, SimRF24, sendChunked, ChunkReceiver
+
+SWEEPS = 20
+
+
+def makeSpectrum():
+    """
+    Wifi channels 1, 6 & 11 (22 MHz wide) plus another nRF24 pair sitting on
+    the default channel
+    """
+    spectrum = [0.0] * 126
+    for centre, duty in ((12, 0.5), (37, 0.3), (62, 0.6)):
+        for channel in range(centre - 11, centre + 12):
+            spectrum[channel] = max(spectrum[channel], duty * (1 - abs(channel - centre) / 14))
+    for channel in range(DEFAULT_CHANNEL - 1, DEFAULT_CHANNEL + 2):
+        spectrum[channel] = 0.4
+    return spectrum
+
+
+def makePair(link):
+    tx = SimRF24(link, "tx")
+    rx = SimRF24(link, "rx")
+    tx.open_tx_pipe(b"1Node")
+    rx.open_rx_pipe(1, b"1Node")
+    rx.listen = True
+    return tx, rx
+
+
+def sendStats(tx, numSends=1000):
+    start = (tx.numFailedSends, tx.numRetries)
+    for _ in range(numSends):
+        tx.send(PROBE_PAYLOAD)
+        tx.link.clock.sleep(0.001)
+    return ((numSends - (tx.numFailedSends - start[0])) / numSends,
+            (tx.numRetries - start[1]) / numSends)
+
+
+def main():
+    link = SimLink(seed=1)
+    link.spectrum = makeSpectrum()
+    clock = link.clock
+    tx, rx = makePair(link)
+
+    # Scan
+    start = clock.monotonic()
+    histogram = scanChannels(tx, sweeps=SWEEPS, clock=clock)
+    channels = quietestChannels(histogram)
+    print("Occupancy after {} sweeps ({:.2f} s of scanning):".format(SWEEPS, clock.monotonic() - start))
+    printHistogram(histogram, SWEEPS, columns=3)
+    print("Hop sequence: {}".format(channels))
+
+    # Default channel vs the quietest one
+    rx.service = rx.flush_rx
+    for channel in (DEFAULT_CHANNEL, channels[0]):
+        tx.channel = rx.channel = channel
+        delivery, retries = sendStats(tx)
+        print("Channel {:3d}: {:.1f}% delivered, {:.2f} retries per send".format(channel, delivery * 100, retries))
+
+    # Agree on the sequence, then jam the primary channel 2 minutes in
+    tx.channel = rx.channel = DEFAULT_CHANNEL
+    txHopper = ChannelHopper(tx, clock=clock)
+    rxHopper = ChannelHopper(rx, clock=clock)
+    def onPayload(payload):
+        rxHopper.heard()
+        hops = decodeHopSequence(payload)
+        if hops is not None:
+            rxHopper.setSequence(hops)
+    rx.service = ChunkReceiver(rx, onPayload).poll
+    print("Announcement acknowledged: {}".format(announceHopSequence(tx, txHopper, channels, send=sendChunked)))
+
+    jamAt = clock.monotonic() + 120
+    jammed = False
+    delivered = 0
+    numSends = 0
+    outageStart = None
+    outages = []
+    while clock.monotonic() < jamAt + 480:
+        if not jammed and clock.monotonic() >= jamAt:
+            jammed = True
+            for channel in range(channels[0] - 2, channels[0] + 3):
+                link.spectrum[channel] = 0.95
+            print("t={:.0f}s: jamming channel {}".format(clock.monotonic(), channels[0]))
+        ok = tx.send(PROBE_PAYLOAD)
+        numSends += 1
+        if ok:
+            delivered += 1
+            if outageStart is not None:
+                outages.append(clock.monotonic() - outageStart)
+                print("t={:.0f}s: link back on channel {} after {:.1f} s".format(
+                    clock.monotonic(), txHopper.channel, outages[-1]))
+                outageStart = None
+        elif outageStart is None:
+            outageStart = clock.monotonic()
+        txHopper.recordSend(ok)
+        for _ in range(100): # the receiver polls every 10 ms between autosends
+            rxHopper.checkSilence()
+            clock.sleep(0.01)
+    print("{} of {} autosends delivered, transmitter hops: {}, receiver hops: {}".format(
+        delivered, numSends, txHopper.numHops, rxHopper.numHops))
+
+
+if __name__ == "__main__":
+    main()
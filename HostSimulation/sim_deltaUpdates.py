@@ -0,0 +1,223 @@
+# Host Simulation - delta updates
+#   full ColorMethod payloads vs deltas against the receiver's confirmed
+#   state (lib/DeltaState.py) for face flips, brightness steps & single hue
+#   stop tweaks of a gradient: packets, payload bytes, how long the receiver
+#   shows a stale state & whether its in-place patched method ever differs
+#   from what the transmitter meant
+#
+# Usage: python HostSimulation/sim_deltaUpdates.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import colorsys, copy, os, random, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.DeltaState import DeltaEncoder, decodeDelta, applyDelta, undoDelta
+from lib.RemoteLink import AckEcho, EchoTracker, PROBE_PAYLOAD, stateDigest
+from SimRF24 import SimLink, SimRF24, sendChunked, ChunkReceiver
+
+# Same timers as main_remoteTransmit_SparkfunPlus.py
+updateTime_changes = 0.01
+updateTime_autosend = 1.0
+updateTime_confirm = 0.05
+maxConfirmRetries = 3
+
+NUM_SEEDS = 4 # summed, at 20% loss a single long outage decides one seed
+
+
+### Stand-ins for lib/ColorDescriptors (attributes & a toString() of the same shape)
+class ColorSolid:
+    def __init__(self, hue=0.0, sat=1.0, val=1.0):
+        self.hue = float(hue)
+        self.sat = float(sat)
+        self.val = float(val)
+        r, g, b = colorsys.hsv_to_rgb((hue % 360) / 360, sat, val)
+        self.red, self.green, self.blue = int(r * 255), int(g * 255), int(b * 255)
+
+    def toString(self):
+        return "ColorSolid(hue={:.1f},sat={:.1f},val={:.2f},rgb={},{},{})".format(
+            self.hue, self.sat, self.val, self.red, self.green, self.blue)
+
+
+class ColorGradient:
+    def __init__(self, colors, loop=0):
+        self.colors = colors
+        self.loop = loop
+
+    def toString(self):
+        return "ColorGradient([{}],{})".format(",".join(c.toString() for c in self.colors), self.loop)
+
+
+class ColorMethod:
+    def __init__(self, mode, color):
+        self.mode = mode
+        self.color = color
+
+    def toString(self):
+        return "ColorMethod({},{})".format(self.mode, self.color.toString())
+
+
+RAINBOW_HUES = (0, 60, 120, 180, 240, 300, 360)
+VALUES = (0.05, 0.1, 0.3, 0.6, 1.0)
+
+
+def makeMethod(face, valIdx, stopHue):
+    """
+    Faces 1-5 are solids at hue (face-1)*60, face 6 the rainbow gradient with
+    its fourth stop at `stopHue`; all at brightness VALUES[valIdx]
+    """
+    val = VALUES[valIdx]
+    if face < 6:
+        return ColorMethod("Stationary", ColorSolid((face - 1) * 60, 1.0, val))
+    hues = list(RAINBOW_HUES)
+    hues[3] = stopHue
+    return ColorMethod("Stationary", ColorGradient([ColorSolid(h, 1.0, val) for h in hues]))
+
+
+def runScenario(useDeltas, lossRate, duration=3600, meanChangeTime=10.0, seed=1):
+    link = SimLink(lossRate=lossRate, seed=seed)
+    clock = link.clock
+    tx = SimRF24(link, "tx")
+    rx = SimRF24(link, "rx")
+    tx.open_tx_pipe(b"1Node")
+    tx.open_rx_pipe(1, b"2Node")
+    rx.open_tx_pipe(b"2Node")
+    rx.open_rx_pipe(1, b"1Node")
+    rx.listen = True
+    methods = {} # payload -> method, what ColorMethod.parse() would build
+
+    # Receiver: full payloads replace the method, deltas patch it in place
+    echo = AckEcho(rx, 1)
+    state = {"method": None, "rejected": 0, "garbled": 0}
+    def onPayload(payload):
+        if payload == PROBE_PAYLOAD:
+            return
+        payload = payload.decode()
+        delta = decodeDelta(payload)
+        if delta is not None:
+            base, target, changes = delta
+            undo = []
+            if state["method"] is not None and base == echo.digest and applyDelta(state["method"], changes, undo):
+                if stateDigest(state["method"].toString()) == target:
+                    echo.setDigest(target)
+                else:
+                    undoDelta(undo) # as the receiver: keep showing & echoing the base
+                    state["rejected"] += 1
+            else:
+                state["rejected"] += 1 # the echo still says base, the transmitter sends a keyframe
+            return
+        if payload not in methods:
+            state["garbled"] += 1 # chunks of an interrupted send mixed in, parse() would fail
+            return
+        state["method"] = copy.deepcopy(methods[payload])
+        echo.update(payload)
+    receiver = ChunkReceiver(rx, onPayload)
+    def service():
+        receiver.poll()
+        echo.refill()
+    rx.service = service
+
+    # Transmitter
+    tracker = EchoTracker(tx, send=sendChunked)
+    encoder = DeltaEncoder()
+    rng = random.Random(seed)
+    face, valIdx, stopHue = 1, 4, RAINBOW_HUES[3]
+    nextChange = 0
+    timeCheck_autosend = 0
+    confirmRetries = 0
+    staleTime = 0
+    wrongTime = 0 # receiver echoing the right digest with a different state
+    payloadBytes = 0
+    curPayload = None
+    while clock.monotonic() < duration:
+        now = clock.monotonic()
+        detectedChanges = False
+        if now >= nextChange:
+            kind = rng.random()
+            if kind < 0.4: # flip
+                face = rng.choice([f for f in range(1, 7) if f != face])
+            elif kind < 0.7: # brightness step (tap)
+                valIdx = (valIdx + 1) % len(VALUES)
+            else: # one hue stop (on a solid: its hue)
+                face = 6 if rng.random() < 0.5 else face
+                stopHue = rng.choice([h for h in range(150, 215, 5) if h != stopHue])
+            method = makeMethod(face, valIdx, stopHue)
+            curPayload = method.toString()
+            if curPayload not in methods:
+                methods[curPayload] = method
+                encoder.add(method, curPayload)
+            nextChange = now + rng.expovariate(1 / meanChangeTime)
+            detectedChanges = True
+
+        updateTime_send = updateTime_confirm if confirmRetries else updateTime_autosend
+        if detectedChanges or now - timeCheck_autosend > updateTime_send:
+            timeCheck_autosend = now
+            needsSend = True
+            if not detectedChanges:
+                tracker.expect(curPayload)
+                needsSend = not tracker.probe()
+                if useDeltas and tracker.lastSendOk:
+                    encoder.confirm(curPayload, not needsSend)
+                confirmRetries = confirmRetries - 1 if needsSend and confirmRetries else 0
+            else:
+                confirmRetries = maxConfirmRetries
+            if needsSend:
+                text = encoder.encode(curPayload) if useDeltas else curPayload
+                payloadBytes += len(text)
+                sendChunked(tx, text)
+
+        shown = state["method"].toString() if state["method"] is not None else None
+        if shown != curPayload:
+            staleTime += updateTime_changes
+        if echo.digest == stateDigest(curPayload) and shown != curPayload:
+            wrongTime += updateTime_changes
+        clock.sleep(updateTime_changes)
+
+    return {
+        "packets": link.numPackets,
+        "data": link.numPackets - tracker.numProbes, # payload packets incl. retransmits (roughly)
+        "bytes": payloadBytes,
+        "stale": staleTime,
+        "wrong": wrongTime,
+        "rejected": state["rejected"],
+        "garbled": state["garbled"],
+        "encoder": encoder.toString() if useDeltas else "",
+    }
+
+
+def runSeeds(useDeltas, lossRate):
+    """
+    runScenario() summed over NUM_SEEDS seeds (the encoder report is seed 1's)
+    """
+    total = None
+    for seed in range(1, NUM_SEEDS + 1):
+        r = runScenario(useDeltas, lossRate, seed=seed)
+        if total is None:
+            total = r
+        else:
+            for key, value in r.items():
+                if not isinstance(value, str):
+                    total[key] += value
+    return total
+
+
+def main():
+    print("{} virtual hours, a change every ~10 s on average: 40% flips, 30% brightness steps, 30% hue stop tweaks".format(
+        NUM_SEEDS))
+    print("{:>6} {:>7} {:>9} {:>12} {:>9} {:>10} {:>10} {:>9} {:>8}".format(
+        "loss", "deltas", "packets", "w/o probes", "bytes", "stale (s)", "wrong (s)", "rejected", "garbled"))
+    for lossRate in (0.0, 0.05, 0.2):
+        results = []
+        for useDeltas in (False, True):
+            r = runSeeds(useDeltas, lossRate)
+            results.append(r)
+            print("{:>5.0f}% {:>7} {:>9} {:>12} {:>9} {:>10.2f} {:>10.2f} {:>9} {:>8}".format(
+                lossRate * 100, "on" if useDeltas else "off", r["packets"], r["data"], r["bytes"], r["stale"],
+                r["wrong"], r["rejected"], r["garbled"]))
+        print("  seed 1: {} | {:.0f}% of the payload packets".format(
+            results[1]["encoder"], 100 * results[1]["data"] / results[0]["data"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Host Simulation - self-tuning auto-retransmit
+#   runs the same changing link (clean, bursty, lossy, clean) against fixed
+#   ard/arc settings & the RetransmitTuner, then compares delivery, latency,
+#   air time & transmit charge
+#
+# Usage: python HostSimulation/sim_linkTuner.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.LinkTuner import RetransmitTuner
+from SimRF24 import SimLink, SimRF24, BernoulliLoss, GilbertElliottLoss
+
+PHASE_TIME = 60 # s
+SEND_INTERVAL = 0.05 # s, the transmitter's confirm rate
+TX_CURRENT_MA = {0: 11.3, -6: 9.0, -12: 7.5, -18: 7.0} # datasheet, per pa_level
+PA_LOSS = {-18: 0.3, -12: 0.1, -6: 0.02} # receiver a few rooms away
+
+
+def makePhases():
+    return (
+        ("clean", BernoulliLoss(0.01)),
+        ("bursty", GilbertElliottLoss(pGoodToBad=0.02, pBadToGood=0.1, lossBad=0.9)),
+        ("lossy", BernoulliLoss(0.3)),
+        ("clean again", BernoulliLoss(0.01)),
+    )
+
+
+def runScenario(ard=1500, arc=3, tune=False, tunePaLevel=False, seed=1):
+    link = SimLink(seed=seed)
+    link.paLoss = PA_LOSS
+    clock = link.clock
+    tx = SimRF24(link, "tx")
+    rx = SimRF24(link, "rx")
+    tx.open_tx_pipe(b"1Node")
+    rx.open_rx_pipe(1, b"1Node")
+    rx.listen = True
+    rx.service = rx.flush_rx
+    tx.ard, tx.arc = ard, arc
+    log = []
+    tuner = RetransmitTuner(tx, tunePaLevel=tunePaLevel, log=log.append) if tune else None
+
+    results = []
+    for name, lossModel in makePhases():
+        link.lossModel = lossModel
+        tx.resetStats()
+        link.resetStats()
+        charge = 0.0 # uC spent with the PA on
+        blocked_us = 0.0 # time send() held up the main loop
+        end = clock.monotonic() + PHASE_TIME
+        while clock.monotonic() < end:
+            airTime = link.airTime_us
+            start = clock.now_ns
+            ok = tx.send(b"state")
+            blocked_us += (clock.now_ns - start) / 1000
+            charge += (link.airTime_us - airTime) * TX_CURRENT_MA[tx.pa_level] / 1000
+            if tuner is not None:
+                tuner.record(ok)
+            clock.sleep(SEND_INTERVAL)
+        latency = sorted(tx.sendLatency_us)
+        results.append({
+            "phase": name,
+            "delivery": 1 - tx.numFailedSends / tx.numSends,
+            "p50": latency[len(latency) // 2] if latency else float("nan"),
+            "p95": latency[int(0.95 * len(latency))] if latency else float("nan"),
+            "blocked": blocked_us / tx.numSends,
+            "charge": charge / tx.numSends,
+            "settings": "ard={} arc={} pa={}".format(tx.ard, tx.arc, tx.pa_level),
+        })
+    return results, log
+
+
+def main():
+    scenarios = (
+        ("fixed ard=1500 arc=3 (library default)", {}),
+        ("fixed ard=4000 arc=15", {"ard": 4000, "arc": 15}),
+        ("tuned", {"tune": True}),
+        ("tuned incl. pa_level", {"tune": True, "tunePaLevel": True}),
+    )
+    for title, kwargs in scenarios:
+        results, log = runScenario(**kwargs)
+        print("{} ({} adjustments)".format(title, len(log)))
+        print("  {:<12} {:>9} {:>9} {:>9} {:>12} {:>12}  {}".format(
+            "phase", "delivered", "p50 us", "p95 us", "blocked us", "charge uC", "settings at end"))
+        for r in results:
+            print("  {:<12} {:>8.1f}% {:>9.0f} {:>9.0f} {:>12.0f} {:>12.2f}  {}".format(
+                r["phase"], r["delivery"] * 100, r["p50"], r["p95"], r["blocked"], r["charge"], r["settings"]))
+        for line in log[:6]:
+            print("    " + line)
+        if len(log) > 6:
+            print("    ... {} more".format(len(log) - 6))
+
+
+if __name__ == "__main__":
+    main()
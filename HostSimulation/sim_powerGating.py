@@ -0,0 +1,113 @@
+# Host Simulation - radio power gating
+#   an hour of the transmitter's send schedule (autosend probes, flips with
+#   their confirm probes) with the radio left in standby between sends, as
+#   the library does, vs powered down & woken 1.5 ms ahead of each send by
+#   lib/RadioPower.py: radio-on time, wake-ups & the radio's charge per hour
+#
+# Usage: python HostSimulation/sim_powerGating.py
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, random, sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_RemoteControl"))
+from lib.RadioPower import RadioPowerGate, SETTLE_TIME, STARTUP_MA, STANDBY_MA, POWER_DOWN_MA
+from SimRF24 import SimLink, SimRF24
+
+SIM_TIME = 3600 # s
+FLIP_INTERVAL = 30.0 # s, mean time between flips
+CONFIRM_TIME = 0.05 # s, the transmitter's updateTime_confirm
+NUM_CONFIRMS = 1 # probes after a change (more only if the echo disagrees)
+TX_MA = 11.3 # at 0 dBm, also used for the time waiting for the ACK
+
+
+def sendTimes(autosend, seed=1):
+    """
+    When the transmitter sends over SIM_TIME: every `autosend` seconds, plus
+    a change & its confirm probes at each flip (which restarts the timer)
+    """
+    rng = random.Random(seed)
+    times = []
+    now = 0.0
+    nextFlip = rng.expovariate(1 / FLIP_INTERVAL)
+    while now < SIM_TIME:
+        nextSend = now + autosend
+        if nextFlip < nextSend:
+            now = nextFlip
+            nextFlip += rng.expovariate(1 / FLIP_INTERVAL)
+            times.append(now)
+            for _ in range(NUM_CONFIRMS):
+                now += CONFIRM_TIME
+                times.append(now)
+        else:
+            now = nextSend
+            times.append(now)
+    return times
+
+
+def runSchedule(times, gated):
+    link = SimLink(seed=1)
+    clock = link.clock
+    tx = SimRF24(link, "tx")
+    rx = SimRF24(link, "rx")
+    tx.open_tx_pipe(b"1Node")
+    rx.open_rx_pipe(1, b"1Node")
+    rx.listen = True
+    rx.service = rx.flush_rx
+    tx.listen = False
+    tx.power = False # as the transmitter's init leaves it
+    tx.resetStats()
+    gate = RadioPowerGate(tx, enabled=gated, clock=clock.monotonic_ns, sleep=clock.sleep)
+    delays = [] # send time -> payload ACKed, ms
+    for when in times:
+        if clock.monotonic() < when:
+            clock.sleep(when - clock.monotonic())
+        start = clock.now_ns
+        gate.wake()
+        tx.send(b"state")
+        gate.sleep()
+        delays.append((clock.now_ns - start) / 1e6)
+    if clock.monotonic() < SIM_TIME:
+        clock.sleep(SIM_TIME - clock.monotonic())
+
+    # Charge (uC) from the simulated radio's own power accounting
+    elapsed = clock.now_ns
+    powered = tx.poweredTimeNs()
+    air = link.airTime_us * 1000
+    charge = (air * TX_MA + gate.settle_ns * STARTUP_MA + (powered - air - gate.settle_ns) * STANDBY_MA
+              + (elapsed - powered) * POWER_DOWN_MA) / 1e6
+    hours = elapsed / 3.6e12
+    return {
+        "powered": powered / 1e6 / hours,
+        "air": air / 1e6 / hours,
+        "powerUps": tx.numPowerUps / hours,
+        "charge": charge / 3600 / hours, # uAh/h
+        "delay": sum(delays) / len(delays),
+        "report": gate.report(),
+    }
+
+
+def main():
+    print("Radio power per hour of sends (flips every {:.0f} s on average, {} confirm probe each)".format(
+        FLIP_INTERVAL, NUM_CONFIRMS))
+    print("{:<9} {:<8} {:>7} {:>11} {:>10} {:>10} {:>9} {:>10}".format(
+        "autosend", "radio", "sends/h", "on ms/h", "air ms/h", "wakes/h", "uAh/h", "send ms"))
+    for autosend in (0.05, 0.2, 1.0, 5.0):
+        times = sendTimes(autosend)
+        results = []
+        for gated in (False, True):
+            result = runSchedule(times, gated)
+            results.append(result)
+            print("{:<9} {:<8} {:>7} {:>11.0f} {:>10.1f} {:>10.0f} {:>9.2f} {:>10.2f}".format(
+                "{} s".format(autosend), "gated" if gated else "standby", len(times), result["powered"],
+                result["air"], result["powerUps"], result["charge"], result["delay"]))
+        print("  gating: radio on {:.2f}% of the ungated time, {:.2f}x the charge".format(
+            100 * results[1]["powered"] / results[0]["powered"], results[1]["charge"] / results[0]["charge"]))
+        print("  device report: {}".format(results[1]["report"]))
+    breakEven = SETTLE_TIME * 1000 * (STARTUP_MA - STANDBY_MA) / (STANDBY_MA - POWER_DOWN_MA)
+    print("Gating pays off when sends are more than {:.0f} ms apart (start-up charge vs standby current)".format(breakEven))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Host Simulation - nRF24 stream test over a lossy link
+#   runs the stream test's master() & slave() against each other in virtual
+#   time, for a few loss models & auto-retransmit settings
+#
+# Usage: python HostSimulation/sim_streamTest.py [-v]
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import os, sys
+from SimRF24 import BernoulliLoss, GilbertElliottLoss
+from SimScripts import SimNetwork
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "nRF24_Testing", "main_nrf24_Sparkfun_streamtest.py")
+
+SCENARIOS = [
+    # name, loss model, ard (us), arc
+    ("ideal", BernoulliLoss(0.0), 1500, 3),
+    ("5% independent", BernoulliLoss(0.05), 1500, 3),
+    ("5% independent, short ard", BernoulliLoss(0.05), 250, 3),
+    ("bursty (~9% mean)", GilbertElliottLoss(0.02, 0.2, 0.0, 0.95), 1500, 3),
+    ("bursty, short ard & arc 15", GilbertElliottLoss(0.02, 0.2, 0.0, 0.95), 250, 15),
+]
+
+
+def runScenario(name, lossModel, ard, arc, fifo=False, count=5, size=32, verbose=False):
+    sim = SimNetwork(lossModel=lossModel, seed=1)
+
+    def master(ns):
+        ns["nrf"].ard = ard
+        ns["nrf"].arc = arc
+        (ns["master_fifo"] if fifo else ns["master"])(count, size)
+
+    rx = sim.addScript("rx", SCRIPT, inputs=["1"], call="slave", args=(1, size), echo=verbose)
+    tx = sim.addScript("tx", SCRIPT, inputs=["0"], call=master, echo=verbose)
+    sim.run(until=120)
+    print("== {} ({}, ard={} arc={}) ==".format(name, "master_fifo" if fifo else "master", ard, arc))
+    for line in tx.output[-2:] + rx.output[-2:]:
+        if line.startswith(("success", "Transmission", "Received ", "Effective", "You Win")):
+            print("  " + line)
+    print("  " + sim.statsString().replace("\n", "\n  "))
+
+
+def main():
+    verbose = "-v" in sys.argv
+    for scenario in SCENARIOS:
+        runScenario(*scenario, verbose=verbose)
+    runScenario("bursty", GilbertElliottLoss(0.02, 0.2, 0.0, 0.95), 1500, 3, fifo=True, verbose=verbose)
+
+
+if __name__ == "__main__":
+    main()
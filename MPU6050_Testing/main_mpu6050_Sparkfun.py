@@ -2,7 +2,7 @@
 #
 # nm3210@gmail.com
 # Date Created: April 9th, 2021
-# Last Modified: April 10th, 2021
+# Last Modified: October 19th, 2026
 #
 # Sources for some of the code:
 #   https://hridaybarot.home.blog/2021/03/23/controlling-asphalt-8-with-hand-gestures-using-mpu6050-and-raspberry-pi-pico/
@@ -12,6 +12,7 @@ import board, bitbangio, time # circuitpython built-ins
 from math import floor, atan2, acos, sqrt, pi # necessary math calls
 import adafruit_mpu6050 # also requires adafruit_register
 import neopixel # also requires adafruit_pypixelbuf
+from lib.MpuReader import MpuBurstReader # from nRF24_RemoteControl/lib
 print("Finished importing modules")
 
 # Initialize soft I2C
@@ -24,6 +25,7 @@ print("Finished initializing i2c")
 sensor = adafruit_mpu6050.MPU6050(i2c)
 sensor.cycle_rate = adafruit_mpu6050.Rate.CYCLE_5_HZ # update cycle rate
 sensor.cycle = True # only periodically update sensor (saves power!)
+reader = MpuBurstReader.fromSensor(sensor) # one transaction per sample, also on bitbangio
 print("Finished initializing mpu6050")
 
 # Setup calibrated accel values
@@ -136,7 +138,7 @@ def preallocateAccelList():
         time.sleep(0.05) # wait a bit
 
 def getSensorAccel():
-    x, y, z = sensor.acceleration
+    x, y, z = reader.acceleration()
     return x, y, z
 
 
@@ -0,0 +1,43 @@
+# Benchmarking MPU6050 Reads
+#   times sensor.acceleration against the burst reader on the device, on both
+#   the hardware I2C bus & the bit-banged one main_mpu6050_Sparkfun.py uses
+#   (run one at a time, the MPU6050 is wired to one of them)
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+# Import modules
+import board, bitbangio, gc, time # circuitpython built-ins
+import adafruit_mpu6050 # also requires adafruit_register
+from lib.MpuReader import MpuBurstReader # from nRF24_RemoteControl/lib
+print("Finished importing modules")
+
+# Initialize I2C (bit-banged on D2/D3 like main_mpu6050_Sparkfun.py, or board.I2C())
+useSoftI2c = True
+i2c = bitbangio.I2C(board.D2, board.D3) if useSoftI2c else board.I2C()
+sensor = adafruit_mpu6050.MPU6050(i2c)
+reader = MpuBurstReader.fromSensor(sensor)
+gyroReader = MpuBurstReader.fromSensor(sensor, withGyro=True)
+counts = [0, 0, 0]
+print("Finished initializing mpu6050 ({} i2c)".format("bitbangio" if useSoftI2c else "board"))
+
+def timeReads(name, read, numReads=500):
+    gc.collect()
+    memFree = gc.mem_free()
+    start = time.monotonic_ns()
+    for _ in range(numReads):
+        read()
+    elapsed_us = (time.monotonic_ns() - start) / 1000 / numReads
+    allocated = (memFree - gc.mem_free()) / numReads # rough, a collection can run in between
+    print("{:<36} {:8.1f} us/read {:8.1f} bytes/read".format(name, elapsed_us, allocated))
+    return elapsed_us
+
+###
+# Run the benchmark
+base = timeReads("sensor.acceleration", lambda: sensor.acceleration)
+timeReads("sensor.acceleration + sensor.gyro", lambda: (sensor.acceleration, sensor.gyro))
+timeReads("reader.acceleration()", reader.acceleration)
+burst = timeReads("reader.readInto(counts)", lambda: reader.readInto(counts))
+timeReads("gyro reader, acceleration + lastGyro", lambda: (gyroReader.acceleration(), gyroReader.lastGyro()))
+print("readInto is {:.1f}x faster than sensor.acceleration".format(base / burst))
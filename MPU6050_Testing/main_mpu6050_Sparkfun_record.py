@@ -0,0 +1,40 @@
+# Recording MPU6050 Traces
+#   prints raw accelerometer & gyro counts as csv over serial, capture them on
+#   the host (e.g. `cat /dev/ttyACM0 > trace.csv`) & replay them with the
+#   HostSimulation benchmarks: python HostSimulation/bench_faceDetect.py trace.csv
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+# Import modules
+import board, time # circuitpython built-ins
+import adafruit_mpu6050 # also requires adafruit_register
+from lib.MpuReader import MpuBurstReader # from nRF24_RemoteControl/lib
+print("Finished importing modules")
+
+# Initialize MPU6050 sensor (same bus as the remote control transmitter)
+i2c = board.I2C()
+sensor = adafruit_mpu6050.MPU6050(i2c)
+sensor.accelerometer_range = adafruit_mpu6050.Range.RANGE_2_G # 16384 counts/g
+sensor.gyro_range = adafruit_mpu6050.GyroRange.RANGE_500_DPS # 65.5 counts per deg/s
+sensor.cycle = False # cycle mode keeps the gyro in standby
+print("Finished initializing mpu6050")
+
+# Burst read accel, temperature & gyro
+reader = MpuBurstReader.fromSensor(sensor, withGyro=True)
+sampleRate = 40 # Hz, same as the transmitter's CYCLE_40_HZ
+
+###
+# Main LOOP
+print("t_ms,ax,ay,az,gx,gy,gz")
+startTime = time.monotonic_ns()
+nextSample = startTime
+while True:
+    ax, ay, az, temp, gx, gy, gz = reader.counts()
+    print("{},{},{},{},{},{},{}".format((time.monotonic_ns() - startTime) // 1000000, ax, ay, az, gx, gy, gz))
+
+    # Keep a steady sample rate
+    nextSample += 1000000000 // sampleRate
+    while time.monotonic_ns() < nextSample:
+        pass
@@ -0,0 +1,164 @@
+# Remote Control - Accelerometer calibration
+#   six-face calibration of the MPU6050 accelerometer: rest the cube on each
+#   face, solve for the bias & the 3x3 gain/misalignment matrix, store them in
+#   microcontroller.nvm & correct every raw sample with one fixed-point affine
+#   transform (integer math only, nothing allocated)
+#
+# Usage:
+#   calibration = AccelCalibration.load(microcontroller.nvm) # None if not calibrated
+#   reader.readInto(counts)
+#   calibration.apply(counts) # counts as if from a perfect sensor
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import struct
+from lib.FaceDetect import faceFromCounts
+
+COUNTS_PER_G = 16384 # raw accelerometer counts at +-2 g
+FRACTION_BITS = 12 # fixed point matrix: 4096 = 1.0, keeps M*counts a small int
+NVM_OFFSET = 0 # where the calibration lives in microcontroller.nvm
+NVM_MAGIC = b"AC"
+NVM_VERSION = 1
+NVM_FORMAT = "<2sB9h3hB" # magic, version, matrix (row-major), offset (counts), checksum
+NVM_SIZE = struct.calcsize(NVM_FORMAT)
+
+# Which way gravity reads while resting on each face (axis, sign), matching faceFromCounts
+FACE_AXES = ((0, 1), (0, -1), (1, -1), (1, 1), (2, 1), (2, -1))
+
+
+def checksum(data):
+    return sum(data) & 0xFF
+
+
+class AccelCalibration:
+    """
+    corrected = (matrix * raw) / 4096 + offset, per sample. The identity
+    matrix & zero offset leave the counts as they are
+    """
+    def __init__(self, matrix=(4096, 0, 0, 0, 4096, 0, 0, 0, 4096), offset=(0, 0, 0)):
+        self.matrix = list(matrix)
+        self.offset = list(offset)
+        self._fold()
+
+    def _fold(self):
+        # Offset pre-shifted & rounding added once, so apply() is 9 multiplies & 3 shifts
+        half = 1 << (FRACTION_BITS - 1)
+        self.offsetFixed = [(o << FRACTION_BITS) + half for o in self.offset]
+
+    def apply(self, counts):
+        """
+        Corrects counts[0:3] (raw x, y, z) in place
+        """
+        m = self.matrix
+        c = self.offsetFixed
+        x = counts[0]
+        y = counts[1]
+        z = counts[2]
+        counts[0] = (m[0]*x + m[1]*y + m[2]*z + c[0]) >> FRACTION_BITS
+        counts[1] = (m[3]*x + m[4]*y + m[5]*z + c[1]) >> FRACTION_BITS
+        counts[2] = (m[6]*x + m[7]*y + m[8]*z + c[2]) >> FRACTION_BITS
+
+    def isIdentity(self):
+        return self.matrix == [4096, 0, 0, 0, 4096, 0, 0, 0, 4096] and self.offset == [0, 0, 0]
+
+    ### Storage
+    def toBytes(self):
+        data = struct.pack(NVM_FORMAT, NVM_MAGIC, NVM_VERSION, *(self.matrix + self.offset + [0]))
+        return data[:-1] + bytes([checksum(data[:-1])])
+
+    @classmethod
+    def fromBytes(cls, data):
+        """
+        Returns the stored calibration, or None if `data` doesn't hold a valid one
+        """
+        if len(data) < NVM_SIZE:
+            return None
+        data = bytes(data[:NVM_SIZE])
+        fields = struct.unpack(NVM_FORMAT, data)
+        if fields[0] != NVM_MAGIC or fields[1] != NVM_VERSION or fields[-1] != checksum(data[:-1]):
+            return None
+        return cls(fields[2:11], fields[11:14])
+
+    @classmethod
+    def load(cls, nvm, offset=NVM_OFFSET):
+        return cls.fromBytes(nvm[offset:offset + NVM_SIZE])
+
+    def save(self, nvm, offset=NVM_OFFSET):
+        nvm[offset:offset + NVM_SIZE] = self.toBytes()
+
+    def __str__(self):
+        m = [v / 4096 for v in self.matrix]
+        return "matrix [{:.4f} {:.4f} {:.4f}; {:.4f} {:.4f} {:.4f}; {:.4f} {:.4f} {:.4f}] offset {}".format(
+            *(m + [self.offset]))
+
+
+### Six-face calibration
+def invert3(a):
+    """
+    Inverse of a row-major 3x3 matrix (list of 9)
+    """
+    c = [a[4]*a[8] - a[5]*a[7], a[2]*a[7] - a[1]*a[8], a[1]*a[5] - a[2]*a[4],
+         a[5]*a[6] - a[3]*a[8], a[0]*a[8] - a[2]*a[6], a[2]*a[3] - a[0]*a[5],
+         a[3]*a[7] - a[4]*a[6], a[1]*a[6] - a[0]*a[7], a[0]*a[4] - a[1]*a[3]]
+    det = a[0]*c[0] + a[1]*c[3] + a[2]*c[6]
+    return [v / det for v in c]
+
+
+class FaceCalibrator:
+    """
+    Collects raw samples while the cube rests on each face. Only samples after
+    `settleSamples` identical faces in a row count, `numSamples` per face.
+    With the means of all six, the sensor model raw = A * gravity + bias is
+    solved exactly: bias is the mean of the six, the columns of A are half
+    the difference of opposite faces
+    """
+    def __init__(self, numSamples=80, settleSamples=20, countsPerG=COUNTS_PER_G):
+        self.numSamples = numSamples
+        self.settleSamples = settleSamples
+        self.countsPerG = countsPerG
+        self.sums = [[0, 0, 0] for _ in range(6)]
+        self.counts = [0] * 6
+        self.lastFace = 0
+        self.run = 0 # identical faces in a row
+
+    def add(self, x, y, z):
+        """
+        Adds one raw sample, returns the face it was counted for (0 = not counted)
+        """
+        face = faceFromCounts(x >> 4, y >> 4, z >> 4) # +-32768 -> MAX_COUNTS
+        self.run = self.run + 1 if face == self.lastFace else 1
+        self.lastFace = face
+        if face == 0 or self.run <= self.settleSamples or self.counts[face - 1] >= self.numSamples:
+            return 0
+        sums = self.sums[face - 1]
+        sums[0] += x
+        sums[1] += y
+        sums[2] += z
+        self.counts[face - 1] += 1
+        return face
+
+    def missingFaces(self):
+        return [face for face in range(1, 7) if self.counts[face - 1] < self.numSamples]
+
+    def done(self):
+        return not self.missingFaces()
+
+    def solve(self):
+        """
+        Returns the AccelCalibration undoing the bias, gains & misalignment
+        """
+        means = [[s / max(1, n) for s in sums] for sums, n in zip(self.sums, self.counts)]
+        bias = [sum(mean[axis] for mean in means) / 6 for axis in range(3)]
+        a = [0.0] * 9 # raw per unit of gravity, column j = sensor axis j
+        for axis in range(3):
+            plus = FACE_AXES.index((axis, 1))
+            minus = FACE_AXES.index((axis, -1))
+            for row in range(3):
+                a[row*3 + axis] = (means[plus][row] - means[minus][row]) / 2 / self.countsPerG
+        inv = invert3(a)
+        matrix = [int(round(v * 4096)) for v in inv]
+        offset = [int(round(-(inv[row*3]*bias[0] + inv[row*3 + 1]*bias[1] + inv[row*3 + 2]*bias[2])))
+                  for row in range(3)]
+        return AccelCalibration(matrix, offset)
@@ -0,0 +1,112 @@
+# Remote Control - BLE advertising scheduler
+#   fake BLE beacons (circuitpython_nrf24l01.fake_ble) without redoing the
+#   packet work every advertisement: each service's advertising PDU is
+#   assembled, CRC'd, whitened & bit reversed once per BLE advertising
+#   channel, then every interval only switches channels & sends the ready
+#   buffers. Several services take turns, so e.g. the remote's state & its
+#   battery level can both be seen from a phone
+#
+# Usage:
+#   scheduler = AdvertisingScheduler(ble) # a FakeBLE, inside its `with` block
+#   battery = scheduler.add(battery_service)
+#   state = scheduler.add(b"\xff\xff\x03", 0xFF) # manufacturer data
+#   scheduler.advertise() # next service on all three channels
+#   scheduler.setData(battery, 84) # rebuilds that service's buffers only
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import struct
+from circuitpython_nrf24l01.fake_ble import chunk, crc24_ble, reverse_bits, whitener, BLE_FREQ
+
+SERVICE_DATA = 0x16 # data types (Bluetooth assigned numbers)
+MANUFACTURER_DATA = 0xFF
+TEST_COMPANY_ID = 0xFFFF # manufacturer data company id reserved for testing
+
+
+def buildAdvertisement(ble, payload, channelIdx):
+    """
+    The on-air buffer FakeBLE.advertise() would send for `payload` (chunked
+    data structures) on BLE_FREQ[channelIdx]
+    """
+    available = ble.len_available(payload)
+    if available < 0:
+        raise ValueError("Payload length exceeds maximum buffer size by {} bytes".format(-available))
+    name = ble.name
+    showPaLevel = ble.show_pa_level
+    pdu = bytearray([0x42, 9 + len(payload) + (len(name) + 2 if name else 0) + 3 * showPaLevel])
+    pdu += ble.mac
+    pdu += chunk(b"\x05", 1) # flags
+    if showPaLevel:
+        pdu += chunk(struct.pack(">b", ble.pa_level), 0x0A)
+    if name:
+        pdu += chunk(name, 0x08)
+    pdu += payload
+    pdu += crc24_ble(pdu)
+    return reverse_bits(whitener(pdu, (channelIdx + 37) | 0x40)) # whitening differs per channel
+
+
+class AdvertisingScheduler:
+    """
+    Round robin over the added services, one per advertise() call, each on
+    the three advertising channels back to back. Call rebuild() after
+    changing the radio's name, mac, pa_level or show_pa_level
+    """
+    def __init__(self, ble):
+        self.ble = ble
+        self.services = [] # [ServiceData or bytes, data type, buffers per channel]
+        self.idx = 0
+        self.numBuilds = 0
+
+    def add(self, data, dataType=SERVICE_DATA):
+        """
+        A ServiceData object (its buffer goes out as service data) or raw
+        bytes of `dataType`, returns the service's index for setData()
+        """
+        self.services.append([data, dataType, None])
+        self._build(len(self.services) - 1)
+        return len(self.services) - 1
+
+    def setData(self, idx, value):
+        """
+        New data for a service: a ServiceData's `data` value, or raw bytes
+        """
+        service = self.services[idx]
+        if isinstance(service[0], (bytes, bytearray)):
+            service[0] = bytes(value)
+        else:
+            service[0].data = value
+        self._build(idx)
+
+    def rebuild(self):
+        for idx in range(len(self.services)):
+            self._build(idx)
+
+    def _build(self, idx):
+        data, dataType, _ = self.services[idx]
+        payload = chunk(data if isinstance(data, (bytes, bytearray)) else data.buffer, dataType)
+        self.services[idx][2] = tuple(buildAdvertisement(self.ble, payload, channelIdx)
+                                      for channelIdx in range(len(BLE_FREQ)))
+        self.numBuilds += 1
+
+    def advertise(self):
+        """
+        Sends the next service on every advertising channel
+        """
+        if not self.services:
+            return
+        buffers = self.services[self.idx][2]
+        self.idx = (self.idx + 1) % len(self.services)
+        ble = self.ble
+        for channelIdx in range(len(BLE_FREQ)):
+            ble.channel = BLE_FREQ[channelIdx]
+            ble.send(buffers[channelIdx])
+
+
+def remoteStateData(face, page=0, battery=255):
+    """
+    Manufacturer data for the remote's state: the test company id, the face
+    (0 = unknown), the face mapping page & the battery percentage (255 = unknown)
+    """
+    return struct.pack("<HBBB", TEST_COMPANY_ID, face, page, battery)
@@ -0,0 +1,196 @@
+# Remote Control - Channel selection
+#   scans the 2.4 GHz band with the nRF24's received power detector (rpd),
+#   picks the quietest channels & hops between them when the link degrades
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import time
+from lib.RemoteLink import SendCapture, sendWith
+
+NUM_CHANNELS = 126 # 2400 to 2525 MHz
+DEFAULT_CHANNEL = 76 # RF24 default, both nodes boot here (rendezvous channel)
+HOP_TAG = b"#CH" # hop sequence announcement: tag + one byte per channel
+SILENCE_AUTOSENDS = 2.5 # silence timeout in autosend periods, same on both nodes
+
+
+### Scanning
+def scanChannels(nrf, histogram=None, sweeps=10, dwell=0.0003, clock=None):
+    """
+    Sweeps every channel `sweeps` times, counting how often the rpd flag was
+    set (>= -64 dBm seen while listening). Returns the histogram (bytearray)
+    """
+    clock = clock if clock is not None else time
+    if histogram is None:
+        histogram = bytearray(NUM_CHANNELS)
+    oldChannel = nrf.channel
+    for _ in range(sweeps):
+        for channel in range(NUM_CHANNELS):
+            nrf.channel = channel
+            nrf.listen = True
+            clock.sleep(dwell) # rpd needs ~170 us of listening to latch
+            if nrf.rpd and histogram[channel] < 255:
+                histogram[channel] += 1
+            nrf.listen = False
+    nrf.channel = oldChannel
+    return histogram
+
+
+def quietestChannels(histogram, count=4, spacing=6, width=2):
+    """
+    Returns `count` channels sorted quietest first, scored over +-`width`
+    neighbours (wifi & friends are wide) & at least `spacing` apart
+    """
+    scores = []
+    for channel in range(NUM_CHANNELS):
+        score = 0
+        for neighbour in range(max(0, channel - width), min(NUM_CHANNELS, channel + width + 1)):
+            score += histogram[neighbour]
+        scores.append((score, channel))
+    scores.sort()
+    chosen = []
+    for score, channel in scores:
+        if all(abs(channel - other) >= spacing for other in chosen):
+            chosen.append(channel)
+            if len(chosen) >= count:
+                break
+    return chosen
+
+
+def printHistogram(histogram, sweeps, columns=2):
+    """
+    Prints the occupancy as a bar per `columns` channels
+    """
+    for start in range(0, NUM_CHANNELS, columns):
+        hits = max(histogram[start : start + columns])
+        print("{:3d} {:4d} MHz |{}".format(start, 2400 + start, "#" * (hits * 40 // max(1, sweeps))))
+
+
+### Agreeing on a hop sequence
+def encodeHopSequence(channels):
+    return HOP_TAG + bytes(channels)
+
+
+def decodeHopSequence(payload):
+    """
+    Returns the announced channels, or None if the payload isn't an announcement
+    """
+    if payload is None or len(payload) <= len(HOP_TAG):
+        return None
+    if isinstance(payload, str):
+        if not payload.startswith("#CH"):
+            return None
+        channels = [ord(c) for c in payload[len(HOP_TAG):]]
+    else:
+        if bytes(payload[: len(HOP_TAG)]) != HOP_TAG:
+            return None
+        channels = list(payload[len(HOP_TAG):])
+    if any(channel >= NUM_CHANNELS for channel in channels):
+        return None
+    return channels
+
+
+class ChannelHopper:
+    """
+    Keeps both nodes on the same channel of a hop sequence
+
+    The transmitter hops when too many sends in its sliding window failed; the
+    receiver hops when it hasn't heard anything for `silenceTimeout` (longer
+    than the autosend interval), which lets it catch up with the transmitter.
+    The default channel is always last in the sequence, so a node that lost
+    track of the sequence still meets the other one there. The transmitter
+    stays on a channel long enough for the receiver to cycle through all of
+    them, so the two can't keep missing each other.
+    """
+    def __init__(self, nrf, channels=None, window=20, failThreshold=6, silenceTimeout=2.5, clock=None):
+        self.nrf = nrf
+        self.clock = clock if clock is not None else time
+        self.window = bytearray(window) # 1 = failed send
+        self.windowIdx = 0
+        self.numFailures = 0
+        self.failThreshold = failThreshold
+        self.silenceTimeout_ns = int(silenceTimeout * 1e9)
+        self.lastHeard = self.clock.monotonic_ns()
+        self.numHops = 0
+        self.setSequence(channels if channels else [])
+
+    def setSequence(self, channels):
+        self.sequence = [c for c in channels if c != DEFAULT_CHANNEL] + [DEFAULT_CHANNEL]
+        self.minDwell_ns = self.silenceTimeout_ns * (len(self.sequence) + 1)
+        self.idx = 0
+        self._tune()
+
+    @property
+    def channel(self):
+        return self.sequence[self.idx]
+
+    def _tune(self):
+        self.nrf.channel = self.sequence[self.idx]
+        self._clearWindow()
+        self.lastHeard = self.tuneTime = self.clock.monotonic_ns()
+
+    def _clearWindow(self):
+        for i in range(len(self.window)):
+            self.window[i] = 0
+        self.numFailures = 0
+
+    def hop(self):
+        if len(self.sequence) < 2:
+            self.lastHeard = self.clock.monotonic_ns()
+            return # nowhere to go
+        self.idx = (self.idx + 1) % len(self.sequence)
+        self.numHops += 1
+        self._tune()
+        print("Hopped to channel {}".format(self.channel))
+
+    def recordSend(self, success):
+        """
+        Transmitter side, returns True if the failures triggered a hop
+        """
+        if success and self.numFailures >= self.failThreshold:
+            self._clearWindow() # the link recovered (e.g. the receiver caught up)
+        failed = 0 if success else 1
+        self.numFailures += failed - self.window[self.windowIdx]
+        self.window[self.windowIdx] = failed
+        self.windowIdx = (self.windowIdx + 1) % len(self.window)
+        if self.numFailures >= self.failThreshold and \
+                self.clock.monotonic_ns() - self.tuneTime >= self.minDwell_ns:
+            self.hop()
+            return True
+        return False
+
+    def heard(self):
+        """
+        Receiver side, call whenever a packet came in
+        """
+        self.lastHeard = self.clock.monotonic_ns()
+
+    def checkSilence(self):
+        """
+        Receiver side, returns True if the silence triggered a hop
+        """
+        if self.clock.monotonic_ns() - self.lastHeard > self.silenceTimeout_ns:
+            self.hop()
+            return True
+        return False
+
+
+def announceHopSequence(nrf, hopper, channels, attempts=10, send=None):
+    """
+    Transmitter side: sends the hop sequence on the current channel & switches
+    to it. Returns True if the receiver acknowledged the announcement (if it
+    didn't, the transmitter comes back to the default channel after failures)
+
+    `send(radio, payload)` frames it like the other payloads (EasyStreamNrf24's
+    sendPayload), nrf.send() on its own if None
+    """
+    announcement = encodeHopSequence(channels)
+    capture = SendCapture(nrf) if send is not None else None
+    acked = False
+    for _ in range(attempts):
+        if nrf.send(announcement) if send is None else sendWith(send, capture, announcement):
+            acked = True
+            break
+    hopper.setSequence(channels)
+    return acked
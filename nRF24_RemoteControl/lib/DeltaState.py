@@ -0,0 +1,203 @@
+# Remote Control - Delta updates
+#   instead of a full ColorMethod.toString() payload, send only the fields
+#   that differ from the state the receiver last confirmed (its ACK echo
+#   digest), as a "#DT" tagged payload the receiver applies in place on its
+#   stored method. A full payload (keyframe) goes out every few sends & any
+#   time the receiver's state is unknown, which is how it recovers from loss
+#
+# Payload: "#DT" + base digest + target digest (4 hex digits each) + the
+#   changed fields as "path=value" separated by ";", e.g.
+#   "#DT1a2b3c4dcolor.hue=60.0;color.green=255"
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+from lib.RemoteLink import stateDigest
+
+DELTA_TAG = "#DT"
+DIGEST_DIGITS = 4
+
+
+### Fields
+def fieldValues(obj, prefix="", values=None):
+    """
+    Flattens an object's attributes (recursively, lists & tuples by index)
+    into {"color.stops.3.hue": 240.0, ...}, only the int/float/str/bool leaves
+    """
+    if values is None:
+        values = {}
+    items = enumerate(obj) if isinstance(obj, (list, tuple)) else sorted(obj.__dict__.items())
+    for name, value in items:
+        path = "{}{}".format(prefix, name)
+        if isinstance(value, (int, float, str)): # bool is an int
+            values[path] = value
+        elif isinstance(value, (list, tuple)) or hasattr(value, "__dict__"):
+            fieldValues(value, path + ".", values)
+    return values
+
+
+def fieldChanges(base, target):
+    """
+    [(path, value)] turning `base` into `target` (both from fieldValues),
+    None if they don't have the same fields (a different kind of method)
+    """
+    if len(base) != len(target):
+        return None
+    changes = []
+    for path, value in target.items():
+        if path not in base or type(base[path]) is not type(value):
+            return None
+        if base[path] != value:
+            changes.append((path, value))
+    return changes
+
+
+### Payloads
+def encodeDelta(baseDigest, targetDigest, changes):
+    """
+    Returns the delta payload, or None if a value can't be written into one
+    """
+    parts = []
+    for path, value in changes:
+        text = str(value)
+        if ";" in text or "=" in text:
+            return None
+        parts.append("{}={}".format(path, text))
+    return "{}{:04x}{:04x}{}".format(DELTA_TAG, baseDigest, targetDigest, ";".join(parts))
+
+
+def decodeDelta(payload):
+    """
+    Returns (base digest, target digest, [(path, text)]), or None if the
+    payload isn't a delta
+    """
+    if payload is None:
+        return None
+    if not isinstance(payload, str):
+        payload = bytes(payload).decode()
+    start = len(DELTA_TAG)
+    if not payload.startswith(DELTA_TAG) or len(payload) < start + 2 * DIGEST_DIGITS:
+        return None
+    try:
+        base = int(payload[start : start + DIGEST_DIGITS], 16)
+        target = int(payload[start + DIGEST_DIGITS : start + 2 * DIGEST_DIGITS], 16)
+    except ValueError:
+        return None
+    changes = []
+    rest = payload[start + 2 * DIGEST_DIGITS :]
+    for part in rest.split(";") if rest else ():
+        if "=" not in part:
+            return None
+        changes.append(part.split("=", 1))
+    return base, target, changes
+
+
+def applyDelta(obj, changes, undo=None):
+    """
+    Sets the changed fields on `obj` in place, each converted to the type of
+    the value it replaces. Returns False, without changing anything, if a
+    path doesn't exist or a value doesn't convert. The replaced values are
+    appended to the `undo` list if given, for undoDelta()
+    """
+    resolved = []
+    try:
+        for path, text in changes:
+            parts = path.split(".")
+            holder = obj
+            for part in parts[:-1]:
+                holder = holder[int(part)] if isinstance(holder, (list, tuple)) else getattr(holder, part)
+            key = parts[-1]
+            isIndex = isinstance(holder, list)
+            if isinstance(holder, tuple):
+                return False # can't be patched in place
+            current = holder[int(key)] if isIndex else getattr(holder, key)
+            if isinstance(current, bool):
+                value = text == "True"
+            elif isinstance(current, (int, float, str)):
+                value = type(current)(text)
+            else:
+                return False
+            resolved.append((holder, int(key) if isIndex else key, value, isIndex))
+    except (AttributeError, IndexError, ValueError):
+        return False
+    for holder, key, value, isIndex in resolved:
+        if undo is not None:
+            undo.append((holder, key, holder[key] if isIndex else getattr(holder, key), isIndex))
+        if isIndex:
+            holder[key] = value
+        else:
+            setattr(holder, key, value)
+    return True
+
+
+def undoDelta(undo):
+    """
+    Puts back the values an applyDelta() replaced
+    """
+    for holder, key, value, isIndex in reversed(undo):
+        if isIndex:
+            holder[key] = value
+        else:
+            setattr(holder, key, value)
+
+
+### Transmitter side
+class DeltaEncoder:
+    """
+    add() every method the transmitter can send (flattened once), then
+    encode() a payload right before sending it & confirm() whenever the ACK
+    echo said whether the receiver shows it
+    """
+    def __init__(self, keyframeEvery=8):
+        self.keyframeEvery = keyframeEvery # every n-th send is a full payload
+        self.fields = {} # payload -> fieldValues of its method
+        self.digests = {}
+        self.acked = None # payload the receiver confirmed, None = unknown
+        self.unconfirmed = False # a delta went out & no probe got through since
+        self.sinceKeyframe = 0
+        self.numDeltas = 0
+        self.numKeyframes = 0
+        self.bytesSent = 0
+        self.bytesFull = 0 # what full payloads would have taken
+
+    def add(self, method, payload):
+        self.fields[payload] = fieldValues(method)
+        self.digests[payload] = stateDigest(payload)
+
+    def encode(self, payload):
+        """
+        Returns what to send for `payload`: a delta against the confirmed
+        state when there is one & it's shorter, otherwise the payload itself.
+        Until the last delta is confirmed the receiver may already be past
+        the confirmed state (a second change before the probe), so that's a
+        full payload too
+        """
+        text = None
+        if self.acked in self.fields and payload in self.fields and self.sinceKeyframe < self.keyframeEvery \
+                and not self.unconfirmed:
+            changes = fieldChanges(self.fields[self.acked], self.fields[payload])
+            if changes is not None:
+                text = encodeDelta(self.digests[self.acked], self.digests[payload], changes)
+        if text is None or len(text) >= len(payload):
+            text = payload
+            self.sinceKeyframe = 0
+            self.numKeyframes += 1
+        else:
+            self.sinceKeyframe += 1
+            self.numDeltas += 1
+            self.unconfirmed = True
+        self.bytesSent += len(text)
+        self.bytesFull += len(payload)
+        return text
+
+    def confirm(self, payload, matched):
+        """
+        The receiver echoed `payload`'s digest (matched) or something else
+        """
+        self.acked = payload if matched else None
+        self.unconfirmed = False
+
+    def toString(self):
+        return "deltas={} keyframes={} bytes={} ({:.0f}% of full payloads)".format(
+            self.numDeltas, self.numKeyframes, self.bytesSent, 100 * self.bytesSent / max(1, self.bytesFull))
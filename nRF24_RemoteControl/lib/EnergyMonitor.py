@@ -0,0 +1,206 @@
+# Remote Control - Energy monitor
+#   battery telemetry & a per-operation energy estimate for the transmitter:
+#   counts radio-on time, TX attempts, sensor reads & LED-on time, turns them
+#   into mWh with typical datasheet currents & compares that with what the
+#   MAX17048 fuel gauge (or an ADC divider) says the battery did
+#
+# Usage:
+#   monitor = EnergyMonitor(openBattery(i2c), reportTime=60.0)
+#   monitor.radioStart(); nrf.send(...); monitor.radioStop(1 + nrf.last_tx_arc)
+#   report = monitor.update() # a line of text every reportTime seconds, else None
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+from supervisor import ticks_ms # small ints, unlike time.monotonic_ns()
+from lib.GcMonitor import ticksDiff
+
+TELEMETRY_TAG = "#TL" # telemetry payload: tag + report text
+
+# Typical currents (mA), datasheet values
+BOARD_MA = 22.0 # RP2040 at 125 MHz running the (never sleeping) main loop, regulator, fuel gauge
+RADIO_MA = 12.3 # nRF24L01+ between TX (11.3 mA at 0 dBm) & waiting for the ACK (13.5 mA)
+SENSOR_CYCLE_MA = 0.11 # MPU6050 accelerometer only, cycle mode at 40 Hz
+SENSOR_GYRO_MA = 3.8 # MPU6050 accelerometer & gyro running
+LED_MA = 20.0 # WS2812 lit (one color channel at full)
+DEFAULT_VOLTS = 3.7 # without a battery reading
+
+
+### Battery readings
+class FuelGauge:
+    """
+    A MAX17048 fuel gauge on the I2C bus (0x36), needs adafruit_max1704x
+    """
+    def __init__(self, i2c):
+        import adafruit_max1704x
+        self.gauge = adafruit_max1704x.MAX17048(i2c)
+
+    def voltage(self):
+        return self.gauge.cell_voltage
+
+    def percent(self):
+        return self.gauge.cell_percent
+
+    def rate(self):
+        return self.gauge.charge_rate # %/hour, negative while discharging
+
+
+class AdcBattery:
+    """
+    Battery voltage through a divider on an analog pin (no percentage or rate)
+    """
+    def __init__(self, pin, ratio=2.0):
+        import analogio
+        self.adc = analogio.AnalogIn(pin)
+        self.ratio = ratio
+
+    def voltage(self):
+        return self.adc.value * self.adc.reference_voltage / 65535 * self.ratio
+
+    def percent(self):
+        return None
+
+    def rate(self):
+        return None
+
+
+def openBattery(i2c, adcPin=None, ratio=2.0):
+    """
+    The fuel gauge if it answers, else the ADC divider on `adcPin`, else None
+    """
+    try:
+        return FuelGauge(i2c)
+    except (ImportError, ValueError, OSError, RuntimeError):
+        pass
+    if adcPin is not None:
+        return AdcBattery(adcPin, ratio)
+    return None
+
+
+### Energy accounting
+class EnergyMonitor:
+    """
+    The counters cover one report interval, the energy (mJ) & flips add up
+    since boot. Nothing on the per-sample path (sensorRead, ...) allocates
+    """
+    def __init__(self, battery=None, reportTime=60.0, sensorMa=SENSOR_CYCLE_MA, boardMa=BOARD_MA,
+                 radioMa=RADIO_MA, ledMa=LED_MA):
+        self.battery = battery
+        self.reportTime_ms = int(reportTime * 1000)
+        self.sensorMa = sensorMa
+        self.boardMa = boardMa
+        self.radioMa = radioMa
+        self.ledMa = ledMa
+        self.lastReport = ticks_ms()
+        self.volts = DEFAULT_VOLTS
+        self.startPercent = None
+        self.energy = [0.0, 0.0, 0.0, 0.0] # mJ since boot: board, radio, sensor, LED
+        self.numFlips = 0
+        self.elapsed_s = 0.0
+        self.radioSince = 0 # ticks of radioStart, 0 = off
+        self.ledSince = 0
+        self._readBattery()
+        if battery is not None:
+            self.startPercent = battery.percent()
+        self._reset()
+
+    def _reset(self):
+        self.radio_ms = 0
+        self.txAttempts = 0
+        self.sensorReads = 0
+        self.led_ms = 0
+        self.flips = 0
+
+    def _readBattery(self):
+        if self.battery is not None:
+            try:
+                self.volts = self.battery.voltage()
+            except (OSError, RuntimeError):
+                pass # keep the last reading
+
+    ### Counting
+    def radioStart(self):
+        self.radioSince = ticks_ms() | 1 # never 0
+
+    def radioStop(self, attempts=1):
+        if self.radioSince:
+            self.radio_ms += ticksDiff(ticks_ms(), self.radioSince)
+            self.radioSince = 0
+        self.txAttempts += attempts
+
+    def sensorRead(self):
+        self.sensorReads += 1
+
+    def ledOn(self):
+        if not self.ledSince:
+            self.ledSince = ticks_ms() | 1
+
+    def ledOff(self):
+        if self.ledSince:
+            self.led_ms += ticksDiff(ticks_ms(), self.ledSince)
+            self.ledSince = 0
+
+    def flip(self):
+        self.flips += 1
+
+    ### Reporting
+    def update(self):
+        """
+        Returns the report once every reportTime seconds, otherwise None
+        """
+        now = ticks_ms()
+        interval_ms = ticksDiff(now, self.lastReport)
+        if interval_ms < self.reportTime_ms:
+            return None
+        self.lastReport = now
+        if self.ledSince: # count a lit LED up to now
+            self.ledOff()
+            self.ledOn()
+        self._readBattery()
+
+        # mA * V * s = mJ
+        seconds = interval_ms / 1000
+        volts = self.volts
+        energy = self.energy
+        energy[0] += self.boardMa * volts * seconds
+        energy[1] += self.radioMa * volts * self.radio_ms / 1000
+        energy[2] += self.sensorMa * volts * seconds
+        energy[3] += self.ledMa * volts * self.led_ms / 1000
+        self.elapsed_s += seconds
+        self.numFlips += self.flips
+        report = self.report()
+        self._reset()
+        return report
+
+    def report(self):
+        total = sum(self.energy)
+        perHour = total / self.elapsed_s # mJ/s = mW, i.e. mWh per hour
+        radioPerFlip = self.energy[1] / self.numFlips if self.numFlips else 0.0
+        text = "{:.2f}V radio={}ms tx={} reads={} led={}ms flips={} | est {:.1f} mWh/h ({:.0f}% board, {:.1f}% radio, {:.1f}% sensor, {:.1f}% led) radio {:.2f} mJ/flip".format(
+            self.volts, self.radio_ms, self.txAttempts, self.sensorReads, self.led_ms, self.flips, perHour,
+            100 * self.energy[0] / total, 100 * self.energy[1] / total, 100 * self.energy[2] / total,
+            100 * self.energy[3] / total, radioPerFlip)
+        if self.battery is not None and self.startPercent is not None:
+            try:
+                percent = self.battery.percent()
+                rate = self.battery.rate()
+                text += " | gauge {:.1f}% ({:+.1f}% since boot, {:+.2f}%/h)".format(percent, percent - self.startPercent, rate)
+            except (OSError, RuntimeError):
+                pass
+        return text
+
+
+### Telemetry payloads
+def encodeTelemetry(report):
+    return TELEMETRY_TAG + report
+
+def decodeTelemetry(payload):
+    """
+    Returns the report text of a telemetry payload, or None if it isn't one
+    """
+    if payload is None:
+        return None
+    if not isinstance(payload, str):
+        payload = bytes(payload).decode()
+    return payload[len(TELEMETRY_TAG):] if payload.startswith(TELEMETRY_TAG) else None
@@ -0,0 +1,400 @@
+# Remote Control - Face detection
+#   which face of the cube points down, from MPU6050 accelerometer readings:
+#   the transmitter's float pipeline (m/s^2, moving average, tilt angles), an
+#   integer-only one working on the raw counts, one with hysteresis & a
+#   confidence margin & a gyro-assisted one
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+from math import atan2, acos, sin, sqrt, tan, pi
+
+ANGLE_CHECK = 20 # degrees, max tilt away from a face
+STANDARD_GRAVITY = 9.80665 # m/s^2
+COUNTS_PER_G = 16384 # raw accelerometer counts at +-2 g
+COUNTS_PER_DPS = 65.5 # raw gyro counts at +-500 deg/s
+
+# tan(20 deg)^2 ~= 11/83 (0.004 deg off), small enough that every product in
+# faceFromCounts stays a small int (no heap allocation on CircuitPython)
+TAN2_NUM = 11
+TAN2_DEN = 83
+MAX_COUNTS = 2048 # largest |x|, |y|, |z| faceFromCounts accepts
+TAN2_MAX_DEN = 85 # |v|^2 * den stays a small int for |x|, |y|, |z| <= MAX_COUNTS
+
+
+### Float pipeline (same math as the transmitter)
+def angleDiff(start, stop):
+    return ((start-stop)+180)%360 - 180
+
+def faceFromAngles(theta, phi, angleCheck=ANGLE_CHECK):
+    faceIdx = 0 # invalid face
+    if   abs(angleDiff(theta,  0)) <= angleCheck and abs(angleDiff(phi, 90)) <= angleCheck: # Down
+        faceIdx = 1
+    elif abs(angleDiff(theta,180)) <= angleCheck and abs(angleDiff(phi, 90)) <= angleCheck: # Up
+        faceIdx = 2
+    elif abs(angleDiff(theta,-90)) <= angleCheck and abs(angleDiff(phi, 90)) <= angleCheck: # Side 1
+        faceIdx = 3
+    elif abs(angleDiff(theta, 90)) <= angleCheck and abs(angleDiff(phi, 90)) <= angleCheck: # Side 2
+        faceIdx = 4
+    elif abs(angleDiff(phi,    0)) <= angleCheck: # Side 3
+        faceIdx = 5
+    elif abs(angleDiff(phi,  180)) <= angleCheck: # Side 4
+        faceIdx = 6
+    return faceIdx
+
+def tiltAngles(x, y, z):
+    # via https://www.analog.com/en/app-notes/an-1057.html eq 9 & 10
+    theta = atan2(y, x) # (-180,180)
+    phi = acos(z / sqrt(x*x + y*y + z*z)) # (0,180)
+    return theta*180/pi, phi*180/pi # -> deg
+
+
+class FloatFaceFilter:
+    """
+    The transmitter's pipeline: raw counts -> m/s^2, `numAvg` sample moving
+    average, tilt angles, face
+    """
+    def __init__(self, numAvg=7, countsPerG=COUNTS_PER_G):
+        self.scale = STANDARD_GRAVITY / countsPerG
+        self.listX = [0.0] * numAvg
+        self.listY = [0.0] * numAvg
+        self.listZ = [0.0] * numAvg
+
+    def fill(self, x, y, z):
+        for _ in range(len(self.listX)):
+            self.add(x, y, z)
+
+    def add(self, x, y, z):
+        """
+        Adds one raw sample, returns the face of the averaged acceleration
+        """
+        self.listX.pop(0)
+        self.listY.pop(0)
+        self.listZ.pop(0)
+        self.listX.append(x * self.scale)
+        self.listY.append(y * self.scale)
+        self.listZ.append(z * self.scale)
+        n = len(self.listX)
+        avgX, avgY, avgZ = sum(self.listX) / n, sum(self.listY) / n, sum(self.listZ) / n
+        if avgX == 0 and avgY == 0 and avgZ == 0:
+            return 0
+        return faceFromAngles(*tiltAngles(avgX, avgY, avgZ))
+
+
+### Integer pipeline
+FACE_SIGNS = (0, 1, -1, -1, 1, 1, -1) # direction of each face along its x, y or z axis
+
+def tan2Ratio(angle, maxDen=TAN2_MAX_DEN):
+    """
+    (num, den) with num/den closest to tan(angle)^2, den <= maxDen, e.g.
+    (11, 83) for 20 degrees
+    """
+    value = tan(angle * pi / 180) ** 2
+    best = (0, 1)
+    for den in range(1, maxDen + 1):
+        num = int(value * den + 0.5)
+        if abs(num / den - value) < abs(best[0] / best[1] - value):
+            best = (num, den)
+    return best
+
+def withinCone(along, norm2, ratio):
+    """
+    True if a vector is within the angle of `ratio` (tan2Ratio) of an axis,
+    from its component `along` the axis (> 0) & its squared length
+    """
+    aa = along * along
+    return (norm2 - aa) * ratio[1] <= aa * ratio[0]
+
+def faceFromCounts(x, y, z):
+    """
+    Integer-only faceFromAngles(*tiltAngles(x, y, z)): the angle limits become
+    squared ratios, e.g. |theta| <= 20 is x > 0 and y^2 <= tan(20)^2 * x^2.
+    Any common scale works, as long as |x|, |y|, |z| <= MAX_COUNTS
+    """
+    xx = x*x
+    yy = y*y
+    zz = z*z
+    if zz * TAN2_DEN <= (xx + yy) * TAN2_NUM: # phi within 20 of 90
+        if yy * TAN2_DEN <= xx * TAN2_NUM: # theta within 20 of 0 or 180
+            if x > 0:
+                return 1
+            if x < 0:
+                return 2
+        if xx * TAN2_DEN <= yy * TAN2_NUM: # theta within 20 of -90 or 90
+            if y < 0:
+                return 3
+            if y > 0:
+                return 4
+    if (xx + yy) * TAN2_DEN <= zz * TAN2_NUM: # phi within 20 of 0 or 180
+        if z > 0:
+            return 5
+        if z < 0:
+            return 6
+    return 0
+
+
+class IntFaceFilter:
+    """
+    Same as FloatFaceFilter, but keeps the raw int16 counts & integer running
+    sums (exact, no drift) & classifies with faceFromCounts. Nothing in add()
+    allocates on CircuitPython
+    """
+    def __init__(self, numAvg=7):
+        self.ring = [0] * (3 * numAvg) # x, y, z per sample
+        self.idx = 0
+        self.sums = [0, 0, 0]
+        self.shift = 0 # scales the sums down to MAX_COUNTS
+        while (numAvg * 32768) >> self.shift > MAX_COUNTS:
+            self.shift += 1
+
+    def fill(self, x, y, z):
+        for _ in range(len(self.ring) // 3):
+            self.add(x, y, z)
+
+    def push(self, x, y, z):
+        """
+        Adds one raw sample to the running sums
+        """
+        ring = self.ring
+        sums = self.sums
+        i = self.idx
+        sums[0] += x - ring[i]
+        sums[1] += y - ring[i + 1]
+        sums[2] += z - ring[i + 2]
+        ring[i] = x
+        ring[i + 1] = y
+        ring[i + 2] = z
+        i += 3
+        self.idx = i if i < len(ring) else 0
+
+    def add(self, x, y, z):
+        """
+        Adds one raw sample, returns the face of the averaged counts
+        """
+        self.push(x, y, z)
+        sums = self.sums
+        shift = self.shift
+        return faceFromCounts(sums[0] >> shift, sums[1] >> shift, sums[2] >> shift)
+
+
+class HysteresisFaceFilter(IntFaceFilter):
+    """
+    Running average like IntFaceFilter, but a face is entered within
+    `enterAngle` of its axis & only left beyond `exitAngle`, so a cube resting
+    near a boundary doesn't flicker between a face & 0. Also sets `margin`:
+    whole degrees (up to `maxMargin`) inside the threshold that applied, 0
+    with no face or while moving: |a| more than `gate` g away from 1 g
+    (shakes) or the average moving by more than `stillAngle` degrees' worth
+    of |a| per sample (passing over a face mid-flip). The limits are true
+    cones around the axes (not the theta/phi boxes of faceFromAngles), tested
+    with squared tangent ratios like faceFromCounts, so add() is integer-only
+    """
+    def __init__(self, numAvg=3, enterAngle=ANGLE_CHECK, exitAngle=30, gate=0.15,
+                 stillAngle=1.0, maxMargin=10, countsPerG=COUNTS_PER_G):
+        IntFaceFilter.__init__(self, numAvg)
+        oneG = numAvg * countsPerG / (1 << self.shift) # on the scaled sums
+        self.minNorm2 = int(((1 - gate) * oneG) ** 2)
+        self.maxNorm2 = int(((1 + gate) * oneG) ** 2)
+        
+        # Cones at the limit, 1 degree inside it, ... maxMargin degrees inside
+        self.enterRatios = tuple(tan2Ratio(enterAngle - k) for k in range(maxMargin + 1) if enterAngle - k > 0)
+        self.exitRatios = tuple(tan2Ratio(exitAngle - k) for k in range(maxMargin + 1) if exitAngle - k > 0)
+        
+        # Still: |change|^2 <= sin^2 * |a|^2, any component above maxStillDiff
+        # fails it before the products get big
+        sin2 = sin(stillAngle * pi / 180) ** 2
+        self.maxStillDiff = int(sqrt(sin2 * self.maxNorm2)) + 1
+        self.stillDen = (1 << 30) // (3 * self.maxStillDiff**2 + 1)
+        self.stillNum = int(sin2 * self.stillDen + 0.5)
+        self.last = [0, 0, 0] # previous scaled sums
+        self.face = 0
+        self.margin = 0
+
+    def add(self, x, y, z):
+        """
+        Adds one raw sample, returns the face of the averaged counts
+        """
+        self.push(x, y, z)
+        sums = self.sums
+        shift = self.shift
+        x = sums[0] >> shift
+        y = sums[1] >> shift
+        z = sums[2] >> shift
+        norm2 = x*x + y*y + z*z
+        
+        # How far the average moved since the last sample
+        last = self.last
+        dx = x - last[0]
+        dy = y - last[1]
+        dz = z - last[2]
+        last[0] = x
+        last[1] = y
+        last[2] = z
+        limit = self.maxStillDiff
+        still = self.minNorm2 <= norm2 <= self.maxNorm2 \
+            and -limit <= dx <= limit and -limit <= dy <= limit and -limit <= dz <= limit \
+            and (dx*dx + dy*dy + dz*dz) * self.stillDen <= norm2 * self.stillNum
+        
+        # Stay on the current face until it's past the exit angle
+        face = self.face
+        ratios = self.exitRatios
+        if face != 0:
+            along = FACE_SIGNS[face] * (x if face <= 2 else y if face <= 4 else z)
+        if face == 0 or along <= 0 or not withinCone(along, norm2, ratios[0]):
+            # Otherwise take the closest axis, if it's within the enter angle
+            ax, ay, az = abs(x), abs(y), abs(z)
+            if ax >= ay and ax >= az:
+                along, face = ax, 1 if x > 0 else 2
+            elif ay >= az:
+                along, face = ay, 4 if y > 0 else 3
+            else:
+                along, face = az, 5 if z > 0 else 6
+            ratios = self.enterRatios
+            if along == 0 or not withinCone(along, norm2, ratios[0]):
+                self.face = 0
+                self.margin = 0
+                return 0
+        
+        self.face = face
+        margin = 0
+        if still:
+            while margin + 1 < len(ratios) and withinCone(along, norm2, ratios[margin + 1]):
+                margin += 1
+        self.margin = margin
+        return face
+
+
+### Gyro-assisted pipeline
+class GyroFaceFilter:
+    """
+    Complementary filter on the gravity direction: every sample the gyro
+    carries the previous estimate along with the rotation, then it's pulled
+    toward the accelerometer reading by `alpha`, less the further |a| is from
+    1 g (shakes & bumps, ignored entirely beyond `gate` g). Follows a flip as
+    it happens instead of averaging it away, & rocking in the hand shows up
+    as rotation rather than as a new face. The state is preallocated; add()
+    only does float math (inline on CircuitPython)
+    """
+    def __init__(self, rate=40, alpha=0.15, gate=0.25, stillRate=40.0,
+                 countsPerG=COUNTS_PER_G, countsPerDps=COUNTS_PER_DPS):
+        self.alpha = alpha
+        self.gate = gate
+        self.accelScale = 1 / countsPerG # counts -> g
+        self.gyroScale = pi / 180 / countsPerDps / rate # counts -> rad per sample
+        self.stillLimit = (stillRate * pi / 180 / rate) ** 2 # squared rad per sample
+        self.gravity = [0.0, 0.0, 0.0] # unit vector, sensor frame
+        self.still = False # rotating slower than stillRate (deg/s)
+        self.started = False
+
+    def fill(self, ax, ay, az, gx=0, gy=0, gz=0):
+        self.started = False
+        self.add(ax, ay, az, gx, gy, gz)
+
+    def add(self, ax, ay, az, gx, gy, gz):
+        """
+        Adds one raw sample (accelerometer & gyro counts), returns the face
+        """
+        g = self.gravity
+        ax *= self.accelScale
+        ay *= self.accelScale
+        az *= self.accelScale
+        norm2 = ax*ax + ay*ay + az*az
+        if norm2 == 0:
+            return 0
+        if not self.started:
+            n = 1 / sqrt(norm2)
+            x, y, z = ax*n, ay*n, az*n
+            self.started = True
+        else:
+            # Rotate with the gyro: dg/dt = g x w (small angle per sample)
+            wx = gx * self.gyroScale
+            wy = gy * self.gyroScale
+            wz = gz * self.gyroScale
+            x = g[0] + g[1]*wz - g[2]*wy
+            y = g[1] + g[2]*wx - g[0]*wz
+            z = g[2] + g[0]*wy - g[1]*wx
+            self.still = wx*wx + wy*wy + wz*wz < self.stillLimit
+            
+            # Pull toward the accelerometer, if it's (close to) measuring just gravity
+            err = abs(norm2 - 1.0) # ~2 * (|a| - 1 g)
+            if err < self.gate:
+                k = self.alpha * (1 - err / self.gate)
+                n = 1 / sqrt(norm2)
+                x += k * (ax*n - x)
+                y += k * (ay*n - y)
+                z += k * (az*n - z)
+        n = 1 / sqrt(x*x + y*y + z*z)
+        g[0] = x * n
+        g[1] = y * n
+        g[2] = z * n
+        return faceFromCounts(int(g[0] * 1024), int(g[1] * 1024), int(g[2] * 1024))
+
+
+### Debouncing
+class FaceDebouncer:
+    """
+    The transmitter's rule: a face only counts once the last `numSamples`
+    readings all agree, otherwise 0
+    """
+    def __init__(self, numSamples=7):
+        self.faces = [0] * numSamples
+        self.idx = 0
+
+    def add(self, face):
+        self.faces[self.idx] = face
+        self.idx = (self.idx + 1) % len(self.faces)
+        for other in self.faces:
+            if other != face:
+                return 0
+        return face
+
+
+class MarginDebouncer:
+    """
+    For HysteresisFaceFilter: the further inside its face the reading is, the
+    fewer agreeing readings it takes, from `maxSamples` right at the boundary
+    down to `minSamples` at `fullMargin` degrees or more. Once committed the
+    face holds as long as the readings keep agreeing, otherwise 0
+    """
+    def __init__(self, minSamples=2, maxSamples=7, fullMargin=10):
+        self.minSamples = minSamples
+        self.maxSamples = maxSamples
+        self.fullMargin = fullMargin
+        self.candidate = 0
+        self.count = 0 # consecutive readings of candidate
+        self.committed = 0
+
+    def add(self, face, margin):
+        if face != self.candidate:
+            self.candidate = face
+            self.count = 0
+            self.committed = 0
+        self.count += 1
+        if face != 0 and self.committed == 0:
+            full = self.fullMargin
+            if self.count * full >= self.maxSamples * full - (self.maxSamples - self.minSamples) * min(margin, full):
+                self.committed = face
+        return self.committed
+
+
+class StillFaceDebouncer:
+    """
+    For GyroFaceFilter: a face counts once the last `numSamples` readings agree
+    & the cube has stopped rotating, otherwise 0
+    """
+    def __init__(self, numSamples=3):
+        self.faces = [0] * numSamples
+        self.idx = 0
+        self.numStill = 0 # consecutive still samples
+
+    def add(self, face, still):
+        self.faces[self.idx] = face
+        self.idx = (self.idx + 1) % len(self.faces)
+        self.numStill = self.numStill + 1 if still else 0
+        if self.numStill < len(self.faces):
+            return 0
+        for other in self.faces:
+            if other != face:
+                return 0
+        return face
@@ -0,0 +1,91 @@
+# Remote Control - Garbage collection monitor
+#   measures how many bytes each pass of a loop allocates & how long garbage
+#   collections take (CircuitPython only: gc.mem_free & supervisor.ticks_ms)
+#
+# Usage:
+#   monitor = GcMonitor()
+#   while True:
+#       monitor.loopStart()
+#       ... # loop body
+#       monitor.loopEnd()
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import gc, time
+from supervisor import ticks_ms # small ints, unlike time.monotonic_ns()
+
+TICKS_MASK = (1 << 29) - 1 # ticks_ms wraps around every ~6.2 days
+
+
+def ticksDiff(now, then):
+    return (now - then) & TICKS_MASK
+
+
+class GcMonitor:
+    """
+    Compares gc.mem_free() at the start & end of every pass: a drop is what
+    the pass allocated, a rise means an automatic collection ran during it.
+    Every `reportTime` seconds it prints a summary &, if `collectOnReport`,
+    times a full gc.collect(). Nothing in loopStart/loopEnd allocates
+    """
+    def __init__(self, reportTime=10.0, collectOnReport=True):
+        self.reportTime_ms = int(reportTime * 1000)
+        self.collectOnReport = collectOnReport
+        self.lastReport = ticks_ms()
+        self.passStart = self.lastReport
+        self.memFree = gc.mem_free()
+        self._reset()
+
+    def _reset(self):
+        self.numLoops = 0
+        self.numAllocLoops = 0 # passes that allocated anything
+        self.allocBytes = 0
+        self.maxAllocBytes = 0
+        self.numAutoCollects = 0 # automatic collections seen
+        self.maxAutoCollectPass_ms = 0 # longest pass that included one
+
+    def loopStart(self):
+        self.passStart = ticks_ms()
+        self.memFree = gc.mem_free()
+
+    def loopEnd(self):
+        used = self.memFree - gc.mem_free()
+        now = ticks_ms()
+        self.numLoops += 1
+        if used < 0:
+            self.numAutoCollects += 1
+            passTime = ticksDiff(now, self.passStart)
+            if passTime > self.maxAutoCollectPass_ms:
+                self.maxAutoCollectPass_ms = passTime
+        elif used > 0:
+            self.numAllocLoops += 1
+            self.allocBytes += used
+            if used > self.maxAllocBytes:
+                self.maxAllocBytes = used
+        if ticksDiff(now, self.lastReport) >= self.reportTime_ms:
+            self.report()
+            self.lastReport = ticks_ms()
+
+    def timeCollect(self):
+        """
+        Runs a full collection, returns how long it took (ms) & the bytes it freed
+        """
+        before = gc.mem_free()
+        start = time.monotonic_ns()
+        gc.collect()
+        pause_ms = (time.monotonic_ns() - start) / 1e6
+        return pause_ms, gc.mem_free() - before
+
+    def report(self):
+        numLoops = max(1, self.numLoops)
+        print("GC: {} passes, {:.1f} bytes/pass ({} passes allocated, max {} bytes), mem_free {}".format(
+            self.numLoops, self.allocBytes / numLoops, self.numAllocLoops, self.maxAllocBytes, gc.mem_free()))
+        if self.numAutoCollects:
+            print("GC: {} automatic collections, longest pass with one {} ms".format(
+                self.numAutoCollects, self.maxAutoCollectPass_ms))
+        if self.collectOnReport:
+            pause_ms, freed = self.timeCollect()
+            print("GC: gc.collect() took {:.2f} ms, freed {} bytes".format(pause_ms, freed))
+        self._reset()
@@ -0,0 +1,144 @@
+# Remote Control - Gesture detection
+#   shake, tap & double flip events from the raw MPU6050 accelerometer counts
+#   the transmitter already reads, one sample at a time: a few running values
+#   per axis & small counters, no sample windows kept & nothing allocated
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+COUNTS_PER_G = 16384 # raw accelerometer counts at +-2 g
+
+GESTURE_NONE = 0
+GESTURE_SHAKE = 1
+GESTURE_TAP = 2
+GESTURE_DOUBLE_FLIP = 3
+GESTURE_NAMES = ("none", "shake", "tap", "double flip")
+
+
+class GestureDetector:
+    """
+    Call add() with every sample & the debounced face, it returns a GESTURE_*
+    event (mostly GESTURE_NONE):
+      shake        `shakeCrossings` sign changes in a row on one axis, each
+                   within `shakeGap` seconds of the last, of the axis minus its
+                   running average, counting only swings beyond `shakeLevel` g
+      tap          |a| over 1 + `tapLevel` g for at most `tapSamples` samples,
+                   with |a| within `quietLevel` g of 1 g for `quietTime`
+                   seconds before & after
+      double flip  the face goes A -> B -> A, B lasting under `doubleFlipTime`
+                   seconds
+    After an event, shakes & taps are ignored for `refractory` seconds
+    """
+    def __init__(self, rate=40, countsPerG=COUNTS_PER_G, shakeLevel=0.35, shakeCrossings=4,
+                 shakeGap=0.2, tapLevel=0.5, tapSamples=3, quietLevel=0.15, quietTime=0.2,
+                 doubleFlipTime=1.2, refractory=1.0):
+        self.shift = 0 # scales the counts down to ~1024 per g, so every square is a small int
+        while countsPerG >> self.shift > 1024:
+            self.shift += 1
+        unit = countsPerG >> self.shift
+        self.shakeLevel = int(shakeLevel * unit)
+        self.shakeCrossings = shakeCrossings
+        self.shakeGap = int(shakeGap * rate)
+        self.tapLevel2 = int(((1 + tapLevel) * unit) ** 2)
+        self.tapSamples = tapSamples
+        self.quietLow2 = int(((1 - quietLevel) * unit) ** 2)
+        self.quietHigh2 = int(((1 + quietLevel) * unit) ** 2)
+        self.quietSamples = max(1, int(quietTime * rate))
+        self.doubleFlipSamples = int(doubleFlipTime * rate)
+        self.refractorySamples = int(refractory * rate)
+        self.maxCount = 4 * rate # counters saturate here (stay small ints)
+
+        # Shake: per axis running average (x8), swing sign, samples since the
+        # last sign change & sign changes in a row
+        self.mean8 = [0, 0, 0]
+        self.sign = [0, 0, 0]
+        self.sinceCross = [0, 0, 0]
+        self.crossRun = [0, 0, 0]
+        # Tap
+        self.quietRun = 0 # quiet samples in a row
+        self.spikeAge = -1 # samples since the spike started, -1 = none
+        self.postQuiet = 0
+        # Double flip
+        self.face = 0
+        self.lastFace = 0
+        self.sinceFace = 0 # samples on the current face
+        self.quietFor = 0 # refractory countdown
+        self.started = False
+
+    def add(self, x, y, z, face=0):
+        shift = self.shift
+        x >>= shift
+        y >>= shift
+        z >>= shift
+        if not self.started:
+            self.started = True
+            self.mean8[0] = x << 3
+            self.mean8[1] = y << 3
+            self.mean8[2] = z << 3
+        event = GESTURE_NONE
+        if self.quietFor:
+            self.quietFor -= 1
+
+        # Shake: sign changes of each axis around its running average
+        maxCount = self.maxCount
+        level = self.shakeLevel
+        for axis in range(3):
+            v = x if axis == 0 else y if axis == 1 else z
+            mean8 = self.mean8[axis]
+            swing = v - (mean8 >> 3)
+            self.mean8[axis] = mean8 + swing # += v - mean8/8
+            since = self.sinceCross[axis]
+            if since < maxCount:
+                self.sinceCross[axis] = since + 1
+            sign = 1 if swing > level else -1 if swing < -level else 0
+            if sign != 0 and sign != self.sign[axis]:
+                if self.sign[axis] != 0:
+                    run = self.crossRun[axis] + 1 if since <= self.shakeGap else 1
+                    self.crossRun[axis] = run
+                    self.sinceCross[axis] = 0
+                    if run >= self.shakeCrossings and not self.quietFor:
+                        event = GESTURE_SHAKE
+                self.sign[axis] = sign
+        if event == GESTURE_SHAKE:
+            self.crossRun[0] = self.crossRun[1] = self.crossRun[2] = 0
+            self.spikeAge = -1
+            self.quietFor = self.refractorySamples
+
+        # Tap: a short spike in |a| between quiet stretches
+        mag2 = x*x + y*y + z*z
+        quiet = self.quietLow2 <= mag2 <= self.quietHigh2
+        if self.spikeAge < 0:
+            if mag2 >= self.tapLevel2 and self.quietRun >= self.quietSamples and not self.quietFor:
+                self.spikeAge = 0
+                self.postQuiet = 0
+        else:
+            self.spikeAge += 1
+            if quiet:
+                self.postQuiet += 1
+                if self.postQuiet >= self.quietSamples:
+                    event = GESTURE_TAP
+                    self.spikeAge = -1
+                    self.quietFor = self.refractorySamples
+            elif self.spikeAge >= self.tapSamples:
+                self.spikeAge = -1 # too long for a tap
+            else:
+                self.postQuiet = 0
+        if quiet:
+            if self.quietRun < maxCount:
+                self.quietRun += 1
+        else:
+            self.quietRun = 0
+
+        # Double flip: back on the previous face soon after leaving it
+        if self.sinceFace < maxCount:
+            self.sinceFace += 1
+        if face != 0 and face != self.face:
+            if face == self.lastFace and self.sinceFace <= self.doubleFlipSamples:
+                event = GESTURE_DOUBLE_FLIP
+                self.lastFace = 0 # A -> B -> A -> B is one double flip
+            else:
+                self.lastFace = self.face
+            self.face = face
+            self.sinceFace = 0
+        return event
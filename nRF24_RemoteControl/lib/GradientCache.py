@@ -0,0 +1,96 @@
+# Remote Control - Gradient cache
+#   expanding a ColorGradient's stops into per-pixel RGB for a strip is the
+#   slowest part of showing it, & the receiver keeps flipping between the
+#   same few gradients as the cube gets rotated. The expanded tables are
+#   kept, keyed by the gradient's descriptor & the strip length, & the least
+#   recently used ones are dropped once they'd exceed a byte budget
+#
+# Usage:
+#   cache = GradientCache(4096)
+#   table = cache.get((gradient.toString(), numPixels), lambda: expandGradient(stops, numPixels))
+#   r, g, b = table[3*i : 3*i + 3]
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+
+def expandGradient(stops, length):
+    """
+    bytearray of `length` RGB triplets, linearly interpolated between the
+    (r, g, b) stops spread evenly from the first to the last pixel
+    """
+    table = bytearray(3 * length)
+    numSegments = len(stops) - 1
+    if numSegments < 1 or length < 2:
+        if stops:
+            for i in range(length):
+                table[3*i : 3*i + 3] = bytes(stops[0])
+        return table
+    span = length - 1
+    idx = 0
+    for i in range(length):
+        pos = i * numSegments # position in stops, times span
+        seg = min(pos // span, numSegments - 1)
+        frac = pos - seg * span # 0 to span
+        r0, g0, b0 = stops[seg]
+        r1, g1, b1 = stops[seg + 1]
+        table[idx] = r0 + (r1 - r0) * frac // span
+        table[idx + 1] = g0 + (g1 - g0) * frac // span
+        table[idx + 2] = b0 + (b1 - b0) * frac // span
+        idx += 3
+    return table
+
+
+class GradientCache:
+    """
+    Least recently used tables are evicted while the total would exceed
+    `budgetBytes` (counting the tables' data only). A table larger than the
+    whole budget is built & returned but not kept
+    """
+    def __init__(self, budgetBytes=4096):
+        self.budgetBytes = budgetBytes
+        self.tables = {} # key -> table
+        self.order = [] # keys, least recently used first (dicts aren't ordered on every port)
+        self.bytesUsed = 0
+        self.numHits = 0
+        self.numMisses = 0
+        self.numEvictions = 0
+
+    def get(self, key, build):
+        """
+        The table for `key`, calling build() to make it on a miss
+        """
+        table = self.tables.get(key)
+        if table is not None:
+            self.numHits += 1
+            if self.order[-1] != key:
+                self.order.remove(key)
+                self.order.append(key)
+            return table
+        self.numMisses += 1
+        table = build()
+        size = len(table)
+        if size > self.budgetBytes:
+            return table
+        while self.bytesUsed + size > self.budgetBytes:
+            self.bytesUsed -= len(self.tables.pop(self.order.pop(0)))
+            self.numEvictions += 1
+        self.tables[key] = table
+        self.order.append(key)
+        self.bytesUsed += size
+        return table
+
+    def clear(self):
+        self.tables = {}
+        self.order = []
+        self.bytesUsed = 0
+
+    def hitRate(self):
+        lookups = self.numHits + self.numMisses
+        return self.numHits / lookups if lookups else 0.0
+
+    def report(self):
+        return "{} tables, {}/{} bytes, hit rate {:.0f}% ({} hits, {} misses, {} evicted)".format(
+            len(self.tables), self.bytesUsed, self.budgetBytes, 100 * self.hitRate(),
+            self.numHits, self.numMisses, self.numEvictions)
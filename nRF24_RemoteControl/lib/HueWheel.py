@@ -0,0 +1,93 @@
+# Remote Control - Integer hue wheel
+#   HSV -> RGB without floating point per conversion: a precomputed wheel of
+#   the fully saturated, full value colors (6 sectors of 256 steps, one byte
+#   per channel) & a 256 entry table per saturation/value pair that maps a
+#   wheel byte to the final channel value. A conversion is an index
+#   computation & three table lookups. The value table alone also replaces
+#   the receiver's adjColor() brightness scaling
+#
+# Usage:
+#   wheel = HueWheel()
+#   r, g, b = wheel.rgb(240.0, 1.0, 0.5) # hue in degrees, sat & val 0 to 1
+#   r, g, b = wheel.scale((255, 128, 0), brightness)
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+SECTOR_STEPS = 256
+HUE_STEPS = 6 * SECTOR_STEPS # 1536, ~0.23 degrees each
+MAX_SCALE_TABLES = 8 # (sat, val) pairs kept, brightness levels & a few solids
+
+
+def buildWheel():
+    """
+    bytearray of HUE_STEPS RGB triplets, red at 0, yellow at 256, green at
+    512, ... (what colorsys.hsv_to_rgb(h, 1, 1) gives, in integers)
+    """
+    wheel = bytearray(3 * HUE_STEPS)
+    for step in range(HUE_STEPS):
+        sector, pos = divmod(step, SECTOR_STEPS)
+        rising = pos * 255 // SECTOR_STEPS
+        falling = 255 - rising
+        if sector == 0: rgb = (255, rising, 0)
+        elif sector == 1: rgb = (falling, 255, 0)
+        elif sector == 2: rgb = (0, 255, rising)
+        elif sector == 3: rgb = (0, falling, 255)
+        elif sector == 4: rgb = (rising, 0, 255)
+        else: rgb = (255, 0, falling)
+        wheel[3*step : 3*step + 3] = bytes(rgb)
+    return wheel
+
+
+def buildScaleTable(sat, val):
+    """
+    bytearray mapping a wheel channel (0 to 255) to the channel at `sat` &
+    `val`: val * (255 - sat * (255 - channel)), truncated like int()
+    """
+    table = bytearray(256)
+    for channel in range(256):
+        table[channel] = int(val * (255 - sat * (255 - channel)))
+    return table
+
+
+class HueWheel:
+    """
+    The wheel (4.5 kB) is built on the first rgb(), so scale() alone (e.g.
+    brightness) only costs its tables. Scale tables are built on first use
+    of a (sat, val) pair; the oldest ones are dropped past MAX_SCALE_TABLES
+    """
+    def __init__(self):
+        self.wheel = None
+        self.tables = {} # (sat, val) -> scale table
+        self.order = [] # keys, oldest first
+        self.numTableBuilds = 0
+
+    def scaleTable(self, sat, val):
+        key = (sat, val)
+        table = self.tables.get(key)
+        if table is None:
+            if len(self.order) >= MAX_SCALE_TABLES:
+                del self.tables[self.order.pop(0)]
+            table = self.tables[key] = buildScaleTable(sat, val)
+            self.order.append(key)
+            self.numTableBuilds += 1
+        return table
+
+    def rgb(self, hue, sat=1.0, val=1.0):
+        """
+        (r, g, b) for a hue in degrees (any value, wraps around)
+        """
+        idx = 3 * (int(hue * HUE_STEPS / 360 + 0.5) % HUE_STEPS)
+        wheel = self.wheel
+        if wheel is None:
+            wheel = self.wheel = buildWheel()
+        table = self.scaleTable(sat, val)
+        return (table[wheel[idx]], table[wheel[idx + 1]], table[wheel[idx + 2]])
+
+    def scale(self, color, factor):
+        """
+        An (r, g, b) color times `factor` (0 to 1), floored like adjColor()
+        """
+        table = self.scaleTable(1.0, factor)
+        return (table[color[0]], table[color[1]], table[color[2]])
@@ -0,0 +1,102 @@
+# Remote Control - Auto-retransmit tuner
+#   adjusts the nRF24's auto-retransmit delay (ard) & count (arc), and
+#   optionally its pa_level, from the send results of a sliding window
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+ARD_STEPS = (250, 500, 750, 1000, 1500, 2000, 3000, 4000) # us
+PA_STEPS = (-18, -12, -6, 0) # dBm
+MAX_ARC = 15
+
+
+class RetransmitTuner:
+    """
+    Feed it every acknowledged send with `record()`; once per window it makes
+    at most one adjustment:
+      - sends failing: back up to the power level it lowered from (and stay
+        there), else more retries, then longer gaps between them (for bursty
+        interference), then (optionally) more power
+      - no failures, but retries are common: shorter gaps, so the retries
+        that do succeed finish sooner
+      - no failures & hardly any retries: fewer retries (failed sends block
+        for less time), then (optionally) less power
+    """
+    def __init__(self, nrf, window=20, failHigh=0.05, retriesHigh=0.5, retriesLow=0.1,
+                 minArd=500, minArc=2, tunePaLevel=False, log=print):
+        self.nrf = nrf
+        self.window = window
+        self.failHigh = failHigh
+        self.retriesHigh = retriesHigh
+        self.retriesLow = retriesLow
+        self.minArd = minArd # ACK payloads longer than 5 bytes need >= 500 us at 1 Mbps
+        self.minArc = minArc
+        self.tunePaLevel = tunePaLevel
+        self.log = log
+        self.numAdjustments = 0
+        self.paFloor = 0 # index into PA_STEPS it won't lower pa_level past
+        self.paLowered = False
+        self._reset()
+
+    def _reset(self):
+        self.numSends = 0
+        self.numFailures = 0
+        self.sumRetries = 0
+        self.maxRetries = 0
+
+    def record(self, success, retries=None):
+        """
+        Call after every send that asked for an ACK. `retries` defaults to the
+        radio's `last_tx_arc` (failed sends used every retry)
+        """
+        if retries is None:
+            retries = getattr(self.nrf, "last_tx_arc", 0) if success else self.nrf.arc
+        self.numSends += 1
+        self.sumRetries += retries
+        if retries > self.maxRetries:
+            self.maxRetries = retries
+        if not success:
+            self.numFailures += 1
+        if self.numSends >= self.window:
+            self._evaluate()
+            self._reset()
+
+    def _adjust(self, name, old, new, reason):
+        setattr(self.nrf, name, new)
+        self.numAdjustments += 1
+        if self.log is not None:
+            self.log("Tuner: {} {} -> {} ({})".format(name, old, new, reason))
+
+    def _evaluate(self):
+        nrf = self.nrf
+        failRate = self.numFailures / self.numSends
+        meanRetries = self.sumRetries / self.numSends
+        reason = "fail {:.0f}%, {:.2f} retries/send".format(failRate * 100, meanRetries)
+        ardIdx = ARD_STEPS.index(nrf.ard) if nrf.ard in ARD_STEPS else ARD_STEPS.index(1500)
+        paIdx = PA_STEPS.index(nrf.pa_level) if nrf.pa_level in PA_STEPS else len(PA_STEPS) - 1
+
+        if failRate > self.failHigh:
+            if self.paLowered:
+                self.paFloor = paIdx + 1
+                self.paLowered = False
+                self._adjust("pa_level", nrf.pa_level, PA_STEPS[paIdx + 1], reason)
+            elif nrf.arc < MAX_ARC:
+                self._adjust("arc", nrf.arc, min(MAX_ARC, nrf.arc + 4), reason)
+            elif ardIdx < len(ARD_STEPS) - 1:
+                self._adjust("ard", nrf.ard, ARD_STEPS[ardIdx + 1], reason)
+            elif self.tunePaLevel and paIdx < len(PA_STEPS) - 1:
+                self.paFloor = paIdx + 1
+                self._adjust("pa_level", nrf.pa_level, PA_STEPS[paIdx + 1], reason)
+        elif self.numFailures == 0:
+            if meanRetries > self.retriesHigh:
+                if ARD_STEPS[ardIdx] > self.minArd:
+                    self._adjust("ard", nrf.ard, ARD_STEPS[ardIdx - 1], reason)
+            elif meanRetries < self.retriesLow:
+                # keep a couple of retries of headroom above what was needed
+                arcFloor = max(self.minArc, self.maxRetries + 2)
+                if nrf.arc > arcFloor:
+                    self._adjust("arc", nrf.arc, max(arcFloor, nrf.arc - 2), reason)
+                elif self.tunePaLevel and self.sumRetries == 0 and paIdx > self.paFloor:
+                    self.paLowered = True
+                    self._adjust("pa_level", nrf.pa_level, PA_STEPS[paIdx - 1], reason)
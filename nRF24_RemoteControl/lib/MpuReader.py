@@ -0,0 +1,85 @@
+# Remote Control - MPU6050 burst reader
+#   reads the accelerometer (or accelerometer, temperature & gyro) data
+#   registers in a single I2C transaction into a reused buffer, instead of the
+#   adafruit_mpu6050 properties' one transaction (& a few objects) per axis
+#
+# Works on any bus I2CDevice does (busio, bitbangio). Keep the adafruit_mpu6050
+# object around for configuration, e.g. reader = MpuBurstReader.fromSensor(sensor)
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import struct
+from math import pi
+from adafruit_bus_device.i2c_device import I2CDevice
+
+MPU6050_ADDRESS = 0x68
+ACCEL_XOUT_H = 0x3B # followed by accel Y/Z, temperature & gyro X/Y/Z (big-endian int16)
+STANDARD_GRAVITY = 9.80665 # m/s^2
+ACCEL_COUNTS_PER_G = (16384, 8192, 4096, 2048) # per accelerometer_range
+GYRO_COUNTS_PER_DPS = (131.0, 65.5, 32.8, 16.4) # per gyro_range
+
+
+class MpuBurstReader:
+    def __init__(self, i2c=None, address=MPU6050_ADDRESS, withGyro=False, accelRange=0, gyroRange=1, device=None):
+        self.device = device if device is not None else I2CDevice(i2c, address)
+        self.register = bytes([ACCEL_XOUT_H])
+        self.buf = bytearray(14 if withGyro else 6)
+        self.withGyro = withGyro
+        self.accelScale = STANDARD_GRAVITY / ACCEL_COUNTS_PER_G[accelRange] # counts -> m/s^2
+        self.gyroScale = pi / 180 / GYRO_COUNTS_PER_DPS[gyroRange] # counts -> rad/s
+
+    @classmethod
+    def fromSensor(cls, sensor, withGyro=False):
+        """
+        Shares an adafruit_mpu6050.MPU6050's I2CDevice & ranges
+        """
+        return cls(withGyro=withGyro, accelRange=sensor.accelerometer_range,
+                   gyroRange=sensor.gyro_range, device=sensor.i2c_device)
+
+    def read(self):
+        """
+        One burst read into self.buf
+        """
+        with self.device as device:
+            device.write_then_readinto(self.register, self.buf)
+        return self.buf
+
+    def counts(self):
+        """
+        Raw (x, y, z) accelerometer counts, or (ax, ay, az, temp, gx, gy, gz)
+        withGyro
+        """
+        self.read()
+        return struct.unpack_from(">hhhhhhh" if self.withGyro else ">hhh", self.buf)
+
+    def readInto(self, counts):
+        """
+        Raw counts into the list `counts` (x, y, z[, gx, gy, gz]) without
+        allocating anything
+        """
+        buf = self.read()
+        for i in range(len(counts)):
+            idx = 2*i if i < 3 else 2*i + 2 # skip the temperature
+            raw = buf[idx] << 8 | buf[idx + 1]
+            if raw & 0x8000:
+                raw -= 0x10000 # two's complement
+            counts[i] = raw
+
+    def acceleration(self):
+        """
+        Same as MPU6050.acceleration (m/s^2)
+        """
+        self.read()
+        x, y, z = struct.unpack_from(">hhh", self.buf)
+        scale = self.accelScale
+        return x * scale, y * scale, z * scale
+
+    def lastGyro(self):
+        """
+        Same as MPU6050.gyro (rad/s), from the last read (withGyro)
+        """
+        x, y, z = struct.unpack_from(">hhh", self.buf, 8)
+        scale = self.gyroScale
+        return x * scale, y * scale, z * scale
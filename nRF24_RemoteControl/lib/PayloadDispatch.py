@@ -0,0 +1,117 @@
+# Remote Control - Payload dispatch
+#   decides what a received payload is from its first characters, without
+#   trying decoders until one doesn't raise: a "#XX" tag (hop sequence,
+#   config patch, telemetry, delta), a ColorMethod (recognized by the prefix
+#   & closing bracket of its toString()) or a bare face index. Anything else,
+#   e.g. chunks of an interrupted send, is counted as malformed instead of
+#   being swallowed by a bare except
+#
+# Usage:
+#   dispatcher = PayloadDispatcher(ColorMethod(ModeStationary, ColorOff).toString())
+#   kind = dispatcher.classify(payloadContents)
+#   if kind == KIND_FACE: faceIdx = float(payloadContents) # can't raise
+#   dispatcher.reject(kind) # a decoder still found it invalid
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+from lib.ChannelSelect import HOP_TAG
+from lib.DeltaState import DELTA_TAG
+from lib.RemoteConfig import CONFIG_TAG
+from lib.RemoteLink import PROBE_PAYLOAD
+
+TELEMETRY_TAG = "#TL" # lib/EnergyMonitor.py's, which can't be imported on the host (supervisor)
+
+KIND_NONE = 0 # nothing received
+KIND_HOP = 1
+KIND_CONFIG = 2
+KIND_TELEMETRY = 3
+KIND_DELTA = 4
+KIND_METHOD = 5
+KIND_FACE = 6
+KIND_PROBE = 7 # the transmitter's ACK echo probe, answered by the ACK payload itself
+KIND_MALFORMED = 8
+KIND_NAMES = ("none", "hop", "config", "telemetry", "delta", "method", "face", "probe", "malformed")
+
+TAG_LENGTH = 3
+TAG_KINDS = {
+    HOP_TAG.decode(): KIND_HOP,
+    CONFIG_TAG: KIND_CONFIG,
+    TELEMETRY_TAG: KIND_TELEMETRY,
+    DELTA_TAG: KIND_DELTA,
+}
+BRACKETS = {"(": ")", "[": "]", "{": "}"}
+PROBE_TEXT = PROBE_PAYLOAD.decode()
+MAX_FACE_DIGITS = 8
+
+
+def isFaceNumber(text):
+    """
+    True if float(text) would work on it: digits with at most one point
+    """
+    if not 0 < len(text) <= MAX_FACE_DIGITS:
+        return False
+    numDigits = 0
+    numPoints = 0
+    for c in text:
+        if "0" <= c <= "9":
+            numDigits += 1
+        elif c == ".":
+            numPoints += 1
+        else:
+            return False
+    return numDigits > 0 and numPoints <= 1
+
+
+class PayloadDispatcher:
+    """
+    `methodSample` is any ColorMethod's toString(): its leading name up to
+    & including the first bracket is what every method payload starts with
+    """
+    def __init__(self, methodSample):
+        end = 0
+        while end < len(methodSample) and (methodSample[end].isalpha() or methodSample[end] == "_"):
+            end += 1
+        opener = methodSample[end] if end < len(methodSample) else ""
+        self.methodPrefix = methodSample[: end + 1] if opener in BRACKETS else methodSample[:end]
+        self.methodEnd = BRACKETS.get(opener, "")
+        self.counts = [0] * len(KIND_NAMES)
+        self.numRejected = 0 # classified, then refused by its decoder
+
+    def classify(self, payload):
+        """
+        Returns the payload's kind, most frequent checks first (one call, the
+        good payloads shouldn't pay for the dispatch)
+        """
+        if not payload:
+            kind = KIND_NONE
+        elif payload.startswith(self.methodPrefix):
+            kind = KIND_METHOD if payload.endswith(self.methodEnd) else KIND_MALFORMED # truncated
+        elif payload[0] == "#":
+            kind = TAG_KINDS.get(payload[:TAG_LENGTH], KIND_MALFORMED)
+        elif payload == PROBE_TEXT:
+            kind = KIND_PROBE
+        elif isFaceNumber(payload):
+            kind = KIND_FACE
+        else:
+            kind = KIND_MALFORMED
+        self.counts[kind] += 1
+        return kind
+
+    def reject(self, kind):
+        """
+        The payload looked like `kind` but its decoder refused it, counts it
+        as malformed instead
+        """
+        self.counts[kind] -= 1
+        self.counts[KIND_MALFORMED] += 1
+        self.numRejected += 1
+
+    @property
+    def numMalformed(self):
+        return self.counts[KIND_MALFORMED]
+
+    def report(self):
+        return ", ".join("{}={}".format(name, count) for name, count in zip(KIND_NAMES[1:], self.counts[1:])) \
+            + " ({} refused by their decoder)".format(self.numRejected)
@@ -0,0 +1,253 @@
+# Remote Control - Radio power gating
+#   keeps the nRF24L01 powered down between transmissions instead of idling
+#   in standby after the first send: wake() powers it up & waits out the
+#   crystal start-up, sleep() powers it down again, and the time spent awake
+#   adds up into a duty-cycle report. On the receiving side, the transmitter
+#   sends on a fixed beacon grid & the receiver only listens around it
+#
+# Usage:
+#   gate = RadioPowerGate(nrf)
+#   gate.wake(); sendPayload(nrf, payload); gate.sleep()
+#   print(gate.report())
+#
+#   beacons = BeaconClock(1.0) # transmitter: if beacons.due(): send
+#   listener = BeaconListener(nrf, 1.0) # receiver: if listener.update(): receive,
+#                                       # then listener.heard() if anything came in
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import time
+
+SETTLE_TIME = 0.0015 # seconds, power down -> standby with the crystal (Tpd2stby)
+
+# Typical currents (mA), datasheet values
+STARTUP_MA = 0.4 # while the crystal starts up
+STANDBY_MA = 0.026 # standby-I, powered up & idle
+POWER_DOWN_MA = 0.0009
+RX_MA = 13.5 # listening at 1 Mbps
+
+
+class RadioPowerGate:
+    """
+    Wraps every transmission in wake()/sleep(). They nest, so a helper that
+    wakes the radio itself can be called from inside an already awake block.
+    With enabled=False nothing is switched, only counted, i.e. the library's
+    behavior of leaving the radio in standby, to compare the report against
+    """
+    def __init__(self, nrf, enabled=True, settleTime=SETTLE_TIME, clock=time.monotonic_ns, sleep=time.sleep):
+        self.nrf = nrf
+        self.enabled = enabled
+        self.settleTime = settleTime
+        self.clock = clock # the host simulation passes its virtual clock
+        self.sleepFor = sleep
+        self.depth = 0 # nested wake() calls
+        self.start = clock()
+        self.awakeSince = 0
+        self.numWakes = 0 # power ups (or transmit blocks, when not enabled)
+        self.awake_ns = 0 # powered up on behalf of a transmission, incl. the settle time
+        self.settle_ns = 0
+
+    def wake(self):
+        self.depth += 1
+        if self.depth > 1:
+            return
+        self.awakeSince = self.clock()
+        self.numWakes += 1
+        if self.enabled and not self.nrf.power:
+            self.nrf.power = True
+            self.sleepFor(self.settleTime) # the library only waits ~150 us in write()
+            self.settle_ns += self.clock() - self.awakeSince
+
+    def sleep(self):
+        if self.depth == 0:
+            return
+        self.depth -= 1
+        if self.depth:
+            return
+        self.awake_ns += self.clock() - self.awakeSince
+        if self.enabled:
+            self.nrf.power = False
+
+    def send(self, send, *args, **kwargs):
+        """
+        Runs `send(*args, **kwargs)` with the radio awake, returns its result
+        """
+        self.wake()
+        try:
+            return send(*args, **kwargs)
+        finally:
+            self.sleep()
+
+    ### Reporting
+    def idleCharge(self, elapsed_ns):
+        """
+        uC spent outside of transmissions over `elapsed_ns`: start-ups &
+        power down when gated, standby otherwise
+        """
+        idle = elapsed_ns - self.awake_ns
+        if self.enabled:
+            return (idle * POWER_DOWN_MA + self.settle_ns * (STARTUP_MA - STANDBY_MA)) / 1e6
+        return idle * STANDBY_MA / 1e6
+
+    def report(self):
+        elapsed = self.clock() - self.start
+        if elapsed <= 0:
+            return "no time elapsed"
+        hours = elapsed / 3.6e12
+        awake = self.awake_ns - self.settle_ns # settle time is reported on its own
+        return "{} {:.2f}% awake ({:.0f} ms/h sending, {:.0f} wakes/h, {:.0f} ms/h settling) | idle {:.2f} uAh/h{}".format(
+            "gated" if self.enabled else "standby between sends", 100 * self.awake_ns / elapsed,
+            awake / 1e6 / hours, self.numWakes / hours, self.settle_ns / 1e6 / hours,
+            self.idleCharge(elapsed) / 3600 / hours,
+            " (standby would be {:.2f})".format((elapsed - self.awake_ns) * STANDBY_MA / 1e6 / 3600 / hours)
+            if self.enabled else "")
+
+
+### Beacon-aligned listening
+class BeaconClock:
+    """
+    Transmitter side: a fixed grid of send times every `period` seconds, so
+    the receiver can predict them. Unlike a timer reset after each send, a
+    late send doesn't shift the following ones
+    """
+    def __init__(self, period, clock=None):
+        self.clock = clock if clock is not None else time
+        self.period_ns = int(period * 1e9)
+        self.next = self.clock.monotonic_ns() + self.period_ns
+        self.numSkipped = 0 # grid slots the main loop was too busy for
+
+    def due(self):
+        now = self.clock.monotonic_ns()
+        if now < self.next:
+            return False
+        self.next += self.period_ns
+        if now >= self.next: # more than a period late, stay on the grid
+            late = (now - self.next) // self.period_ns + 1
+            self.next += late * self.period_ns
+            self.numSkipped += late
+        return True
+
+
+class BeaconListener:
+    """
+    Receiver side: listens continuously until the transmitter is heard, then
+    only in windows around its next beacons (`early` seconds before to `late`
+    seconds after, which covers the transmitter's loop jitter & retransmits),
+    powered down in between. Each beacon heard nudges the expected phase &
+    period (the two crystals drift apart), each one missed widens the next
+    window, & after `missLimit` misses in a row it falls back to listening
+    continuously. Call update() every loop: it switches the radio & returns
+    True while the receive path should run; call heard() when a packet came in
+    """
+    def __init__(self, nrf, period, early=0.004, late=0.008, missLimit=3, clock=None):
+        self.nrf = nrf
+        self.clock = clock if clock is not None else time
+        self.period_ns = int(period * 1e9) # estimated, in the receiver's time
+        self.nominal_ns = self.period_ns
+        self.early_ns = int((early + SETTLE_TIME) * 1e9) # the radio starts up inside the window
+        self.late_ns = int(late * 1e9)
+        self.missLimit = missLimit
+        self.synced = False
+        self.anchor = 0 # when the last beacon was expected (adjusted by the ones heard)
+        self.syncStart = 0 # first beacon of the current phase & beacons since, for the period
+        self.syncBeacons = 0
+        self.windowEnd = 0 # 0 = no window open
+        self.heardInWindow = False
+        self.numMissed = 0 # in a row
+        self.start = self.listenSince = self.clock.monotonic_ns()
+        self.listen_ns = 0
+        self.numWindows = 0
+        self.numBeacons = 0
+        self.numMisses = 0
+        self.numResyncs = 0
+        self._listen(True)
+
+    def _listen(self, on):
+        if on:
+            if not self.nrf.listen:
+                self.nrf.listen = True # also powers up
+                self.listenSince = self.clock.monotonic_ns()
+        elif self.nrf.listen or self.nrf.power:
+            self.listen_ns += self.clock.monotonic_ns() - self.listenSince
+            self.nrf.listen = False
+            self.nrf.power = False
+
+    def update(self):
+        if not self.synced:
+            self._listen(True)
+            return True
+        now = self.clock.monotonic_ns()
+        if self.windowEnd:
+            if now < self.windowEnd:
+                self._listen(True) # the receive path may have left RX mode
+                return True
+            self._closeWindow()
+            return False
+        widen = self.numMissed * self.late_ns # the uncertainty grows with every miss
+        expected = self.anchor + self.period_ns
+        if now >= expected - self.early_ns - widen:
+            self.windowEnd = expected + self.late_ns + widen
+            self.heardInWindow = False
+            self.numWindows += 1
+            self._listen(True)
+            return True
+        return False
+
+    def _closeWindow(self):
+        self.windowEnd = 0
+        self._listen(False)
+        if self.heardInWindow:
+            return
+        self.anchor += self.period_ns # it was sent, or at least due
+        self.syncBeacons += 1
+        self.numMissed += 1
+        self.numMisses += 1
+        if self.numMissed >= self.missLimit:
+            self.synced = False
+            self.numResyncs += 1
+            self._listen(True)
+
+    def heard(self):
+        """
+        Call with every packet (payload) received, as soon as it's read
+        """
+        now = self.clock.monotonic_ns()
+        if self.heardInWindow:
+            self.windowEnd = max(self.windowEnd, now + self.late_ns) # rest of a multi-packet payload
+            return
+        self.numBeacons += 1
+        self.numMissed = 0
+        if self.windowEnd:
+            self.heardInWindow = True
+        if not self.synced:
+            self.synced = True
+            self._resync(now)
+            self.windowEnd = now + self.late_ns
+            self.heardInWindow = True
+            return
+        elapsed = now - self.anchor
+        beacons = max(1, (elapsed + self.period_ns // 2) // self.period_ns)
+        error = elapsed - beacons * self.period_ns
+        if not -self.early_ns <= error <= self.late_ns:
+            self._resync(now) # the transmitter restarted on a new phase
+            return
+        self.anchor = now - error // 2 # halfway, the arrival itself jitters
+        self.syncBeacons += beacons
+        if self.syncBeacons >= 8: # drift: the average period since syncing, the jitter averages out
+            self.period_ns = (now - self.syncStart) // self.syncBeacons
+
+    def _resync(self, now):
+        self.anchor = self.syncStart = now
+        self.syncBeacons = 0
+
+    def dutyCycle(self):
+        now = self.clock.monotonic_ns()
+        listen = self.listen_ns + (now - self.listenSince if self.nrf.listen else 0)
+        return listen / max(1, now - self.start)
+
+    def report(self):
+        return "{} {:.2f}% listening, {} windows, {} beacons, {} missed, {} resyncs, drift {:+.0f} ppm".format(
+            "synced" if self.synced else "searching", 100 * self.dutyCycle(), self.numWindows, self.numBeacons,
+            self.numMisses, self.numResyncs, (self.period_ns - self.nominal_ns) * 1e6 / self.nominal_ns)
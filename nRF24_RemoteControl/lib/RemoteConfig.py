@@ -0,0 +1,273 @@
+# Remote Control - Persistent configuration
+#   the settings the transmit/receive scripts used to hard-code (addresses,
+#   pins, power level, timers, brightness, face -> color mapping) as one
+#   versioned binary record in microcontroller.nvm, loaded with a single
+#   struct.unpack_from at boot & patchable at runtime, over the serial console
+#   ("name=value") or over the radio (a "#CF" tagged payload)
+#
+# Usage:
+#   config = RemoteConfig.load(microcontroller.nvm, paLevel=-12) # script defaults if none stored
+#   nrf.pa_level = config.paLevel
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import struct, sys
+try:
+    import supervisor # for the serial console
+except ImportError:
+    supervisor = None # host
+
+NVM_OFFSET = 32 # after the accelerometer calibration (lib/AccelCalibration.py)
+NVM_MAGIC = b"RC"
+NVM_VERSION = 2 # 2: face mapping pages
+CONFIG_TAG = "#CF" # radio patch: tag + "name=value"
+FACE_PAGES = 2 # face -> method mappings to switch between
+NUM_METHODS = 10 # entries in the transmitter's colorMethods table
+PA_LEVELS = (0, -6, -12, -18) # dBm, what nrf.pa_level accepts
+MAX_TIME = 3600.0 # seconds, longest timer setting
+
+# (name, struct format, default), in record order. The addresses are from the
+# transmitter's side, the receiver swaps them; pins are board attribute names
+FIELDS = (
+    ("txAddress", "5s", b"1Node"),
+    ("rxAddress", "5s", b"2Node"),
+    ("cePin", "4s", b"D0"),
+    ("csnPin", "4s", b"D1"),
+    ("paLevel", "b", 0), # dBm: 0, -6, -12 or -18
+    ("numAvgValues", "B", 7),
+    ("brightness", "f", 0.1), # receiver LED, 0 to 1
+    ("updateTime_faceIdx", "f", 1.1/40), # seconds
+    ("updateTime_changes", "f", 0.01),
+    ("updateTime_autosend", "f", 1.0),
+    ("updateTime_confirm", "f", 0.05),
+    ("updateTime_receive", "f", 0.01),
+    ("updateDur_receive", "f", 0.011),
+    ("faceMethods", "12B", (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 4)), # per page & face, index into the transmitter's method table
+    ("facePage", "B", 0), # the page in use
+)
+NVM_FORMAT = "<2sB" + "".join(fmt for _, fmt, _ in FIELDS) + "B" # magic, version, fields, checksum
+NVM_SIZE = struct.calcsize(NVM_FORMAT)
+
+
+def _fieldLayout():
+    # (name, first value index, number of values or 0 for bytes/a single value)
+    layout = []
+    idx = 2 # after magic & version
+    for name, fmt, _ in FIELDS:
+        count = int(fmt[:-1]) if fmt[-1] != "s" and len(fmt) > 1 else 0
+        layout.append((name, idx, count))
+        idx += max(1, count)
+    return layout
+
+FIELD_LAYOUT = _fieldLayout()
+FIELD_FORMATS = dict((name, fmt) for name, fmt, _ in FIELDS)
+FIELD_COUNTS = dict((name, count) for name, _, count in FIELD_LAYOUT if count)
+
+
+def checksum(data):
+    return sum(data) & 0xFF
+
+
+def validValue(name, value):
+    """
+    False if a value fits its record slot but would stop the scripts at boot
+    (e.g. paLevel=5, numAvgValues=0, a timer of 0 or a pin the board lacks)
+    """
+    if name in ("txAddress", "rxAddress"):
+        return len(value) >= 3 # nRF24 addresses are 3 to 5 bytes
+    if name in ("cePin", "csnPin"):
+        if sys.implementation.name != "circuitpython":
+            return len(value) > 0 # host, whatever board module there is has other pins
+        import board
+        try:
+            return hasattr(board, value.rstrip(b"\0").decode())
+        except UnicodeError:
+            return False
+    if name == "paLevel":
+        return value in PA_LEVELS
+    if name == "numAvgValues":
+        return value >= 1
+    if name == "brightness":
+        return 0 <= value <= 1
+    if name.startswith("updateTime_") or name.startswith("updateDur_"):
+        return 0 < value <= MAX_TIME
+    if name == "faceMethods":
+        return all(idx < NUM_METHODS for idx in value)
+    if name == "facePage":
+        return value < FACE_PAGES
+    return True
+
+
+class RemoteConfig:
+    def __init__(self, **values):
+        for name, _, default in FIELDS:
+            setattr(self, name, values.get(name, default))
+        self.checkCounts()
+
+    def checkCounts(self):
+        """
+        Raises ValueError if a multi-value field (e.g. faceMethods, FACE_PAGES
+        * 6 values) doesn't have the number of values its record slot holds
+        """
+        for name, count in FIELD_COUNTS.items():
+            if len(getattr(self, name)) != count:
+                raise ValueError("{} needs {} values, got {}".format(name, count, len(getattr(self, name))))
+
+    ### Storage
+    def toBytes(self):
+        self.checkCounts()
+        values = [NVM_MAGIC, NVM_VERSION]
+        for name, fmt, _ in FIELDS:
+            value = getattr(self, name)
+            if fmt[-1] != "s" and len(fmt) > 1:
+                values.extend(value)
+            else:
+                values.append(value)
+        data = struct.pack(NVM_FORMAT, *(values + [0]))
+        return data[:-1] + bytes([checksum(data[:-1])])
+
+    @classmethod
+    def fromBytes(cls, data):
+        """
+        Returns the stored config, or None if `data` doesn't hold a valid one
+        (e.g. never saved, or saved by another version)
+        """
+        if len(data) < NVM_SIZE:
+            return None
+        values = struct.unpack_from(NVM_FORMAT, data)
+        if values[0] != NVM_MAGIC or values[1] != NVM_VERSION or values[-1] != checksum(data[:NVM_SIZE - 1]):
+            return None
+        config = cls.__new__(cls)
+        for name, idx, count in FIELD_LAYOUT:
+            value = values[idx:idx + count] if count else values[idx]
+            if isinstance(value, bytes):
+                value = value.rstrip(b"\0") # short pin names are padded
+            if not validValue(name, value):
+                return None # e.g. saved before a field was checked, use the defaults
+            setattr(config, name, value)
+        return config
+
+    @classmethod
+    def load(cls, nvm, offset=NVM_OFFSET, **defaults):
+        """
+        The config stored in `nvm`, otherwise one with the script's `defaults`
+        """
+        config = cls.fromBytes(nvm[offset:offset + NVM_SIZE]) # one read of the whole record
+        return config if config is not None else cls(**defaults)
+
+    def save(self, nvm, offset=NVM_OFFSET):
+        nvm[offset:offset + NVM_SIZE] = self.toBytes() # one erase/write cycle
+
+    ### Runtime changes
+    def pin(self, name):
+        """
+        The board pin a pin field names, e.g. board.D0 for b"D0"
+        """
+        import board
+        return getattr(board, getattr(self, name).rstrip(b"\0").decode())
+
+    def set(self, name, text):
+        """
+        Sets a field from its text form ("1Node", "-12", "0.05", "0,1,2,...,4"),
+        returns False if there's no such field or the value doesn't fit or
+        isn't valid for it (validValue)
+        """
+        fmt = FIELD_FORMATS.get(name)
+        if fmt is None:
+            return False
+        try:
+            if fmt[-1] == "s":
+                value = text.encode()
+                if len(value) > int(fmt[:-1]):
+                    return False
+            elif fmt[-1] == "f":
+                value = float(text)
+            elif len(fmt) > 1:
+                value = tuple(int(v) for v in text.replace(",", " ").split())
+            else:
+                value = int(text)
+            struct.pack("<" + fmt, *(value if isinstance(value, tuple) else (value,))) # range check
+        except (ValueError, struct.error):
+            return False
+        if not validValue(name, value):
+            return False
+        setattr(self, name, value)
+        return True
+
+    def __str__(self):
+        return ", ".join("{}={}".format(name, getattr(self, name)) for name, _, _ in FIELDS)
+
+
+### Radio patches
+def encodeConfigPatch(name, text):
+    return "{}{}={}".format(CONFIG_TAG, name, text)
+
+def decodeConfigPatch(payload):
+    """
+    Returns (name, text) of a patch, or None if the payload isn't one
+    """
+    if payload is None:
+        return None
+    if not isinstance(payload, str):
+        payload = bytes(payload).decode()
+    if not payload.startswith(CONFIG_TAG) or "=" not in payload:
+        return None
+    name, text = payload[len(CONFIG_TAG):].split("=", 1)
+    return name, text
+
+
+class ConfigConsole:
+    """
+    Non-blocking serial console, call poll() from the main loop:
+      name=value         change & save a setting (applied after a reset,
+                         unless onChange applies it right away)
+      remote name=value  send the patch to the other node over the radio
+      show               print the settings
+      reset              restart with the saved settings
+    """
+    def __init__(self, config, nvm, send=None, onChange=None, offset=NVM_OFFSET):
+        self.config = config
+        self.nvm = nvm
+        self.send = send # e.g. lambda payload: sendPayload(nrf, payload)
+        self.onChange = onChange # called with the name of a changed setting, to apply it live
+        self.offset = offset
+        self.line = ""
+
+    def poll(self):
+        if supervisor is None or not supervisor.runtime.serial_bytes_available:
+            return
+        while supervisor.runtime.serial_bytes_available:
+            char = sys.stdin.read(1)
+            if char in "\r\n":
+                line, self.line = self.line.strip(), ""
+                if line:
+                    self.handle(line)
+            else:
+                self.line += char
+
+    def handle(self, line):
+        if line == "show":
+            print(self.config)
+        elif line == "reset":
+            import microcontroller
+            microcontroller.reset()
+        elif line.startswith("remote ") and "=" in line:
+            name, text = line[len("remote "):].split("=", 1)
+            if self.send is None:
+                print("Config: no radio to send with")
+            else:
+                self.send(encodeConfigPatch(name.strip(), text.strip()))
+                print("Config: sent {}={}".format(name.strip(), text.strip()))
+        elif "=" in line:
+            name, text = line.split("=", 1)
+            name = name.strip()
+            if self.config.set(name, text.strip()):
+                self.config.save(self.nvm, self.offset)
+                applied = self.onChange is not None and self.onChange(name)
+                print("Config: saved {}={}{}".format(name, getattr(self.config, name), "" if applied else ", reset to apply"))
+            else:
+                print("Config: can't set {}".format(line))
+        else:
+            print("Config: name=value, remote name=value, show or reset")
@@ -0,0 +1,426 @@
+# Remote Control - Link helpers
+#   shared by the remote control transmit & receive scripts
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+import time
+
+### ACK-payload state echo
+# The receiver keeps a short digest of its applied ColorMethod loaded as the
+# ACK payload of its rx pipe. The transmitter probes with a single tiny packet
+# and only resends the full payload when the echoed digest doesn't match.
+ACK_TAG_STATE = 0x53 # 'S', first byte of a state echo ACK payload
+PROBE_PAYLOAD = b"?" # never parses as a ColorMethod or a face index
+
+
+def stateDigest(payload):
+    """
+    Returns a 16-bit Fletcher checksum of a payload (str or bytes)
+    """
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        payload = payload.encode()
+    sum1 = 0
+    sum2 = 0
+    for b in payload:
+        sum1 = (sum1 + b) % 255
+        sum2 = (sum2 + sum1) % 255
+    return (sum2 << 8) | sum1
+
+
+class AckEcho:
+    """
+    Receiver side: keeps the digest of the applied state loaded as ACK payload
+    """
+    def __init__(self, nrf, pipe=1):
+        self.nrf = nrf
+        self.pipe = pipe
+        self.digest = 0
+        self.buffer = bytearray(3)
+        self.buffer[0] = ACK_TAG_STATE
+        nrf.ack = True # enables dynamic payloads & custom ACK payloads
+
+    def update(self, payload):
+        """
+        Call with the payload of the newly applied state
+        """
+        self.setDigest(stateDigest(payload))
+
+    def setDigest(self, digest):
+        """
+        For a state applied without its full payload (0 = unknown, no echo)
+        """
+        if digest == self.digest:
+            return
+        self.digest = digest
+        self.buffer[1] = digest >> 8
+        self.buffer[2] = digest & 0xFF
+        self.nrf.flush_tx() # drop any ACKs still holding the old digest
+        self.refill()
+
+    def refill(self):
+        """
+        Tops up the ACK FIFO, call after every receive (each ACK is used once)
+        """
+        if self.digest:
+            self.nrf.load_ack(self.buffer, self.pipe) # no-op when the FIFO is full
+
+
+class SendCapture:
+    """
+    Stands in for the radio when a payload goes out through a framing
+    library's send function (e.g. EasyStreamNrf24's sendPayload): reads &
+    writes (nrf.listen = False, ...) are forwarded to the radio & the result
+    of the last send() is kept, since the library function doesn't hand back
+    the ACK payload. If the library sends without nrf.send(), `result` stays
+    False (no echo, full resends)
+    """
+    def __init__(self, nrf):
+        object.__setattr__(self, "nrf", nrf)
+        object.__setattr__(self, "result", False)
+
+    def send(self, buf, *args, **kwargs):
+        self.result = self.nrf.send(buf, *args, **kwargs)
+        return self.result
+
+    def __getattr__(self, name):
+        return getattr(self.nrf, name)
+
+    def __setattr__(self, name, value):
+        if name == "nrf" or name == "result":
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.nrf, name, value)
+
+
+def sendWith(send, capture, payload):
+    """
+    Sends `payload` with `send(radio, payload)` on `capture`, returns what
+    the radio's last send() returned (False, True or the ACK payload)
+    """
+    capture.result = False
+    send(capture, payload)
+    return capture.result
+
+
+class EchoTracker:
+    """
+    Transmitter side: probes the receiver & compares its echoed digest.
+    `send(radio, payload)` is how payloads reach the receiver's
+    receivePayload() (e.g. EasyStreamNrf24's sendPayload), None sends the
+    probe as a bare packet
+    """
+    def __init__(self, nrf, send=None):
+        self.nrf = nrf
+        self.send = send
+        self.capture = SendCapture(nrf) if send is not None else None
+        self.lastPayload = None
+        self.expected = 0
+        self.confirmed = False
+        self.lastSendOk = False # the probe got ACKed, matching or not
+        self.numProbes = 0
+        self.numMatches = 0
+        self.numMismatches = 0
+        self.numFailures = 0
+        nrf.ack = True # needed to receive ACK payloads
+
+    def expect(self, payload):
+        """
+        Sets the state the receiver should be echoing, returns the digest
+        """
+        if payload != self.lastPayload:
+            self.lastPayload = payload
+            self.expected = stateDigest(payload)
+            self.confirmed = False
+        return self.expected
+
+    def matches(self, ackPayload):
+        if ackPayload is None or isinstance(ackPayload, bool) or len(ackPayload) < 3:
+            return False
+        if ackPayload[0] != ACK_TAG_STATE:
+            return False
+        return ((ackPayload[1] << 8) | ackPayload[2]) == self.expected
+
+    def probe(self):
+        """
+        Sends a single probe packet, returns True if the receiver's state matches
+        """
+        self.numProbes += 1
+        if self.send is None:
+            result = self.nrf.send(PROBE_PAYLOAD)
+        else:
+            result = sendWith(self.send, self.capture, PROBE_PAYLOAD)
+        self.lastSendOk = bool(result)
+        if not result:
+            self.numFailures += 1
+            self.confirmed = False
+        elif self.matches(result):
+            self.numMatches += 1
+            self.confirmed = True
+        else:
+            self.numMismatches += 1
+            self.confirmed = False
+        return self.confirmed
+
+    def toString(self):
+        return "probes={} matches={} mismatches={} failures={}".format(
+            self.numProbes, self.numMatches, self.numMismatches, self.numFailures)
+
+
+### Framed payloads
+# Frames split a payload over packets that each carry a 3 byte header (tag,
+# payload sequence, chunk index/count), so payloads from different senders or
+# pipes can be reassembled independently and repeats can be told apart.
+FRAME_TAG = 0x46 # 'F', unicast frames (auto-ack)
+BROADCAST_TAG = 0x42 # 'B', broadcast frames (no auto-ack)
+FRAME_HEADER = 3
+FRAME_CHUNK = 32 - FRAME_HEADER
+MAX_FRAME_CHUNKS = 16
+
+
+class FrameSender:
+    """
+    Transmitter side: sends payloads as frames through the current tx pipe
+    """
+    def __init__(self, nrf, redundancy=1, askNoAck=False, tag=FRAME_TAG):
+        self.nrf = nrf
+        self.redundancy = redundancy
+        self.askNoAck = askNoAck
+        self.seq = 0
+        self.packet = bytearray(32)
+        self.view = memoryview(self.packet)
+        self.packet[0] = tag
+        self.numPackets = 0
+
+    def packets(self, payload):
+        """
+        Yields every packet of the next frame (the same buffer, refilled)
+        """
+        if isinstance(payload, str):
+            payload = payload.encode()
+        numChunks = max(1, -(-len(payload) // FRAME_CHUNK))
+        if numChunks > MAX_FRAME_CHUNKS:
+            raise ValueError("payload too long to frame")
+        self.seq = (self.seq + 1) & 0xFF
+        self.packet[1] = self.seq
+        for _ in range(self.redundancy):
+            for idx in range(numChunks):
+                start = idx * FRAME_CHUNK
+                chunkLen = min(FRAME_CHUNK, len(payload) - start)
+                self.packet[2] = (idx << 4) | (numChunks - 1)
+                self.packet[FRAME_HEADER : FRAME_HEADER + chunkLen] = payload[start : start + chunkLen]
+                yield self.view[: FRAME_HEADER + chunkLen]
+
+    def send(self, payload):
+        """
+        Sends every chunk `redundancy` times (round-robin), returns the number
+        of packets that went through (all of them without auto-ack)
+        """
+        numSent = 0
+        for packet in self.packets(payload):
+            self.numPackets += 1
+            if self.nrf.send(packet, ask_no_ack=self.askNoAck):
+                numSent += 1
+        return numSent
+
+
+class FrameAssembler:
+    """
+    Receiver side: reassembles the frames of a single sender
+    """
+    def __init__(self):
+        self.parts = [None] * MAX_FRAME_CHUNKS
+        self.curSeq = -1 # frame being reassembled
+        self.doneSeq = -1 # last frame handed out
+        self.have = 0 # bitmask of received chunks
+        self.numPackets = 0
+        self.numDuplicates = 0
+        self.numPayloads = 0
+
+    def add(self, packet):
+        """
+        Returns the completed payload (bytes) or None
+        """
+        self.numPackets += 1
+        if len(packet) < FRAME_HEADER:
+            return None
+        seq = packet[1]
+        idx = packet[2] >> 4
+        numChunks = (packet[2] & 0x0F) + 1
+        if seq == self.doneSeq:
+            self.numDuplicates += 1 # redundant copy of a finished frame
+            return None
+        if seq != self.curSeq:
+            self.curSeq = seq # start over on a newer frame
+            self.have = 0
+        if self.have & (1 << idx):
+            self.numDuplicates += 1
+            return None
+        self.parts[idx] = bytes(packet[FRAME_HEADER:])
+        self.have |= 1 << idx
+        if self.have != (1 << numChunks) - 1:
+            return None
+        self.doneSeq = seq
+        self.have = 0
+        self.numPayloads += 1
+        return b"".join(self.parts[:numChunks])
+
+
+### Broadcast (one-to-many) mode
+# Group addresses only differ from the unicast address in their first byte,
+# which is all that rx pipes 2-5 can change, so a receiver can listen on its
+# unicast pipe 1 and up to four groups at once. Broadcasts go out without
+# auto-ack (no colliding ACKs), each packet repeated `redundancy` times.
+GROUP_ALL = 0 # every receiver listens to this group
+MAX_GROUPS = 16
+
+
+def groupAddress(group, baseAddress=b"1Node"):
+    """
+    Returns the address of a receiver group (0 to 15)
+    """
+    if not 0 <= group < MAX_GROUPS:
+        raise ValueError("group must be in range [0, {}]".format(MAX_GROUPS - 1))
+    return bytes([0xA0 + group]) + bytes(baseAddress[1:])
+
+
+class BroadcastSender(FrameSender):
+    """
+    Transmitter side: sends payloads to a receiver group without auto-ack
+    """
+    def __init__(self, nrf, group=GROUP_ALL, redundancy=3, baseAddress=b"1Node"):
+        super().__init__(nrf, redundancy, True, BROADCAST_TAG)
+        nrf.open_tx_pipe(groupAddress(group, baseAddress))
+
+
+class BroadcastReceiver:
+    """
+    Receiver side: joins up to four groups (pipes 2-5) & reassembles broadcasts
+    """
+    def __init__(self, nrf, groups=(GROUP_ALL,), baseAddress=b"1Node"):
+        self.nrf = nrf
+        for idx, group in enumerate(groups[:4]):
+            nrf.open_rx_pipe(2 + idx, groupAddress(group, baseAddress))
+        self.assembler = FrameAssembler()
+
+    def poll(self):
+        """
+        Reads broadcast packets at the front of the RX FIFO (unicast packets are
+        left for `receivePayload`), returns a completed payload string or None
+        """
+        nrf = self.nrf
+        while nrf.available() and nrf.pipe is not None and nrf.pipe >= 2:
+            packet = nrf.read()
+            if packet[0] != BROADCAST_TAG:
+                continue
+            payload = self.assembler.add(packet)
+            if payload is not None:
+                return payload.decode()
+        return None
+
+
+### Multi-transmitter arbitration
+# Up to six controllers can address one receiver, one per rx pipe. Controller
+# 0 uses the unicast address on pipe 1, controllers 1-4 use pipes 2-5 (which
+# then can't be used for broadcast groups) and controller 5 uses pipe 0.
+# Controllers send frames, so their packets can interleave freely.
+POLICY_PRIORITY = 0 # highest priority pipe that's been active recently wins
+POLICY_LAST_WRITER = 1 # latest newer-than-before frame from any pipe wins
+MAX_CONTROLLERS = 6
+CONTROLLER_PIPES = (1, 2, 3, 4, 5, 0)
+
+
+def controllerAddress(idx, baseAddress=b"1Node"):
+    """
+    Returns the address controller `idx` (0 to 5) transmits to
+    """
+    if not 0 <= idx < MAX_CONTROLLERS:
+        raise ValueError("controller must be in range [0, {}]".format(MAX_CONTROLLERS - 1))
+    if idx == 0:
+        return bytes(baseAddress)
+    return bytes([0xC0 + idx]) + bytes(baseAddress[1:])
+
+
+def seqNewer(seq, lastSeq):
+    """
+    True if 8-bit `seq` comes after `lastSeq` (serial number arithmetic)
+    """
+    return lastSeq < 0 or 0 < ((seq - lastSeq) & 0xFF) < 128
+
+
+class PipeArbiter:
+    """
+    Receiver side: listens to every controller's pipe & decides whose payload
+    gets applied, keeping per-pipe counters
+    """
+    def __init__(self, nrf, numControllers=MAX_CONTROLLERS, policy=POLICY_PRIORITY,
+                 priorities=None, holdTime=2.0, baseAddress=b"1Node", clock=None):
+        self.nrf = nrf
+        self.policy = policy
+        self.holdTime_ns = int(holdTime * 1e9) # how long a writer keeps priority
+        self.clock = clock if clock is not None else time
+        # default priority: controller 0 highest
+        self.priorities = list(priorities) if priorities is not None else \
+            [MAX_CONTROLLERS - idx for idx in range(MAX_CONTROLLERS)]
+        self.pipeToController = [None] * 6
+        for idx in range(numControllers):
+            pipe = CONTROLLER_PIPES[idx]
+            nrf.open_rx_pipe(pipe, controllerAddress(idx, baseAddress))
+            self.pipeToController[pipe] = idx
+        self.assemblers = [FrameAssembler() for _ in range(numControllers)]
+        self.lastSeq = [-1] * numControllers
+        self.lastActive = [None] * numControllers
+        self.owner = None # controller whose payload is currently applied
+        # Per-pipe counters (indexed by controller)
+        self.numApplied = [0] * numControllers
+        self.numOverruled = [0] * numControllers
+        self.numStale = [0] * numControllers
+        self.numMalformed = [0] * numControllers
+
+    def decide(self, idx, seq, now):
+        """
+        Returns True if controller `idx`'s completed frame should be applied
+        """
+        if not seqNewer(seq, self.lastSeq[idx]):
+            self.numStale[idx] += 1
+            return False
+        self.lastSeq[idx] = seq
+        self.lastActive[idx] = now
+        if self.policy == POLICY_PRIORITY and self.owner is not None and self.owner != idx:
+            ownerActive = self.lastActive[self.owner]
+            if self.priorities[self.owner] > self.priorities[idx] and \
+                    ownerActive is not None and now - ownerActive < self.holdTime_ns:
+                self.numOverruled[idx] += 1
+                return False
+        self.owner = idx
+        self.numApplied[idx] += 1
+        return True
+
+    def poll(self):
+        """
+        Drains the RX FIFO, returns the winning payload string or None
+        """
+        nrf = self.nrf
+        winner = None
+        while nrf.available():
+            pipe = nrf.pipe
+            packet = nrf.read()
+            idx = self.pipeToController[pipe] if pipe is not None else None
+            if idx is None or len(packet) < FRAME_HEADER or packet[0] != FRAME_TAG:
+                if idx is not None: self.numMalformed[idx] += 1
+                continue
+            payload = self.assemblers[idx].add(packet)
+            if payload is not None and self.decide(idx, packet[1], self.clock.monotonic_ns()):
+                winner = payload # later decisions in the same poll win
+        return winner.decode() if winner is not None else None
+
+    def toString(self):
+        lines = []
+        for idx, assembler in enumerate(self.assemblers):
+            lines.append("ctrl {} (pipe {}): packets={} payloads={} applied={} overruled={} stale={} dup={} malformed={}".format(
+                idx, CONTROLLER_PIPES[idx], assembler.numPackets, assembler.numPayloads, self.numApplied[idx],
+                self.numOverruled[idx], self.numStale[idx], assembler.numDuplicates, self.numMalformed[idx]))
+        return "\n".join(lines)
@@ -0,0 +1,52 @@
+# Remote Control - Accelerometer calibration
+#   for use in the Sparkfun Thing Plus RP2040 board (the transmitter)
+#
+# Set the cube down on each of its six faces on a level table, one after the
+# other, until the serial console says it's done. The calibration is saved to
+# microcontroller.nvm, where main_remoteTransmit_SparkfunPlus.py loads it from
+#
+# nm3210@gmail.com
+# Date Created:  October 19th, 2026
+# Last Modified: October 19th, 2026
+
+# Import modules
+import board, microcontroller, time # circuitpython built-ins
+import adafruit_mpu6050 # also requires adafruit_register
+from lib.AccelCalibration import AccelCalibration, FaceCalibrator
+from lib.MpuReader import MpuBurstReader
+print("Finished importing modules")
+
+# Initialize MPU6050 sensor (same settings as the transmitter)
+i2c = board.I2C()
+sensor = adafruit_mpu6050.MPU6050(i2c)
+sensor.cycle_rate = adafruit_mpu6050.Rate.CYCLE_40_HZ
+sensor.cycle = True
+reader = MpuBurstReader.fromSensor(sensor)
+counts = [0, 0, 0]
+print("Finished initializing mpu6050")
+
+# Show what's stored right now
+stored = AccelCalibration.load(microcontroller.nvm)
+print("Stored calibration: {}".format(stored if stored is not None else "none"))
+
+###
+# Collect 2 seconds on each face
+calibrator = FaceCalibrator(numSamples=80, settleSamples=20)
+lastMissing = None
+while not calibrator.done():
+    reader.readInto(counts)
+    calibrator.add(counts[0], counts[1], counts[2])
+    missing = calibrator.missingFaces()
+    if missing != lastMissing:
+        lastMissing = missing
+        print("Faces left: {}".format(missing))
+    time.sleep(1.1/40) # wait for the sensor to update
+
+# Solve, save & read it back
+calibration = calibrator.solve()
+calibration.save(microcontroller.nvm)
+loaded = AccelCalibration.load(microcontroller.nvm)
+if loaded is None or loaded.matrix != calibration.matrix or loaded.offset != calibration.offset:
+    print("Saving the calibration failed!")
+else:
+    print("Saved calibration: {}".format(loaded))
@@ -1,28 +1,44 @@
 # Remote Control - Receive
 #   for use in the Sparkfun Pro Micro RP2040 board
 #
-# Default receiver settings:
+# Default receiver settings (stored ones from lib/RemoteConfig.py win):
 #   power level: -12 dB
 #   transmit address: b"2Node"
 #   receive address:  b"1Node"
 # 
 # nm3210@gmail.com
 # Date Created:  April 17th, 2021
-# Last Modified: October 10th, 2021
+# Last Modified: October 19th, 2026
 
 # Import modules
-import board, digitalio, struct, time, random # circuitpython built-ins
+import board, digitalio, microcontroller, struct, time, random # circuitpython built-ins
 from math import floor # necessary math calls
 import neopixel # also requires adafruit_pypixelbuf
 from circuitpython_nrf24l01.rf24 import RF24
 from lib.ColorDescriptors.ColorDescriptors import *
 from lib.EasyStreamNrf24.EasyStreamNrf24 import receivePayload
+from lib.ChannelSelect import decodeHopSequence, ChannelHopper, SILENCE_AUTOSENDS
+from lib.DeltaState import decodeDelta, applyDelta, undoDelta
+from lib.EnergyMonitor import decodeTelemetry
+from lib.GradientCache import GradientCache, expandGradient
+from lib.HueWheel import HueWheel
+from lib.PayloadDispatch import PayloadDispatcher, KIND_NONE, KIND_HOP, KIND_CONFIG, KIND_TELEMETRY, \
+    KIND_DELTA, KIND_METHOD, KIND_FACE
+from lib.RadioPower import BeaconListener
+from lib.RemoteConfig import RemoteConfig, ConfigConsole, decodeConfigPatch
+from lib.RemoteLink import AckEcho, BroadcastReceiver, PipeArbiter, GROUP_ALL, POLICY_PRIORITY, stateDigest
 print("Finished importing modules")
 
+### Load settings
+# Saved in microcontroller.nvm, change them over serial ("name=value") or from
+# the transmitter ("remote name=value"); until then the defaults are this script's
+config = RemoteConfig.load(microcontroller.nvm, cePin=b"D26", csnPin=b"D21", paLevel=-12)
+print("Finished loading settings")
+
 ### Initialize nRF24L01
 # Configure pinouts
-ce = digitalio.DigitalInOut(board.D26)
-csn = digitalio.DigitalInOut(board.D21)
+ce = digitalio.DigitalInOut(config.pin("cePin"))
+csn = digitalio.DigitalInOut(config.pin("csnPin"))
 spi = board.SPI() # init spi bus w/ pins D[20,22,23]
 irq = digitalio.DigitalInOut(board.D27) # optional IRQ pin to listen to interupts
 
@@ -31,22 +47,54 @@ nrf = RF24(spi, csn, ce)
 
 # Configure settings
 irq.switch_to_input()  # make sure its an input object
-nrf.pa_level = -12 # low for close-proximity testing
+nrf.pa_level = config.paLevel # low for close-proximity testing by default
 
 # Select tx/rx addresses
-txAddress = b"2Node" # receive module tx pipe = '2Node'
-rxAddress = b"1Node" # receive module rx pipe = '1Node'
+txAddress = config.rxAddress # receive module tx pipe = '2Node' (the transmitter's rx)
+rxAddress = config.txAddress # receive module rx pipe = '1Node' (the transmitter's tx)
 nrf.open_tx_pipe(txAddress)
 nrf.open_rx_pipe(1, rxAddress)
 
-# Set state to conserve power until needed
-nrf.listen = False
+# Optionally accept several controllers at once, one per rx pipe
+useArbitration = False
+numControllers = 6 # uses every rx pipe, so no broadcast groups
+arbitrationPolicy = POLICY_PRIORITY # or POLICY_LAST_WRITER
+arbiter = PipeArbiter(nrf, numControllers, arbitrationPolicy, baseAddress=rxAddress) if useArbitration else None
+
+# Also listen for broadcasts to these groups (pipes 2-5)
+useBroadcast = not useArbitration
+broadcastGroups = (GROUP_ALL,)
+bcast = BroadcastReceiver(nrf, broadcastGroups, rxAddress) if useBroadcast else None
+
+# Echo a digest of the applied state back in the ACK payloads
+useAckEcho = not useArbitration
+echo = AckEcho(nrf, 1) if useAckEcho else None
+
+# Follow the transmitter's hop sequence (only the default channel until announced),
+# going looking for it after a few autosends without a word (same
+# updateTime_autosend as the transmitter's)
+useChannelHopping = True
+hopper = ChannelHopper(nrf, silenceTimeout=SILENCE_AUTOSENDS*config.updateTime_autosend) if useChannelHopping else None
+
+# Set state to conserve power until needed (the arbiter reads packets itself)
+nrf.listen = useArbitration
+
+# Optionally (on battery) only listen around the transmitter's beacons, which
+# needs its useBeaconSchedule & the same updateTime_autosend. Listens
+# continuously until the first one & again after a few missed ones
+useBeaconListen = False
+listener = BeaconListener(nrf, config.updateTime_autosend) if useBeaconListen else None
 print("Finished initializing nRF24 module")
 
 
 ### Initialize neopixel output
-ledPin = board.NEOPIXEL
-pixelMain = neopixel.NeoPixel(ledPin, 1, pixel_order=neopixel.GRB)
+# Optionally drive an external strip (gradients get spread along it) instead
+# of the board's one pixel
+useStrip = False
+stripLength = 60 # pixels
+ledPin = board.D2 if useStrip else board.NEOPIXEL
+numPixels = stripLength if useStrip else 1
+pixelMain = neopixel.NeoPixel(ledPin, numPixels, pixel_order=neopixel.GRB)
 pixelMain.fill((0,0,0)) # turn off on startup
 print("Finished initializing neopixel")
 
@@ -58,57 +106,193 @@ colorGreen = (0,255,0)
 colorCyan = (0,255,255)
 colorBlue = (0,0,255)
 colorMagenta = (255,0,255)
-brightness = 0.1 # from 0 to 1
+brightness = config.brightness # from 0 to 1
 
 
 ### Other things
 # Setup some storage vars
 faceMethod = ColorMethod(ModeStationary, ColorOff)
+numStaleDeltas = 0 # deltas against a state we weren't showing
+
+# Route payloads by their tag/prefix instead of trying parsers until one
+# doesn't raise, malformed ones get counted (ACK echo probes are counted
+# apart & need nothing, the ACK payload already answered them)
+dispatcher = PayloadDispatcher(faceMethod.toString())
+
+# Keep expanded gradients, switching back to a recent one doesn't redo the
+# interpolation (keyed by descriptor, strip length & brightness)
+useGradientCache = True
+gradientCacheBytes = 4096 # budget for the tables' data, evicts least recently used
+gradientCache = GradientCache(gradientCacheBytes) if useGradientCache else None
+
+# Integer lookup tables instead of floating point for brightness scaling &
+# the face index fallback's solids (drawn straight from the hue wheel, its
+# ColorSolid only stands for the state & is built once per face)
+useHueWheel = True
+hueWheel = HueWheel() if useHueWheel else None
+fallbackMethods = {} # face index -> ColorMethod
+fallbackHue = None # hue of the fallback solid on display, None for anything else
 
 # Configure timers
 timeCheck_receive = time.monotonic_ns()
-updateTime_receive = 0.01 # seconds, how often to listen
-updateDur_receive = 0.011 # seconds, how long to listen
+updateTime_receive = config.updateTime_receive # seconds, how often to listen
+updateDur_receive = config.updateDur_receive # seconds, how long to listen
+
+timeCheck_listenReport = time.monotonic_ns()
+updateTime_listenReport = 60.0 # seconds, beacon listening duty cycle
+
+timeCheck_cacheReport = time.monotonic_ns()
+updateTime_cacheReport = 60.0 # seconds, gradient cache hit rate
+
+timeCheck_payloadReport = time.monotonic_ns()
+updateTime_payloadReport = 60.0 # seconds, received payloads by kind
+
+# Brightness patches (e.g. a tap per step) apply right away but only get
+# written to flash once no new one came for this long
+configUnsaved = False
+timeCheck_configSave = time.monotonic_ns()
+updateTime_configSave = 10.0 # seconds
 
 ### Private functions
 def adjColor(_color, _brightness=1.0):
+    if useHueWheel:
+        return hueWheel.scale(_color, _brightness)
     return [floor(x * _brightness) for x in _color]
 
+def fallbackMethod(_faceIdx):
+    # Solid at the face's hue, reused once built when useHueWheel
+    if not useHueWheel:
+        return ColorMethod(ModeStationary, ColorSolid(hue=((_faceIdx-1)*60.0)))
+    method = fallbackMethods.get(_faceIdx)
+    if method is None:
+        method = fallbackMethods[_faceIdx] = ColorMethod(ModeStationary, ColorSolid(hue=((_faceIdx-1)*60.0)))
+    return method
+
+def gradientTable(_gradient, _brightness=1.0):
+    # The gradient spread over the pixels, as RGB triplets in a bytearray
+    stops = [adjColor((c.red, c.green, c.blue), _brightness) for c in _gradient.colors]
+    return expandGradient(stops, numPixels)
+
+def showTable(_table):
+    # One slice assignment, so the strip is only written once
+    pixelMain[:] = [(_table[i], _table[i + 1], _table[i + 2]) for i in range(0, 3*numPixels, 3)]
+
+
+# Change settings over serial
+configConsole = ConfigConsole(config, microcontroller.nvm)
 
 ###
 # Main LOOP
 print("Starting main loop for Remote Control - Receive...")
 while True:
+    configConsole.poll() # settings typed into the serial console
+    
     ### Check timers
     # Listen to the RF interface for any incoming messages
     detectedChanges = False
-    if abs(time.monotonic_ns() - timeCheck_receive) > updateTime_receive*1e9:
+    if useBeaconListen:
+        receiveDue = listener.update() # only while a beacon's listen window is open
+    else:
+        receiveDue = abs(time.monotonic_ns() - timeCheck_receive) > updateTime_receive*1e9
+    if receiveDue:
         timeCheck_receive = time.monotonic_ns() # reset timer
         
         # Check if the payload is valid (not none)
-        payloadContents = receivePayload(nrf, debugPrint=False)
-        if payloadContents is not None:
-            try: # don't crash if the payload can't be converted correctly
-                # Convert to a color
-                curMethod = ColorMethod.parse(payloadContents)
+        if useArbitration:
+            payloadContents = arbiter.poll()
+        else:
+            payloadContents = bcast.poll() if useBroadcast else None
+            if payloadContents is None:
+                payloadContents = receivePayload(nrf, debugPrint=False)
+        kind = dispatcher.classify(payloadContents)
+        if useBeaconListen and kind != KIND_NONE:
+            listener.heard()
+        if useChannelHopping and kind != KIND_NONE:
+            hopper.heard()
+        elif useChannelHopping:
+            hopper.checkSilence() # go looking for the transmitter
+        
+        if kind == KIND_HOP and useChannelHopping:
+            hopChannels = decodeHopSequence(payloadContents)
+            if hopChannels is not None:
+                print("Switching to hop sequence {}".format(hopChannels))
+                hopper.setSequence(hopChannels)
+            else:
+                dispatcher.reject(kind)
+        elif kind == KIND_CONFIG:
+            # Settings sent by the transmitter, brightness applies right away
+            configPatch = decodeConfigPatch(payloadContents)
+            if configPatch is None:
+                dispatcher.reject(kind)
+            elif config.set(*configPatch):
+                if configPatch[0] == "brightness":
+                    brightness = config.brightness
+                    detectedChanges = True # redraw at the new brightness
+                    configUnsaved = True
+                    timeCheck_configSave = time.monotonic_ns() # saved once it settles
+                else:
+                    config.save(microcontroller.nvm) # applies after a reset
+                    configUnsaved = False
+                    print("Config: saved {}={}".format(configPatch[0], getattr(config, configPatch[0])))
+        elif kind == KIND_TELEMETRY:
+            print("Transmitter energy: {}".format(decodeTelemetry(payloadContents)))
+        elif kind == KIND_DELTA and useAckEcho:
+            # Changed fields against the state we echo, patched in place & only
+            # echoed once the patched method really is the transmitter's target
+            delta = decodeDelta(payloadContents)
+            undo = []
+            if delta is None:
+                dispatcher.reject(kind)
+            elif delta[0] == echo.digest and applyDelta(faceMethod, delta[2], undo):
+                if stateDigest(faceMethod.toString()) == delta[1]:
+                    echo.setDigest(delta[1])
+                    fallbackHue = None # patched, draw what the method says
+                    detectedChanges = True
+                    print('Change Detected!')
+                else:
+                    undoDelta(undo) # e.g. a field the delta can't reach, keep showing (& echoing) the base
+                    dispatcher.reject(kind)
+                    print("Delta didn't reproduce its target, waiting for the full payload")
+            else:
+                numStaleDeltas += 1 # our echo still disagrees, so a full payload follows
+                print("Stale delta ({} so far), waiting for the full payload".format(numStaleDeltas))
+        elif kind == KIND_METHOD or kind == KIND_FACE:
+            if kind == KIND_METHOD:
+                try: # the prefix & closing bracket matched, only a corrupted middle gets here
+                    curMethod = ColorMethod.parse(payloadContents)
+                except Exception:
+                    curMethod = None
+                    dispatcher.reject(kind)
+            else:
+                faceIdx = float(payloadContents) # digits & one point, can't raise
+                curMethod = fallbackMethod(faceIdx)
+            if curMethod is not None:
                 if faceMethod != curMethod:
                     detectedChanges = True
                     print('Change Detected!')
                 
                 # Store the payload as the last valid content received
                 faceMethod = curMethod
-            except:
-                try:
-                    faceIdx = float(payloadContents)
-                    curMethod = ColorMethod(ModeStationary, ColorSolid(hue=((faceIdx-1)*60.0)))
-                    if faceMethod != curMethod:
-                        detectedChanges = True
-                        print('Change Detected!')
-                    
-                    # Store the payload as the last valid content received
-                    faceMethod = curMethod
-                except:
-                    pass
+                fallbackHue = (faceIdx-1)*60.0 if kind == KIND_FACE else None
+                if useAckEcho: echo.update(payloadContents)
+        if useAckEcho: echo.refill() # each received packet used up an ACK
+    
+    if useBeaconListen and abs(time.monotonic_ns() - timeCheck_listenReport) > updateTime_listenReport*1e9:
+        timeCheck_listenReport = time.monotonic_ns() # reset timer
+        print("Listen: {}".format(listener.report()))
+
+    if useGradientCache and abs(time.monotonic_ns() - timeCheck_cacheReport) > updateTime_cacheReport*1e9:
+        timeCheck_cacheReport = time.monotonic_ns() # reset timer
+        print("Gradients: {}".format(gradientCache.report()))
+
+    if configUnsaved and abs(time.monotonic_ns() - timeCheck_configSave) > updateTime_configSave*1e9:
+        config.save(microcontroller.nvm)
+        configUnsaved = False
+        print("Config: saved brightness={}".format(config.brightness))
+
+    if abs(time.monotonic_ns() - timeCheck_payloadReport) > updateTime_payloadReport*1e9:
+        timeCheck_payloadReport = time.monotonic_ns() # reset timer
+        print("Payloads: {}".format(dispatcher.report()))
 
     ### Update Colors (every time loop, to allow for color loops)
     # Change color!
@@ -117,12 +301,18 @@ while True:
         faceColor = faceMethod.color
 
         # Check for solid color
-        if type(faceColor) is ColorSolid:
+        if type(faceColor) is ColorSolid and useHueWheel and fallbackHue is not None:
+            pixelMain.fill(hueWheel.rgb(fallbackHue, 1.0, brightness)) # hue & brightness in one lookup
+        elif type(faceColor) is ColorSolid:
             pixelMain.fill(adjColor((faceColor.red, faceColor.green, faceColor.blue),brightness))
 
         # Check for gradients
         elif type(faceColor) is ColorGradient:
-            pass
+            if useGradientCache:
+                cacheKey = (faceColor.toString(), numPixels, brightness)
+                showTable(gradientCache.get(cacheKey, lambda: gradientTable(faceColor, brightness)))
+            else:
+                showTable(gradientTable(faceColor, brightness))
 
     elif faceMethod.mode is "":
         pass
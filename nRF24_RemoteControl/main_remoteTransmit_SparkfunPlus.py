@@ -1,29 +1,48 @@
 # Remote Control - Transmit
 #   for use in the Sparkfun Thing Plus RP2040 board
 #
-# Default transmitter settings:
+# Default transmitter settings (stored ones from lib/RemoteConfig.py win):
 #   power level: 0 dB (maximum)
 #   transmit address: b"1Node"
 #   receive address:  b"2Node"
 # 
 # nm3210@gmail.com
 # Date Created:  April 17th, 2021
-# Last Modified: October 10th, 2021
+# Last Modified: October 19th, 2026
 
 # Import modules
-import board, bitbangio, digitalio, struct, time, random # circuitpython built-ins
+import board, bitbangio, digitalio, gc, microcontroller, struct, supervisor, time, random # circuitpython built-ins
 from math import atan2, acos, sqrt, pi # necessary math calls
 import adafruit_mpu6050 # also requires adafruit_register
 import neopixel # also requires adafruit_pypixelbuf
 from circuitpython_nrf24l01.rf24 import RF24
 from lib.ColorDescriptors.ColorDescriptors import *
 from lib.EasyStreamNrf24.EasyStreamNrf24 import sendPayload
+from lib.AccelCalibration import AccelCalibration
+from lib.ChannelSelect import scanChannels, quietestChannels, announceHopSequence, ChannelHopper, DEFAULT_CHANNEL, \
+    SILENCE_AUTOSENDS
+from lib.DeltaState import DeltaEncoder
+from lib.EnergyMonitor import EnergyMonitor, openBattery, encodeTelemetry, SENSOR_CYCLE_MA, SENSOR_GYRO_MA
+from lib.FaceDetect import IntFaceFilter, HysteresisFaceFilter, MarginDebouncer, GyroFaceFilter, StillFaceDebouncer
+from lib.GcMonitor import GcMonitor, ticksDiff
+from lib.GestureDetect import GestureDetector, GESTURE_SHAKE, GESTURE_TAP, GESTURE_DOUBLE_FLIP
+from lib.LinkTuner import RetransmitTuner
+from lib.MpuReader import MpuBurstReader
+from lib.RadioPower import RadioPowerGate, BeaconClock
+from lib.RemoteConfig import RemoteConfig, ConfigConsole, encodeConfigPatch, FACE_PAGES
+from lib.RemoteLink import EchoTracker, FrameSender, BroadcastSender, GROUP_ALL, controllerAddress
 print("Finished importing modules")
 
+### Load settings
+# Saved in microcontroller.nvm, change them over serial ("name=value") instead
+# of editing this file; until then the defaults are this script's
+config = RemoteConfig.load(microcontroller.nvm)
+print("Finished loading settings")
+
 ### Initialize nRF24L01
 # Configure pinouts
-ce = digitalio.DigitalInOut(board.D0)
-csn = digitalio.DigitalInOut(board.D1)
+ce = digitalio.DigitalInOut(config.pin("cePin"))
+csn = digitalio.DigitalInOut(config.pin("csnPin"))
 spi = board.SPI() # init spi bus w/ pins D[2,3,4]
 # irq = digitalio.DigitalInOut(board.D6) # optional IRQ pin to listen to interrupts
 
@@ -32,17 +51,67 @@ nrf = RF24(spi, csn, ce)
 
 # Configure settings
 # irq.switch_to_input()  # make sure its an input object
-nrf.pa_level = 0 # maximum
+nrf.pa_level = config.paLevel # maximum by default
 
 # Select tx/rx addresses
-txAddress = b"1Node" # transmit module tx pipe = '1Node'
-rxAddress = b"2Node" # transmit module rx pipe = '2Node'
+txAddress = config.txAddress # transmit module tx pipe = '1Node'
+rxAddress = config.rxAddress # transmit module rx pipe = '2Node'
 nrf.open_tx_pipe(txAddress)
 nrf.open_rx_pipe(1, rxAddress)
 
+# Optionally drive many receivers at once (no auto-ack, repeated packets)
+useBroadcast = False
+broadcastGroup = GROUP_ALL # receivers join groups on their rx pipes 2-5
+broadcastRedundancy = 3 # copies of every packet
+
+# Optionally be one of several controllers of an arbitrating receiver
+useFramedSend = False
+controllerIdx = 0 # 0-5, each controller gets its own rx pipe on the receiver
+
+if useBroadcast:
+    framedSender = BroadcastSender(nrf, broadcastGroup, broadcastRedundancy, txAddress)
+elif useFramedSend:
+    nrf.open_tx_pipe(controllerAddress(controllerIdx, txAddress))
+    framedSender = FrameSender(nrf)
+else:
+    framedSender = None # send through EasyStreamNrf24
+
+# Compare the receiver's echoed state (ACK payload) before autosending
+useAckEcho = framedSender is None # only the plain unicast receiver echoes its state
+
+# Config patches, telemetry, hop announcements & probes go out the same way
+# as the face payloads (a broadcast receiver drops anything but its frames)
+def sendFramed(radio, payload):
+    if framedSender is not None:
+        framedSender.send(payload)
+    else:
+        sendPayload(radio, payload, debugPrint=False)
+echo = EchoTracker(nrf, send=sendFramed) if useAckEcho else None
+
+# Tune the auto-retransmit delay/count to the link (driven by the ACK echo's probes)
+useLinkTuner = useAckEcho
+tuner = RetransmitTuner(nrf, tunePaLevel=False) if useLinkTuner else None
+
+# Optionally scan for the quietest channels at boot & hop away from interference
+# (hops are driven by the ACK echo's probes, so they need useAckEcho). Each
+# channel is kept long enough for the receiver's silence timeout to cycle
+useChannelScan = False
+hopper = ChannelHopper(nrf, silenceTimeout=SILENCE_AUTOSENDS*config.updateTime_autosend) if useChannelScan else None
+if useChannelScan:
+    hopChannels = quietestChannels(scanChannels(nrf, sweeps=10))
+    print("Quietest channels: {}".format(hopChannels))
+    announceHopSequence(nrf, hopper, hopChannels, send=sendFramed) # sent on the default channel
+
 # Set default state to 'off'
 nrf.listen = False
 nrf.power = False
+
+# Keep the radio powered down between transmissions (the library leaves it
+# in standby after a send), waking it 1.5 ms ahead of each one for the
+# crystal to start. Without it the sends are only counted, the duty cycle is
+# printed with the energy report either way
+useRadioGating = True
+radioGate = RadioPowerGate(nrf, enabled=useRadioGating)
 print("Finished initializing nRF24 module")
 
 
@@ -63,26 +132,118 @@ sensor.cycle = True # only periodically update sensor (saves power!)
 print("Finished initializing mpu6050")
 
 # Setup calibrated accel values
-numAvgValues = 7
+numAvgValues = config.numAvgValues
 listAccelX = [None] * numAvgValues
 listAccelY = [None] * numAvgValues
 listAccelZ = [None] * numAvgValues
 listFaceIdx = [0] * numAvgValues
+faceRingIdx = 0 # next listFaceIdx entry to overwrite (order doesn't matter)
+
+
+### Zero-allocation mode
+# The steady-state loop (no face change, nothing to send) reuses the buffers
+# below instead of creating tuples, strings & big ints, so it never triggers a
+# garbage collection pause. Floats are fine, CircuitPython stores them inline
+useZeroAlloc = True
+useGcMonitor = False # print bytes allocated per loop pass & gc pause times
+gcMonitor = GcMonitor(reportTime=10.0) if useGcMonitor else None
+
+accelReader = MpuBurstReader.fromSensor(sensor) # one I2C transaction per sample
+accelCounts = [0, 0, 0] # raw X, Y, Z counts
+
+# Per-device bias/gain/misalignment correction, measured once with
+# main_calibrateAccel_SparkfunPlus.py & applied to the counts as they're read
+useAccelCalibration = True
+calibration = AccelCalibration.load(microcontroller.nvm) if useAccelCalibration else None
+if useAccelCalibration and calibration is None:
+    print("No accelerometer calibration stored, run main_calibrateAccel_SparkfunPlus.py")
+accelScale = 9.80665 / (16384 >> sensor.accelerometer_range) # counts -> m/s^2
+accelRing = [0.0] * (3 * numAvgValues) # x, y, z per sample
+accelRingIdx = 0
+smoothedAccel = [0.0, 0.0, 0.0]
+tiltAngle = [0.0, 0.0] # theta, phi in degrees
+
+# Classify faces straight from the raw counts with integer math only (no
+# floats or trig), needs the register reads of the zero-allocation mode
+useIntegerFaces = useZeroAlloc
+
+# Enter a face within 20 deg, leave it beyond 30 deg & commit it after 2 to 7
+# identical readings depending on how far inside the face (& how still) it is,
+# instead of always 7 (needs useIntegerFaces, the angle tests are integer too)
+useEarlyCommit = useIntegerFaces
+if useEarlyCommit:
+    faceFilter = HysteresisFaceFilter(3)
+    faceDebouncer = MarginDebouncer(2, numAvgValues)
+else:
+    faceFilter = IntFaceFilter(numAvgValues) if useIntegerFaces else None
+earlyFace = 0 # debounced face
 
 
 ### Other things
 # Setup some storage vars
 lastFace = 0
 
-# Configure timers
-timeCheck_faceIdx = time.monotonic_ns()
-updateTime_faceIdx = 1.1/40 # seconds, enough time for the 40 Hz to update
-
-timeCheck_changes = time.monotonic_ns()
-updateTime_changes = 0.01 # seconds
-
-timeCheck_autosend = time.monotonic_ns()
-updateTime_autosend = 1.0 # always send an update every once in a while
+# Changes are posted the moment they happen (the debouncer committing a new
+# face, a page switch, ...) & picked up by the send check in the same loop
+# iteration, several before a check are one send of the current payload
+changePosted = False
+
+def postChange():
+    global changePosted
+    changePosted = True
+
+# Configure timers (ticks_ms in zero-allocation mode, monotonic_ns() returns big ints)
+def timerNow():
+    return supervisor.ticks_ms() if useZeroAlloc else time.monotonic_ns()
+
+def timerElapsed(since, seconds):
+    if useZeroAlloc:
+        return ticksDiff(supervisor.ticks_ms(), since) > seconds*1000
+    return abs(time.monotonic_ns() - since) > seconds*1e9
+
+timeCheck_faceIdx = timerNow()
+updateTime_faceIdx = config.updateTime_faceIdx # seconds, enough time for the 40 Hz to update
+
+timeCheck_autosend = timerNow()
+updateTime_autosend = config.updateTime_autosend # always send an update every once in a while
+updateTime_confirm = config.updateTime_confirm # seconds, probe this soon after a change was sent
+maxConfirmRetries = 3 # resends before falling back to the autosend timer
+confirmRetries = 0
+
+# Optionally send on a fixed beacon grid (every updateTime_autosend) so a
+# battery powered receiver only has to listen around it (its useBeaconListen).
+# Changes wait for the next beacon, other payloads go out right after one
+useBeaconSchedule = False
+beaconClock = BeaconClock(updateTime_autosend) if useBeaconSchedule else None
+pendingChange = False
+extraPayloads = [] # for the next beacon
+
+def sendExtra(payload):
+    if useBeaconSchedule:
+        extraPayloads.append(payload)
+    else:
+        radioGate.send(sendFramed, nrf, payload)
+
+# Optionally fuse the gyro in (complementary filter): a flip is followed as
+# it happens & committed once the cube stops rotating, instead of waiting for
+# the moving average & 7 identical readings. The gyro only runs outside of
+# cycle mode, which costs a few mA more
+useGyroFaces = False
+if useGyroFaces:
+    sensor.cycle = False
+    motionReader = MpuBurstReader.fromSensor(sensor, withGyro=True)
+    gyroFilter = GyroFaceFilter(rate=1/updateTime_faceIdx)
+    gyroDebouncer = StillFaceDebouncer(3)
+motionCounts = [0] * 6 # raw accel X, Y, Z & gyro X, Y, Z counts
+gyroFace = 0 # debounced face
+
+# Battery telemetry (fuel gauge if there is one) & an estimate of where the
+# energy goes, printed every reportTime seconds (& optionally sent to the
+# receiver, which prints it, at the cost of one more send per report)
+useEnergyMonitor = True
+sendTelemetry = False
+energyMonitor = EnergyMonitor(openBattery(i2c), reportTime=60.0,
+                              sensorMa=SENSOR_GYRO_MA if useGyroFaces else SENSOR_CYCLE_MA) if useEnergyMonitor else None
 
 
 ### Set up colors (preallocate)
@@ -102,20 +263,70 @@ rainbowShort = ColorMethod(ModeStationary, gradientRainbowShort)
 gradientRainbowMedium = ColorGradient([ColorRed, ColorYellow, ColorGreen, ColorCyan, ColorBlue, ColorMagenta, ColorSolid(hue=360)],1)
 rainbowMedium = ColorMethod(ModeStationary, gradientRainbowMedium)
 
+# What config.faceMethods indexes into (page 0 defaults to the first six),
+# lib/RemoteConfig.py's NUM_METHODS is its length
+colorMethods = (solidRed, solidYellow, solidGreen, solidCyan, solidBlue, solidMagenta,
+                solidWhite, solidOff, rainbowShort, rainbowMedium)
+methodPayloads = tuple(method.toString() for method in colorMethods) # encoded once
+
+# Send only the fields that differ from the state the receiver confirmed
+# through its ACK echo, with a full payload every few sends or when unknown
+useDeltaSend = useAckEcho
+deltaEncoder = DeltaEncoder() if useDeltaSend else None
+if useDeltaSend:
+    for method, payload in zip(colorMethods, methodPayloads):
+        deltaEncoder.add(method, payload)
+
+# Face mapping pages: facePayloads[page][face] is the payload to send (None
+# for face 0 or an unknown method index), switch pages with selectFacePage()
+def buildFacePages():
+    pages = []
+    for page in range(FACE_PAGES):
+        slots = [None] # face 0, invalid
+        for methodIdx in config.faceMethods[page*6 : page*6 + 6]: # TOP Die Vals '2', '5', '4', '3', '1', '6'
+            slots.append(methodPayloads[methodIdx] if methodIdx < len(methodPayloads) else None)
+        pages.append(tuple(slots))
+    return tuple(pages)
+
+facePayloads = buildFacePages()
+facePage = config.facePage
+
+# Optionally detect gestures on the samples read for the faces (raw counts,
+# so they need useIntegerFaces or useGyroFaces):
+#   shake       -> next face page
+#   tap         -> step the receiver's brightness
+#   double flip -> lights off, until the next one or a face change
+useGestures = False
+gestures = GestureDetector(rate=1/updateTime_faceIdx) if useGestures else None
+brightnessSteps = (0.05, 0.1, 0.3, 0.6, 1.0)
+brightnessIdx = 1
+overridePayload = None # sent instead of the face's payload
+overrideFace = 0 # the face it was set on
+
 
 ### Private functions
 def getDownwardFaceIndex():
+    if useIntegerFaces:
+        readAccelCounts()
+        return faceFilter.add(accelCounts[0], accelCounts[1], accelCounts[2])
+    
     # Collect sensor updates
-    theta, phi = getAccelTiltAngle() # in degrees
+    if useZeroAlloc:
+        updateTiltAngle()
+        theta, phi = tiltAngle # in degrees
+    else:
+        theta, phi = getAccelTiltAngle() # in degrees
     
     # Determine sides of the platonic cube
     angleCheck = 20
     return getPlatonicCubeFaceIdx(theta, phi, angleCheck)
 
+def angleDiff(start, stop):
+    return ((start-stop)+180)%360 - 180
+
 def getPlatonicCubeFaceIdx(theta, phi, angleCheck):
     # Determine sides of the platonic cube
     faceIdx = 0 # invalid face
-    angleDiff = lambda start, stop : ((start-stop)+180)%360 - 180
     if   abs(angleDiff(theta,  0)) <= angleCheck and abs(angleDiff(phi, 90)) <= angleCheck: # Down
         faceIdx = 1
     elif abs(angleDiff(theta,180)) <= angleCheck and abs(angleDiff(phi, 90)) <= angleCheck: # Up
@@ -139,6 +350,56 @@ def getAccelTiltAngle():
     phi = acos(z / sqrt(x*x + y*y + z*z)) # (0,180)
     return theta*180/pi, phi*180/pi # -> deg
 
+def updateTiltAngle():
+    """
+    Zero-allocation getAccelTiltAngle(), fills tiltAngle
+    """
+    updateAccelRing()
+    x, y, z = smoothedAccel
+    tiltAngle[0] = atan2(y, x)*180/pi
+    tiltAngle[1] = acos(z / sqrt(x*x + y*y + z*z))*180/pi
+
+def updateAccelRing():
+    """
+    Zero-allocation getSmoothedAccel(): reads one sample into the ring &
+    averages it into smoothedAccel
+    """
+    global accelRingIdx
+    readAccelInto(accelRing, accelRingIdx)
+    accelRingIdx = (accelRingIdx + 3) % len(accelRing)
+    for axis in range(3):
+        total = 0.0
+        for idx in range(axis, len(accelRing), 3):
+            total += accelRing[idx]
+        smoothedAccel[axis] = total / numAvgValues
+
+def readAccelCounts():
+    """
+    Burst reads the accelerometer registers into accelCounts (instead of the
+    three transactions & tuples of sensor.acceleration)
+    """
+    accelReader.readInto(accelCounts)
+    if calibration is not None:
+        calibration.apply(accelCounts)
+
+def readAccelInto(values, start):
+    """
+    Stores a reading in m/s^2 in values[start:start+3]
+    """
+    readAccelCounts()
+    for axis in range(3):
+        values[start + axis] = accelCounts[axis] * accelScale
+
+def preallocateAccelRing():
+    # Fill the whole ring, so the first averages are real readings
+    for _ in range(numAvgValues):
+        if useIntegerFaces:
+            readAccelCounts()
+            faceFilter.add(accelCounts[0], accelCounts[1], accelCounts[2])
+        else:
+            updateAccelRing()
+        time.sleep(1.1/40) # wait for the sensor to update
+
 def getSmoothedAccel():
     preallocateAccelList() # first time only, via simply none check
     
@@ -169,14 +430,48 @@ def updateAccelList():
     listAccelZ.append(z)
 
 def getSmoothedFaceIdx():
-    if not all(ele == listFaceIdx[0] for ele in listFaceIdx):
-        return 0 # ALL elements need to be identical to return a valid value
+    if useGyroFaces:
+        return gyroFace
+    if useEarlyCommit:
+        return earlyFace
+    for ele in listFaceIdx:
+        if ele != listFaceIdx[0]:
+            return 0 # ALL elements need to be identical to return a valid value
     return listFaceIdx[0]
 
 def updateFaceIdx():
-    _faceIdx = getDownwardFaceIndex()
-    listFaceIdx.pop(0) # remove an entry (ignore outgoing value)
-    listFaceIdx.append(_faceIdx) # add the new index
+    global faceRingIdx, gyroFace, earlyFace
+    if useEnergyMonitor:
+        energyMonitor.sensorRead()
+    if useGyroFaces:
+        motionReader.readInto(motionCounts)
+        if calibration is not None:
+            calibration.apply(motionCounts) # the accel counts, the first 3
+        face = gyroFilter.add(motionCounts[0], motionCounts[1], motionCounts[2],
+                              motionCounts[3], motionCounts[4], motionCounts[5])
+        gyroFace = gyroDebouncer.add(face, gyroFilter.still)
+    elif useEarlyCommit:
+        earlyFace = faceDebouncer.add(getDownwardFaceIndex(), faceFilter.margin)
+    else:
+        listFaceIdx[faceRingIdx] = getDownwardFaceIndex() # overwrite the oldest entry
+        faceRingIdx = (faceRingIdx + 1) % numAvgValues
+    commitFace(getSmoothedFaceIdx())
+    
+    if useGestures:
+        counts = motionCounts if useGyroFaces else accelCounts
+        handleGesture(gestures.add(counts[0], counts[1], counts[2], getSmoothedFaceIdx()))
+
+def handleGesture(event):
+    global brightnessIdx, overridePayload, overrideFace
+    if event == GESTURE_SHAKE:
+        selectFacePage((facePage + 1) % FACE_PAGES)
+    elif event == GESTURE_TAP:
+        brightnessIdx = (brightnessIdx + 1) % len(brightnessSteps)
+        sendExtra(encodeConfigPatch("brightness", brightnessSteps[brightnessIdx]))
+    elif event == GESTURE_DOUBLE_FLIP:
+        overridePayload = None if overridePayload is not None else methodPayloads[7] # solidOff
+        overrideFace = getSmoothedFaceIdx()
+        postChange()
 
 def preallocateAccelList():
     # Check if there are any none's to replace
@@ -188,56 +483,126 @@ def getSensorAccel():
     x, y, z = sensor.acceleration
     return x, y, z
 
-def anyChanges():
-    global lastFace
-    currentFace = getSmoothedFaceIdx()
-    if currentFace != 0 and currentFace != lastFace:
-        lastFace = currentFace
+def commitFace(face):
+    """
+    Called with the debounced face after every update, posts a change when
+    it's a new valid face
+    """
+    global lastFace, overridePayload
+    if face != 0 and face != lastFace:
+        lastFace = face
+        if face != overrideFace:
+            overridePayload = None
+        if useEnergyMonitor:
+            energyMonitor.flip()
+        postChange()
+
+def selectFacePage(page):
+    global facePage
+    if page != facePage and 0 <= page < FACE_PAGES:
+        facePage = page
+        postChange()
+
+def getPayload():
+    if overridePayload is not None:
+        return overridePayload
+    return facePayloads[facePage][lastFace]
+
+def applyConfigChange(name):
+    """
+    Settings that take effect without a reset, returns True if applied
+    """
+    global facePayloads
+    if name == "facePage":
+        selectFacePage(config.facePage)
+        return True
+    if name == "faceMethods":
+        facePayloads = buildFacePages()
+        postChange() # resend the current face's payload
         return True
     return False
 
-def lookupFaceMethod(faceVal):
-    if   faceVal == 1: # TOP Die Val = '2'
-        return solidRed
-    elif faceVal == 2: # TOP Die Val = '5'
-        return solidYellow
-    elif faceVal == 3: # TOP Die Val = '4'
-        return solidGreen
-    elif faceVal == 4: # TOP Die Val = '3'
-        return solidCyan
-    elif faceVal == 5: # TOP Die Val = '1'
-        return solidBlue
-    elif faceVal == 6: # TOP Die Val = '6'
-        return solidMagenta
-    else:
-        return None
-
-def getPayload():
-    global lastFace
-    faceMethod = lookupFaceMethod(lastFace)
-    if faceMethod is None: return None
-    return faceMethod.toString()
+# Change settings over serial, "remote name=value" patches the receiver's
+configConsole = ConfigConsole(config, microcontroller.nvm, onChange=applyConfigChange,
+                              send=sendExtra)
 
 ###
 # Main LOOP
+if useZeroAlloc:
+    preallocateAccelRing()
+    gc.collect() # start from a clean heap
 print("Starting main loop for Remote Control - Transmit...")
 while True:
+    if useGcMonitor:
+        gcMonitor.loopStart()
+    configConsole.poll() # settings typed into the serial console
+    
     ### Check timers
     # Update FaceIdx
-    if abs(time.monotonic_ns() - timeCheck_faceIdx) > updateTime_faceIdx*1e9:
-        timeCheck_faceIdx = time.monotonic_ns() # reset timer
+    if timerElapsed(timeCheck_faceIdx, updateTime_faceIdx):
+        timeCheck_faceIdx = timerNow() # reset timer
         updateFaceIdx()
     
-    # Check for any face index changes
-    detectedChanges = False
-    if abs(time.monotonic_ns() - timeCheck_changes) > updateTime_changes*1e9:
-        timeCheck_changes = time.monotonic_ns() # reset timer
-        detectedChanges = anyChanges()
+    # Any changes posted since the last pass (committed faces, page switches)
+    detectedChanges = changePosted and lastFace != 0
+    changePosted = False
     
-    # Send an update if any changes or a timeout has been reached
-    if lastFace != 0 and (detectedChanges or abs(time.monotonic_ns() - timeCheck_autosend) > updateTime_autosend*1e9):
-        timeCheck_autosend = time.monotonic_ns() # reset timer
+    # Send an update if any changes or a timeout has been reached (on the
+    # beacon grid: at the next beacon)
+    if useBeaconSchedule:
+        pendingChange = pendingChange or detectedChanges
+        sendDue = beaconClock.due()
+    else:
+        updateTime_send = updateTime_confirm if confirmRetries else updateTime_autosend
+        pendingChange = detectedChanges
+        sendDue = detectedChanges or timerElapsed(timeCheck_autosend, updateTime_send)
+    if lastFace != 0 and sendDue:
+        timeCheck_autosend = timerNow() # reset timer
+        changed, pendingChange = pendingChange, False
         curPayload = getPayload()
         if curPayload is not None:
-            sendPayload(nrf, getPayload(), debugPrint=False)
-    
\ No newline at end of file
+            if useEnergyMonitor:
+                energyMonitor.radioStart()
+            radioGate.wake()
+            txAttempts = 0
+            needsSend = True
+            if useAckEcho and not changed:
+                # Only resend if the receiver isn't already showing this state
+                echo.expect(curPayload)
+                needsSend = not echo.probe()
+                txAttempts += 1 + nrf.last_tx_arc
+                if useDeltaSend and echo.lastSendOk:
+                    deltaEncoder.confirm(curPayload, not needsSend)
+                if useChannelScan and hopper.recordSend(echo.lastSendOk) and hopper.channel == DEFAULT_CHANNEL:
+                    announceHopSequence(nrf, hopper, hopChannels, send=sendFramed) # back at the rendezvous, re-announce
+                if useLinkTuner:
+                    tuner.record(echo.lastSendOk) # retries read from nrf.last_tx_arc
+                confirmRetries = confirmRetries - 1 if needsSend and confirmRetries else 0
+            elif useAckEcho:
+                confirmRetries = maxConfirmRetries # confirm the change shortly
+            if needsSend and framedSender is not None:
+                framedSender.send(curPayload)
+            elif needsSend:
+                sendPayload(nrf, deltaEncoder.encode(curPayload) if useDeltaSend else curPayload, debugPrint=False)
+            if needsSend:
+                txAttempts += 1 + nrf.last_tx_arc # the last packet's, multi-packet payloads count as one
+            while extraPayloads: # while the receiver's listen window is open
+                sendFramed(nrf, extraPayloads.pop(0))
+                txAttempts += 1 + nrf.last_tx_arc
+            radioGate.sleep()
+            if useEnergyMonitor:
+                energyMonitor.radioStop(txAttempts)
+            if useZeroAlloc:
+                gc.collect() # clean up after the radio while we're off the hot path anyway
+    
+    # Energy report
+    if useEnergyMonitor:
+        energyReport = energyMonitor.update()
+        if energyReport is not None:
+            print("Energy: {}".format(energyReport))
+            print("Radio: {}".format(radioGate.report()))
+            if sendTelemetry:
+                sendExtra(encodeTelemetry(energyReport))
+    
+    if useGcMonitor:
+        gcMonitor.loopEnd()
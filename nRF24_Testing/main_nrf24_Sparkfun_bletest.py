@@ -3,7 +3,7 @@
 #
 # nm3210@gmail.com
 # Date Created:  April 17th, 2021
-# Last Modified: April 17th, 2021
+# Last Modified: October 19th, 2026
 
 # Import modules
 import board, digitalio, struct, time # circuitpython built-ins
@@ -14,6 +14,7 @@ from circuitpython_nrf24l01.fake_ble import (
     BatteryServiceData,
     TemperatureServiceData,
 )
+from lib.BleBeacon import AdvertisingScheduler, remoteStateData, MANUFACTURER_DATA # from nRF24_RemoteControl/lib
 print("Finished importing modules")
 
 # Initialize nRF24L01
@@ -65,15 +66,14 @@ def master(count=50):
             "available bytes in next payload:",
             ble.len_available(chunk(battery_service.buffer)),
         )  # using chunk() gives an accurate estimate of available bytes
+        # broadcast the device name, MAC address, & battery charge info as
+        # service data, built once (it raises if it doesn't fit)
+        scheduler = AdvertisingScheduler(ble)
+        scheduler.add(battery_service)
         for i in range(count):  # advertise data this many times
-            if ble.len_available(chunk(battery_service.buffer)) >= 0:
-                _prompt(count - i)  # something to show that it isn't frozen
-                # broadcast the device name, MAC address, &
-                # battery charge info; 0x16 means service data
-                ble.advertise(battery_service.buffer, data_type=0x16)
-                # channel hoping is recommended per BLE specs
-                ble.hop_channel()
-                time.sleep(0.5)  # wait till next broadcast
+            _prompt(count - i)  # something to show that it isn't frozen
+            scheduler.advertise()  # on all three advertising channels
+            time.sleep(0.5)  # wait till next broadcast
     # nrf.show_pa_level & nrf.name both are set to false when
     # exiting a with statement block
 
@@ -92,13 +92,13 @@ def send_temp(count=50):
             "available bytes in next payload:",
             ble.len_available(chunk(temperature_service.buffer)),
         )
+        # broadcast a temperature measurement as service data
+        scheduler = AdvertisingScheduler(ble)
+        scheduler.add(temperature_service)
         for i in range(count):
-            if ble.len_available(chunk(temperature_service.buffer)) >= 0:
-                _prompt(count - i)
-                # broadcast a temperature measurement; 0x16 means service data
-                ble.advertise(temperature_service.buffer, data_type=0x16)
-                ble.hop_channel()
-                time.sleep(0.2)
+            _prompt(count - i)
+            scheduler.advertise()
+            time.sleep(0.2)
 
 
 # use the Eddystone protocol from Google to broadcast a URL as
@@ -120,13 +120,31 @@ def send_url(count=50):
             ble.len_available(chunk(url_service.buffer)),
         )
         # NOTE we did NOT set a device name in this with block
+        # URLs easily exceed the nRF24L01's max payload length
+        if ble.len_available(chunk(url_service.buffer)) < 0:
+            print("URL doesn't fit in a payload")
+            return
+        scheduler = AdvertisingScheduler(ble)
+        scheduler.add(url_service)
         for i in range(count):
-            # URLs easily exceed the nRF24L01's max payload length
-            if ble.len_available(chunk(url_service.buffer)) >= 0:
-                _prompt(count - i)
-                ble.advertise(url_service.buffer, 0x16)
-                ble.hop_channel()
-                time.sleep(0.2)
+            _prompt(count - i)
+            scheduler.advertise()
+            time.sleep(0.2)
+
+
+def send_remote(count=60):
+    """Sends out the remote's state & battery level, taking turns."""
+    with nrf as ble:
+        # no name, both services have to fit next to the flags & MAC address
+        scheduler = AdvertisingScheduler(ble)
+        battery = scheduler.add(battery_service)
+        state = scheduler.add(remoteStateData(1, battery=battery_service.data), MANUFACTURER_DATA)
+        for i in range(count):
+            _prompt(count - i)
+            if i % 10 == 0:  # pretend the cube was flipped, only its buffers are rebuilt
+                scheduler.setData(state, remoteStateData(i // 10 % 6 + 1, battery=battery_service.data))
+            scheduler.advertise()  # the services alternate
+            time.sleep(0.1)
 
 
 def set_role():
@@ -143,6 +161,7 @@ def set_role():
             " charge.\n"
             "*** Enter 'T' to broadcast the device name & a temperature\n"
             "*** Enter 'U' to broadcast a custom URL link\n"
+            "*** Enter 'R' to broadcast the remote's state & battery charge\n"
             "*** Enter 'Q' to quit example.\n"
         )
         or "?"
@@ -166,6 +185,12 @@ def set_role():
         else:
             send_url()
         return True
+    if user_input[0].upper().startswith("R"):
+        if len(user_input) > 1:
+            send_remote(int(user_input[1]))
+        else:
+            send_remote()
+        return True
     if user_input[0].upper().startswith("Q"):
         nrf.power = False
         return False
@@ -186,5 +211,6 @@ else:
     print(
         "    Run master() to broadcast the device name, pa_level, & battery "
         "charge\n    Run send_temp() to broadcast the device name & a "
-        "temperature\n    Run send_url() to broadcast a custom URL link"
+        "temperature\n    Run send_url() to broadcast a custom URL link\n"
+        "    Run send_remote() to broadcast the remote's state & battery charge"
     )
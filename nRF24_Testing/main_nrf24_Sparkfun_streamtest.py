@@ -3,7 +3,7 @@
 #
 # nm3210@gmail.com
 # Date Created:  April 17th, 2021
-# Last Modified: April 17th, 2021
+# Last Modified: October 19th, 2026
 
 # Import modules
 import board, digitalio, struct, time # circuitpython built-ins
@@ -44,23 +44,120 @@ nrf.open_rx_pipe(1, address[not radio_number])  # using pipe 1
 
 
 def make_buffers(size=32):
-    """return a list of payloads"""
+    """return a list of payloads
+
+    All payloads live in a single preallocated `bytearray`; the returned list
+    holds `memoryview` slices into it, so nothing is copied or concatenated.
+    """
+    pool = bytearray(size * size)  # every payload back-to-back
+    view = memoryview(pool)
     buffers = []
+    half = (size - 1) / 2
     # we'll use `size` for the number of payloads in the list and the
     # payloads' length
     for i in range(size):
+        start = i * size
         # prefix payload with a sequential letter to indicate which
         # payloads were lost (if any)
-        buff = bytes([i + (65 if 0 <= i < 26 else 71)])
+        pool[start] = i + (65 if 0 <= i < 26 else 71)
+        # the pattern is '1's outside of [half - dist, half + dist) else '0's
+        dist = abs(half - i)
         for j in range(size - 1):
-            char = j >= (size - 1) / 2 + abs((size - 1) / 2 - i)
-            char |= j < (size - 1) / 2 - abs((size - 1) / 2 - i)
-            buff += bytes([char + 48])
-        buffers.append(buff)
-        del buff
+            pool[start + 1 + j] = 49 if (j >= half + dist or j < half - dist) else 48
+        buffers.append(view[start : start + size])
     return buffers
 
 
+def decode_sequence(buffer):
+    """return the payload index encoded in the leading sequence letter"""
+    letter = buffer[0]
+    return letter - (65 if letter < 91 else 71)
+
+
+class StreamAnalyzer:
+    """Tallies loss, gaps, duplicates & reordering for `make_buffers()` streams.
+
+    The transmitter sends indexes 0 through `size - 1`, `count` times over. A
+    drop in index larger than half of `size` is treated as the start of a new
+    round rather than a reordered payload.
+    """
+
+    def __init__(self, size=32):
+        self.size = size
+        self.seen = bytearray(size)  # per-round bitmap of received indexes
+        self.rounds = 0
+        self.received = 0
+        self.duplicates = 0
+        self.reordered = 0
+        self.lost = 0
+        self.gaps = 0
+        self.num_bytes = 0
+        self.last_seq = -1
+        self.first_ns = 0
+        self.last_ns = 0
+
+    def _close_round(self):
+        # count missing indexes & contiguous runs of them (gaps)
+        in_gap = False
+        for i in range(self.size):
+            if self.seen[i]:
+                in_gap = False
+                self.seen[i] = 0
+            else:
+                self.lost += 1
+                if not in_gap:
+                    self.gaps += 1
+                in_gap = True
+
+    def add(self, buffer, timestamp_ns):
+        """record a received payload & the time it was read"""
+        seq = decode_sequence(buffer)
+        if not 0 <= seq < self.size:
+            return  # not part of this stream
+        if self.rounds == 0:
+            self.rounds = 1
+            self.first_ns = timestamp_ns
+        elif seq < self.last_seq - self.size // 2:
+            self._close_round()  # wrapped around to the next round
+            self.rounds += 1
+        elif seq < self.last_seq:
+            self.reordered += 1
+        if self.seen[seq]:
+            self.duplicates += 1
+        self.seen[seq] = 1
+        self.received += 1
+        self.num_bytes += len(buffer)
+        self.last_seq = seq
+        self.last_ns = timestamp_ns
+
+    def report(self):
+        """close out the current round & print the results"""
+        if not self.rounds:
+            print("No stream payloads received")
+            return
+        self._close_round()
+        expected = self.rounds * self.size
+        elapsed = (self.last_ns - self.first_ns) / 1e9
+        print(
+            "Received {}/{} payloads over {} round(s): {} lost in {} gap(s), "
+            "{} duplicate(s), {} reordered".format(
+                self.received - self.duplicates,
+                expected,
+                self.rounds,
+                self.lost,
+                self.gaps,
+                self.duplicates,
+                self.reordered,
+            )
+        )
+        if elapsed > 0:
+            print(
+                "Effective throughput: {:.0f} bytes/s ({:.1f} payloads/s)".format(
+                    self.num_bytes / elapsed, self.received / elapsed
+                )
+            )
+
+
 def master(count=1, size=32):  # count = 5 will transmit the list 5 times
     """Transmits multiple payloads using `RF24.send()` and `RF24.resend()`."""
     buffers = make_buffers(size)  # make a list of payloads
@@ -136,9 +233,10 @@ def master_fifo(count=1, size=32):
             print("You Win!")
 
 
-def slave(timeout=5):
+def slave(timeout=5, size=32):
     """Stops listening after a `timeout` with no response"""
     nrf.listen = True  # put radio into RX mode and power up
+    analyzer = StreamAnalyzer(size)  # tally losses against the known stream
     count = 0  # keep track of the number of received payloads
     start_timer = time.monotonic()  # start timer
     while time.monotonic() < start_timer + timeout:
@@ -146,16 +244,18 @@ def slave(timeout=5):
             count += 1
             # retreive the received packet's payload
             buffer = nrf.read()  # clears flags & empties RX FIFO
+            analyzer.add(buffer, time.monotonic_ns())
             print("Received: {} - {}".format(buffer, count))
             start_timer = time.monotonic()  # reset timer on every RX payload
 
     # recommended behavior is to keep in TX mode while idle
     nrf.listen = False  # put the nRF24L01 is in TX mode
+    analyzer.report()
 
 
 def set_role():
-    """Set the role using stdin stream. Timeout arg for slave() can be
-    specified using a space delimiter (e.g. 'R 10' calls `slave(10)`)
+    """Set the role using stdin stream. Timeout & size args for slave() can be
+    specified using a space delimiter (e.g. 'R 10 32' calls `slave(10, 32)`)
 
     :return:
         - True when role is complete & app should continue running.
@@ -174,7 +274,9 @@ def set_role():
     )
     user_input = user_input.split()
     if user_input[0].upper().startswith("R"):
-        if len(user_input) > 1:
+        if len(user_input) > 2:
+            slave(int(user_input[1]), int(user_input[2]))
+        elif len(user_input) > 1:
             slave(int(user_input[1]))
         else:
             slave()